@@ -1,9 +1,46 @@
+import importlib
+import typing
+
 from ._api import assert_that
 from ._api import asserto
+from ._api import parallel
+from ._api import plan
+from ._api import pool
 from ._api import register_assert
+from ._api import spec
 from ._asserto import Asserto
-from ._exceptions import UnsupportedHandlerTypeError
-from ._warnings import NoAssertAttemptedWarning
+from ._modes import get_mode
+from ._modes import set_mode
+
+if typing.TYPE_CHECKING:
+    from ._deferred import DeferredChecker
+    from ._deferred import DeferredFailure
+    from ._deferred import get_deferred_checker
+    from ._exceptions import UnsupportedHandlerTypeError
+    from ._instrumentation import Profiler
+    from ._instrumentation import get_profiler
+    from ._patterns import pattern_cache_info
+    from ._patterns import precompile
+    from ._rendering import RenderLimits
+    from ._rendering import get_render_limits
+    from ._rendering import set_render_limits
+    from ._warnings import NoAssertAttemptedWarning
+
+# Everything beyond the entrypoints is imported on first use, keeping `import asserto` fast.
+_LAZY_ATTRIBUTES = {
+    "NoAssertAttemptedWarning": "._warnings",
+    "UnsupportedHandlerTypeError": "._exceptions",
+    "RenderLimits": "._rendering",
+    "get_render_limits": "._rendering",
+    "set_render_limits": "._rendering",
+    "precompile": "._patterns",
+    "pattern_cache_info": "._patterns",
+    "Profiler": "._instrumentation",
+    "get_profiler": "._instrumentation",
+    "DeferredChecker": "._deferred",
+    "DeferredFailure": "._deferred",
+    "get_deferred_checker": "._deferred",
+}
 
 __all__ = (
     "asserto",
@@ -12,4 +49,33 @@ __all__ = (
     "NoAssertAttemptedWarning",
     "UnsupportedHandlerTypeError",
     "assert_that",
+    "RenderLimits",
+    "get_render_limits",
+    "set_render_limits",
+    "precompile",
+    "pattern_cache_info",
+    "plan",
+    "spec",
+    "parallel",
+    "pool",
+    "Profiler",
+    "get_profiler",
+    "set_mode",
+    "get_mode",
+    "DeferredChecker",
+    "DeferredFailure",
+    "get_deferred_checker",
 )
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    attribute = globals()[name] = getattr(importlib.import_module(module, __name__), name)
+    return attribute
+
+
+def __dir__() -> typing.List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -1,20 +1,97 @@
 import types
 import typing
 
+from . import _modes
+from . import _pool
 from ._asserto import Asserto
 from ._decorators import update_triggered
+from ._dispatch import asserter_for
+
+if typing.TYPE_CHECKING:
+    from ._parallel import REPORT_ALIAS
+    from ._plan import Plan
+    from ._spec import Spec
 
 
 def asserto(actual: typing.Any, warn_unused: bool = False) -> Asserto:
     """
-    Retrieve an appropriate asserter for the type of value.
+    Retrieve an appropriate asserter for the type of value; numbers, strings, bytes and other collections
+    have asserters specialized for their category.  Unless the global mode (see `set_mode`)
+    is `full`, a shared no-op asserter may be returned instead, skipping the chain of assertions.
+    Inside of a `pool()` the instance is drawn from the pool, see `Pool`.
     :param actual: The value to compare against later and defer a type specific asserter from.
     :param warn_unused: Emit a warning if not a single assertion was performed to detect user errors.
     :return: An instance of an asserter
     """
-    return Asserto(actual, warn_unused)
+    if _modes.skip is not None and _modes.skip():
+        return _modes.NOOP  # type: ignore[return-value]
+    if _pool.local is not None:
+        pool = getattr(_pool.local, "pool", None)
+        if pool is not None:
+            return pool(actual, warn_unused)
+    return asserter_for(actual)(actual, warn_unused)
+
+
+def pool(size: int = 4) -> _pool.Pool:
+    """
+    Reuse `Asserto` instances for hot loops; while the returned pool is entered, `asserto()` rebinds
+    the instances handed out in previous scopes of the pool rather than allocating.  Also available
+    as `asserto.pool()`.
+    :param size: The maximum number of instances kept for nested assertions.
+    :return: The `Pool`, to enter (`with pool:`) around each iteration on the current thread.
+    """
+    return _pool.Pool(size)
+
+
+def plan() -> "Plan":
+    """
+    Start a reusable assertion plan; chain assertions from it to compile them once, then check
+    many values against it.  Also available as `asserto.plan()`.
+    :return: An empty `Plan` for fluency.
+    """
+    from ._plan import Plan
+
+    return Plan()
+
+
+def spec(**fields: typing.Any) -> "Spec":
+    """
+    Describe the fields of records with assertion plans (or expected values), to validate batches of
+    mappings, named tuples or objects against.  Also available as `asserto.spec()`.
+    :param fields: The plan (or expected value) of each field, by name.
+    :return: The compiled `Spec`.
+    """
+    from ._spec import Spec
+
+    return Spec(**fields)
+
+
+def parallel(
+    values: typing.Iterable[typing.Any],
+    check: typing.Any,
+    chunk_size: int = 10_000,
+    workers: typing.Optional[int] = None,
+    max_failures: int = 10,
+) -> "REPORT_ALIAS":
+    """
+    Check values against a plan, spec or assertion function across a pool of processes, with the
+    failures merged into a single report in input order.  Also available as `asserto.parallel()`.
+    :param values: The values to check, any iterable.
+    :param check: A `Plan`, `Spec` or (picklable) function called with an `Asserto` of each value.
+    :param chunk_size: The number of values sent to a worker at a time.
+    :param workers: The number of worker processes, defaults to the number of processors.
+    :param max_failures: The maximum number of failing values retained in the report.
+    :return: The report of the check.
+    """
+    from ._parallel import parallel as _parallel
+
+    return _parallel(values, check, chunk_size=chunk_size, workers=workers, max_failures=max_failures)
 
 
+asserto.plan = plan  # type: ignore[attr-defined]
+asserto.spec = spec  # type: ignore[attr-defined]
+asserto.parallel = parallel  # type: ignore[attr-defined]
+asserto.pool = pool  # type: ignore[attr-defined]
 assert_that = asserto
 
 
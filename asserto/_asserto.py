@@ -1,26 +1,41 @@
 from __future__ import annotations
 
+import collections.abc
 import types
 import typing
 import warnings
 
 from ._const import Methods
+from ._dispatch import resolve
 from ._error_handling import ErrorHandler
 from ._error_handling import RaisesErrors
-from ._exc_handling import ExceptionChecker
-from ._exceptions import DynamicCallableWithArgsError
-from ._exceptions import UnsupportedHandlerTypeError
+from ._lookups import lookup
+from ._rendering import FailureMessage
+from ._rendering import RenderLimits
+from ._rendering import bind_limits
+from ._rendering import get_render_limits
+from ._types import BYTES_LIKE
+from ._types import BYTES_LIKE_ALIAS
 from ._types import EXC_TYPES_ALIAS
 from ._types import RE_FLAGS_ALIAS
 from ._types import RE_PATTERN_ALIAS
-from ._util import is_namedtuple_like
 from ._warnings import NoAssertAttemptedWarning
-from .handlers import BaseHandler
+from . import _instrumentation
+from . import handlers
 from .handlers import Handler
-from .handlers import NumberHandler
-from .handlers import RegexHandler
 from .mixins import AssertsStringsMixin
 
+if typing.TYPE_CHECKING:
+    from ._deferred import Deferred
+    from ._deferred import DeferredChecker
+    from ._elementwise import Elementwise
+    from ._eventually import AsyncEventually
+    from ._eventually import Eventually
+    from ._exc_handling import ExceptionChecker
+
+# Bytes like values are asserted by the `BytesHandler` where their assertions differ from those of other values.
+_BYTES_LIKE = frozenset(BYTES_LIKE)
+
 # Todo: base: `tidy up docstrings`
 # Todo: base `remove duplication here`
 # Todo: Api feels cumbersome with decorators; can we improve DRY-ness?
@@ -33,21 +48,41 @@ class Asserto(AssertsStringsMixin):
 
     :param actual: ...
     :param warn_unused: ...
+    :param render_limits: (Optional) Limits for rendering values into failure messages, overriding the global limits.
     """
 
+    # Instances are created for every assertion; keep them compact.  The error handler and handler
+    # instances are only created once an instance fails, enters a soft context or dispatches.
+    __slots__ = (
+        "_actual",
+        "_triggered",
+        "warn_unused",
+        "_error_handler_type",
+        "_error_handler",
+        "category",
+        "description",
+        "render_limits",
+        "_handlers",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         actual: typing.Any,
         warn_unused: bool = False,
         error_handler: typing.Type[RaisesErrors] = ErrorHandler,
+        render_limits: typing.Optional[RenderLimits] = None,
     ):
         self._actual = actual
         self._triggered = False
         self.warn_unused = warn_unused
-        self._in_context = False
-        self._error_handler = error_handler()
+        self._error_handler_type = error_handler
+        self._error_handler: typing.Optional[RaisesErrors] = None
         self.category: typing.Optional[str] = None
         self.description: typing.Optional[str] = None
+        self.render_limits = render_limits
+        # Validated handler instances for the current actual value, reused across a fluent chain.
+        self._handlers: typing.Optional[typing.Dict[typing.Type[Handler], Handler]] = None
 
     @property
     def actual(self) -> typing.Any:
@@ -56,15 +91,58 @@ class Asserto(AssertsStringsMixin):
     @actual.setter
     def actual(self, value: typing.Any) -> None:
         self._actual = value
+        self._handlers = None
+
+    def rebind(self, actual: typing.Any, warn_unused: bool = False) -> Asserto:
+        """
+        Reuse the instance for another value, resetting every per-value setting (category, description,
+        render limits & soft limits) in constant time, for example in hot loops:
+
+            Example:
+                Usage::
+                    a = asserto(None)
+                    for value in values:
+                        a.rebind(value).is_positive()
+
+        Handler instances are kept (and rebound) while the type of the values does not change.
+        :param actual: The value to compare against.
+        :param warn_unused: Emit a warning if not a single assertion was performed to detect user errors.
+        :return: The `Asserto` instance for fluency.
+        """
+        if self._error_handler is not None:
+            if self._error_handler.softly:
+                raise ValueError("an instance cannot be rebound inside of its soft context.")
+            self._error_handler = None
+        previous_type, new_type = type(self._actual), type(actual)
+        if new_type is not previous_type:
+            self._handlers = None
+        self._actual = actual
+        self._triggered = False
+        self.warn_unused = warn_unused
+        self.category = None
+        self.description = None
+        self.render_limits = None
+        return self
 
-    def error(self, cause: typing.Union[AssertionError, str]) -> Asserto:
+    @property
+    def error_handler(self) -> RaisesErrors:
+        """The error handler, created on first use."""
+        if self._error_handler is None:
+            self._error_handler = self._error_handler_type()
+        return self._error_handler
+
+    def error(self, cause: typing.Union[AssertionError, FailureMessage, str]) -> Asserto:
         """
         The single point of assertion failing.  All functions delegate here to raise the underlying
         assertion errors.
         :param cause: A reason for the failure. if description was set; it takes precedence.
         :return: The `Asserto` instance for fluency
         """
-        self._error_handler.check_should_raise(self._in_context, cause, self.category, self.description)
+        if self.render_limits is not None:
+            bind_limits(cause, self.render_limits)
+        if _instrumentation.profiler is not None:
+            _instrumentation.profiler.failed()
+        self.error_handler.check_should_raise(cause, description=self.description, category=self.category)
         return self
 
     def set_category(self, category: str) -> Asserto:
@@ -82,6 +160,38 @@ class Asserto(AssertsStringsMixin):
         self.category = category
         return self
 
+    def set_soft_limits(
+        self,
+        max_stored: typing.Optional[int] = None,
+        fail_after: typing.Optional[int] = None,
+        group_identical: bool = False,
+    ) -> Asserto:
+        """
+        Configure the collection of failures for `soft` contexts, for example:
+
+            Example:
+                Usage::
+                    with asserto(x).set_soft_limits(max_stored=100, fail_after=1000) as soft:
+                        ...
+
+        :param max_stored: (Optional) The maximum number of failures to retain, further failures are only counted.
+        :param fail_after: (Optional) Fail the soft context early, once this many failures have occurred.
+        :param group_identical: Group failures with identical messages, displaying their number of occurrences.
+        :return: The `Asserto` instance for fluency.
+        """
+        self.error_handler.configure_soft(max_stored, fail_after, group_identical)
+        return self
+
+    def with_render_limits(self, limits: RenderLimits) -> Asserto:
+        """
+        Set the limits used to render values into failure messages for this instance, taking
+        precedence over the global limits.
+        :param limits: The `RenderLimits` to apply.
+        :return: The `Asserto` instance for fluency.
+        """
+        self.render_limits = limits
+        return self
+
     def described_as(self, description: str) -> Asserto:
         """
         Set the full `AssertionError`` message to a custom reason.  If this is
@@ -99,16 +209,110 @@ class Asserto(AssertsStringsMixin):
         :param match: An optional message to enforce against when the function is called later.
         :return: The `Asserto` instance for fluency
         """
+        from ._exc_handling import ExceptionChecker
+
         return ExceptionChecker(exc_types=exceptions, value=self.actual, _referent=self, match=match)
 
     # Todo: should_not_raise
 
+    def eventually(
+        self,
+        timeout: float = 5.0,
+        interval: float = 0.05,
+        backoff: float = 2.0,
+        max_interval: float = 1.0,
+        jitter: float = 0.0,
+    ) -> Eventually:
+        """
+        Switch to polling mode; the actual value must be a callable which is re-evaluated (on an
+        exponential backoff schedule) until the assertions chained from here pass against its result.
+
+            Example:
+                Usage::
+                    asserto(lambda: fetch()).eventually(timeout=5).is_equal_to(200)
+
+        On success the result becomes the actual value, on timeout the last failure is raised
+        alongside the number of attempts.
+        :param timeout: The time (in seconds) after which polling stops and the last failure is raised.
+        :param interval: The delay (in seconds) after the first failed attempt.
+        :param backoff: The factor the delay is multiplied by after every failed attempt.
+        :param max_interval: The upper bound of the delay between attempts.
+        :param jitter: A fraction of every delay to randomly add or subtract.
+        :return: An `Eventually` instance for fluency.
+        """
+        from ._eventually import Eventually
+        from ._eventually import Schedule
+
+        return Eventually(self, timeout, Schedule(interval, backoff, max_interval, jitter))
+
+    def eventually_async(
+        self,
+        timeout: float = 5.0,
+        interval: float = 0.05,
+        backoff: float = 2.0,
+        max_interval: float = 1.0,
+        jitter: float = 0.0,
+    ) -> AsyncEventually:
+        """
+        The asyncio equivalent of `eventually`; the actual value may also be a coroutine function.
+        The chained assertions are polled when awaited, delays are awaited on the running event loop.
+
+            Example:
+                Usage::
+                    await asserto(client.fetch).eventually_async(timeout=5).is_equal_to(200)
+
+        :param timeout: The time (in seconds) after which polling stops and the last failure is raised.
+        :param interval: The delay (in seconds) after the first failed attempt.
+        :param backoff: The factor the delay is multiplied by after every failed attempt.
+        :param max_interval: The upper bound of the delay between attempts.
+        :param jitter: A fraction of every delay to randomly add or subtract.
+        :return: An awaitable `AsyncEventually` instance for fluency.
+        """
+        from ._eventually import AsyncEventually
+        from ._eventually import Schedule
+
+        return AsyncEventually(self, timeout, Schedule(interval, backoff, max_interval, jitter))
+
+    def each(self, report: int = 10) -> Elementwise:
+        """
+        Switch to elementwise mode; numeric assertions chained from here are applied to every element
+        of the actual value (a sequence, iterable, buffer or NumPy array) in a single pass.  Buffers and
+        arrays are only vectorized when NumPy is installed, otherwise their elements are checked in python.
+
+            Example:
+                Usage::
+                    asserto(readings).each().is_between(0, 100)
+
+        :param report: The maximum number of offending indices and values to report on failure.
+        :return: An `Elementwise` instance for fluency.
+        """
+        from ._elementwise import Elementwise
+
+        return Elementwise(self, report)
+
+    def deferred(self, checker: typing.Optional[DeferredChecker] = None) -> Deferred:
+        """
+        Switch to deferred mode; assertions chained from here are recorded and, once submitted, performed
+        by a background worker thread.  Failures are reported to the failure sink of the checker (logged
+        by default) rather than raised.
+
+            Example:
+                Usage::
+                    asserto(order).deferred().is_instance(Order).is_valid_is(True).submit()
+
+        :param checker: The `DeferredChecker` performing the assertions, the default checker if omitted.
+        :return: A `Deferred` instance for fluency.
+        """
+        from ._deferred import Deferred
+
+        return Deferred(self, checker)
+
     def is_between(self, low: float, high: float, inclusive: bool = False):
         """
         Asserts that the actual value is between a low and high bounds.  If inclusive is true
         the actual value is considered between if it is equal to either of those bounds.
         """
-        return self._dispatch(NumberHandler, Methods.IS_BETWEEN, low, high, inclusive)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_BETWEEN, low, high, inclusive)
 
     def is_between_inclusive(self, low: float, high: float) -> Asserto:
         """
@@ -124,7 +328,7 @@ class Asserto(AssertsStringsMixin):
         the actual value is only considered not between if it is strictly less than the low bounds and higher than
         the high bounds, if it equals either it is considered to be between.
         """
-        return self._dispatch(NumberHandler, Methods.IS_NOT_BETWEEN, low, high, inclusive)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_NOT_BETWEEN, low, high, inclusive)
 
     def is_not_between_inclusive(self, low: float, high: float):
         """
@@ -144,7 +348,7 @@ class Asserto(AssertsStringsMixin):
         :param pattern: The regular expression pattern to use; r"" is encouraged.
         :param flags: An integer (or RegexFlag) representing flags to apply.
         """
-        return self._dispatch(RegexHandler, Methods.MATCH, pattern, flags)
+        return self._dispatch(handlers.RegexHandler, Methods.MATCH, pattern, flags)
 
     def search(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
         """
@@ -154,7 +358,7 @@ class Asserto(AssertsStringsMixin):
         :param pattern: The regular expression pattern to use; r"" is encouraged.
         :param flags: An integer (or RegexFlag) representing flags to apply.
         """
-        return self._dispatch(RegexHandler, Methods.SEARCH, pattern, flags)
+        return self._dispatch(handlers.RegexHandler, Methods.SEARCH, pattern, flags)
 
     def fullmatch(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
         """
@@ -164,7 +368,7 @@ class Asserto(AssertsStringsMixin):
         :param pattern: The regular expression pattern to use; r"" is encouraged.
         :param flags: An integer (or RegexFlag) representing flags to apply.
         """
-        return self._dispatch(RegexHandler, Methods.FULLMATCH, pattern, flags)
+        return self._dispatch(handlers.RegexHandler, Methods.FULLMATCH, pattern, flags)
 
     def findall(self, pattern: RE_PATTERN_ALIAS, count: int, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
         """
@@ -174,44 +378,59 @@ class Asserto(AssertsStringsMixin):
         :param count: The expected number of elements expected in the fullmatch returned sequence.
         :param flags: An integer (or RegexFlag) representing flags to apply.
         """
-        return self._dispatch(RegexHandler, Methods.FINDALL, pattern, count, flags)
+        return self._dispatch(handlers.RegexHandler, Methods.FINDALL, pattern, count, flags)
+
+    def has_slice(self, start: typing.Optional[int], stop: typing.Optional[int], expected: BYTES_LIKE_ALIAS) -> Asserto:
+        """
+        Asserts that the bytes of a bytes like value between `start` and `stop` (as for slicing them) are equal
+        to expected, without copying the value or the slice of it.
+
+        :param start: The start of the slice, None for the start of the value.
+        :param stop: The stop of the slice, None for the end of the value.
+        :param expected: The expected bytes, a bytes like value.
+        :return: The instance of `Asserto` to chain asserts.
+        """
+        return self._dispatch(handlers.BytesHandler, Methods.HAS_SLICE, start, stop, expected)
 
     def is_true(self) -> Asserto:
         """
         Asserts that the actual value is explicitly True.  This uses identity checks internally, to
         check if a value is considered `truthy` use `is_truthy()` instead.
         """
-        return self._dispatch(BaseHandler, Methods.IS_TRUE)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_TRUE)
 
     def is_truthy(self) -> Asserto:
         """
         Asserts that the actual value is True in a boolean context.  bool(actual) is called internally
         and the outcome is asserted to be `True`.
         """
-        return self._dispatch(BaseHandler, Methods.IS_TRUTHY)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_TRUTHY)
 
     def is_false(self) -> Asserto:
         """
         Asserts that the actual value is explicitly False.  This uses identity checks internally, to
         check if a value is considered `falsy` use `is_falsy()` instead.
         """
-        return self._dispatch(BaseHandler, Methods.IS_FALSE)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_FALSE)
 
     def is_falsy(self) -> Asserto:
         """
         Asserts that the actual value is False in a boolean context.  bool(actual) is called internally
         and the outcome is asserted to be `False`.
         """
-        return self._dispatch(BaseHandler, Methods.IS_FALSY)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_FALSY)
 
     def is_equal_to(self, other: typing.Any) -> Asserto:
         """
-        Compares the value against `other` for equality.
+        Compares the value against `other` for equality.  Bytes like values are compared without copying
+        them and failures report the offset at which they first differ.
 
         :param other: The other object to compare against.
         :return: The instance of `Asserto` to chain asserts.
         """
-        return self._dispatch(BaseHandler, Methods.IS_EQUAL_TO, other)
+        if type(self._actual) in _BYTES_LIKE:
+            return self._dispatch(handlers.BytesHandler, Methods.IS_EQUAL_TO, other)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_EQUAL_TO, other)
 
     equals = is_equal_to
 
@@ -222,16 +441,52 @@ class Asserto(AssertsStringsMixin):
         :param other: The other object to compare against.
         :return: The instance of `Asserto` to chain asserts.
         """
-        return self._dispatch(BaseHandler, Methods.IS_NOT_EQUAL_TO, other)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_NOT_EQUAL_TO, other)
 
     def has_length(self, expected: int) -> Asserto:
         """
-        A simple check that the actual value is equal to expected utilising the built in `len(...)`
+        A simple check that the actual value is equal to expected utilising the built in `len(...)`.
+        Iterators (which have no length) are streamed instead, stopping as soon as the count exceeds
+        expected.
 
         :param expected: An int to compare the length against.
         :return: The instance of `Asserto` to chain asserts.
         """
-        return self._dispatch(BaseHandler, Methods.HAS_LENGTH, expected)
+        if isinstance(self.actual, collections.abc.Iterator) and not hasattr(self.actual, "__len__"):
+            return self._dispatch(handlers.IterableHandler, Methods.HAS_LENGTH, expected)
+        return self._dispatch(handlers.BaseHandler, Methods.HAS_LENGTH, expected)
+
+    def is_empty(self) -> Asserto:
+        """
+        Checks the actual value has no elements.  Iterators are peeked, consuming at most one element.
+        :return: The instance of `Asserto` to chain asserts.
+        """
+        return self._dispatch(handlers.IterableHandler, Methods.IS_EMPTY)
+
+    def is_not_empty(self) -> Asserto:
+        """
+        Checks the actual value has at least one element.  Iterators are peeked, consuming at most one element.
+        :return: The instance of `Asserto` to chain asserts.
+        """
+        return self._dispatch(handlers.IterableHandler, Methods.IS_NOT_EMPTY)
+
+    def contains(self, item: typing.Any) -> Asserto:
+        """
+        Checks the item is within the actual value.  Containers use their own membership checks,
+        iterators are streamed, stopping at the first occurrence of item.
+        :param item: The item expected to be within the actual value.
+        :return: The instance of `Asserto` to chain asserts.
+        """
+        return self._dispatch(handlers.IterableHandler, Methods.CONTAINS, item)
+
+    def does_not_contain(self, item: typing.Any) -> Asserto:
+        """
+        Checks the item is not within the actual value.  Containers use their own membership checks,
+        iterators are streamed, stopping at the first occurrence of item.
+        :param item: The item expected to not be within the actual value.
+        :return: The instance of `Asserto` to chain asserts.
+        """
+        return self._dispatch(handlers.IterableHandler, Methods.DOES_NOT_CONTAIN, item)
 
     def is_instance(self, cls_or_tuple: typing.Union[typing.Any, typing.Iterable[typing.Any]]) -> Asserto:
         """
@@ -243,7 +498,7 @@ class Asserto(AssertsStringsMixin):
 
         :param cls_or_tuple: A single Type, or iterable of types to check the object against.
         """
-        return self._dispatch(BaseHandler, Methods.IS_INSTANCE, cls_or_tuple)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_INSTANCE, cls_or_tuple)
 
     def has_same_identity_as(self, other: typing.Any) -> Asserto:
         """
@@ -251,7 +506,7 @@ class Asserto(AssertsStringsMixin):
         :param other: The other object to compare identity of.
         :return: The instance of `Asserto` to chain asserts.
         """
-        return self._dispatch(BaseHandler, Methods.HAS_SAME_IDENTITY_AS, other)
+        return self._dispatch(handlers.BaseHandler, Methods.HAS_SAME_IDENTITY_AS, other)
 
     def does_not_have_same_identity_as(self, other: typing.Any) -> Asserto:
         """
@@ -259,7 +514,7 @@ class Asserto(AssertsStringsMixin):
         :param other: The other object to compare identity of.
         :return: The instance of `Asserto` to chain asserts.
         """
-        return self._dispatch(BaseHandler, Methods.DOES_NOT_HAVE_SAME_IDENTITY_AS, other)
+        return self._dispatch(handlers.BaseHandler, Methods.DOES_NOT_HAVE_SAME_IDENTITY_AS, other)
 
     def is_none(self) -> Asserto:
         """
@@ -267,7 +522,7 @@ class Asserto(AssertsStringsMixin):
         are used
         :return: The `Asserto` instance for fluency.
         """
-        return self._dispatch(BaseHandler, Methods.IS_NONE)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_NONE)
 
     def is_not_none(self) -> Asserto:
         """
@@ -275,21 +530,21 @@ class Asserto(AssertsStringsMixin):
         used.
         :return: The `Asserto` instance for fluency
         """
-        return self._dispatch(BaseHandler, Methods.IS_NOT_NONE)
+        return self._dispatch(handlers.BaseHandler, Methods.IS_NOT_NONE)
 
     def is_zero(self) -> Asserto:
         """
         Checks the actual value is zero.
         :return: The `Asserto` instance for fluency.
         """
-        return self._dispatch(NumberHandler, Methods.IS_ZERO)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_ZERO)
 
     def is_not_zero(self) -> Asserto:
         """
         Checks the actual value is not zero.
         :return: The `Asserto` instance for fluency.
         """
-        return self._dispatch(NumberHandler, Methods.IS_NOT_ZERO)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_NOT_ZERO)
 
     def is_greater_than(self, other: float) -> Asserto:
         """Asserts that the value is numeric, and it is greater than other
@@ -297,7 +552,7 @@ class Asserto(AssertsStringsMixin):
         :param other: A number.Number to compare the value against.
         :return: This Asserto instance.
         """
-        return self._dispatch(NumberHandler, Methods.IS_GREATER_THAN, other)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_GREATER_THAN, other)
 
     is_more_than = is_greater_than
 
@@ -307,7 +562,7 @@ class Asserto(AssertsStringsMixin):
         :param other: A number.Number to compare the value against.
         :return: This Asserto instance.
         """
-        return self._dispatch(NumberHandler, Methods.IS_LESSER_THAN, other)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_LESSER_THAN, other)
 
     is_less_than = is_lesser_than
 
@@ -316,44 +571,45 @@ class Asserto(AssertsStringsMixin):
 
         :return: This Asserto instance.
         """
-        return self._dispatch(NumberHandler, Methods.IS_POSITIVE)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_POSITIVE)
 
     def is_negative(self) -> Asserto:
         """Asserts that the value is numeric, and is lesser than 0
 
         :return: This Asserto instance.
         """
-        return self._dispatch(NumberHandler, Methods.IS_NEGATIVE)
+        return self._dispatch(handlers.NumberHandler, Methods.IS_NEGATIVE)
 
     def _dispatch(self, handler: typing.Type[Handler], method: str, *args, **kwargs) -> Asserto:
         """
-        Delegate a check to an underlying handler instance.
-
-        :param error_template: (Optional) The error message to raise on failure.
+        Delegate a check to an underlying handler instance.  The handler function is resolved
+        through the dispatch cache and a single validated handler instance is reused for all
+        assertions against the current actual value.
 
         Arbitrary args & kwargs to pass through to the handler method.
-
-        Note: Debugging this with an IDE can yield unrealistic as debugging tends to insert
-        arbitrary code into the stack and this relies on frame inspection.
         """
         __tracebackhide__ = True  # pytest magic.
         self._triggered = True
-        # for now allow this to be bypassed as not all methods have a handler defined.
+        function = resolve(handler, method, self.actual)
+        instances = self._handlers
+        if instances is None:
+            instances = self._handlers = {}
         try:
-            handler_instance = handler(self.actual)  # descriptors enforce types here.
-        except ValueError:
-            # The type of actual is not viable for the given handler.
-            raise UnsupportedHandlerTypeError(handler, method, self.actual) from None
+            handler_instance = instances[handler]
         except KeyError:
-            raise KeyError(f"{method} does not have a dedicated handler.") from None
-        assertion_method: typing.Optional[types.MethodType] = getattr(handler_instance, method)
-        if not callable(assertion_method):
-            raise TypeError(f"assertion method was not a bound method on the handler {handler_instance}")
+            handler_instance = instances[handler] = handler(self.actual)
+        else:
+            # Handlers are kept when rebinding to a value of the same type, they follow the value lazily.
+            if handler_instance.actual is not self._actual:
+                handler_instance.actual = self._actual
         try:
-            _ = assertion_method(*args, **kwargs)
+            if _instrumentation.profiler is None:
+                function(handler_instance, *args, **kwargs)
+            else:
+                _instrumentation.profiler.measure(handler.__name__, method, function, handler_instance, args, kwargs)
         except AssertionError as exc:  # noqa
             if self.description:
-                exc = AssertionError(description)
+                exc = AssertionError(self.description)
             self.error(exc)
         # Fall through type & value errors; we don't need to do anything in particular for them, just bubble em up.
         # (for now anyway).
@@ -372,47 +628,18 @@ class Asserto(AssertsStringsMixin):
         Adds the capability to object class or instance attributes dynamically.  Supports user defined
         object types as well as built in mapping types.  In the case of a mapping type the attribute
         name will be the key in the dictionary and value called its value to check for equality.
+        Nested values are looked up by separating their names with `__`, `address__city_is("x")`.
 
         :param item: The attribute name to lookup
         """
         if not item.endswith("_is"):
             raise AttributeError(f"unknown assertion method: {item}")
-        key_attr = item[:-3]
-        named_tuple_like = is_namedtuple_like(self.actual)
-        mapping_like = isinstance(self.actual, typing.Iterable) and hasattr(self.actual, "__getitem__")
-        failure = None
-
-        if not hasattr(self.actual, key_attr):
-            # It's not an attribute on the wrapped `actual` value.
-            if not named_tuple_like and mapping_like:
-                if key_attr not in self.actual:
-                    failure = f"{self.actual!r} missing key: {key_attr}"
-            else:
-                failure = f"{self.actual!r} missing attribute: {key_attr}"
-
-        def _dynamic_callable(*args):
-            self._triggered = True  # Dynamic wrapper has been invoked!
-            if failure:
-                self.error(failure)
-            if len(args) != 1:
-                raise TypeError(f"Dynamic assertion takes 1 argument but {len(args)} was given. {args}")
-            value = self.actual[key_attr] if not named_tuple_like and mapping_like else getattr(self.actual, key_attr)
-            if callable(value):
-                try:
-                    lookup = value()
-                except TypeError:
-                    raise DynamicCallableWithArgsError(f"{key_attr} expects arguments, this is not supported") from None
-            else:
-                lookup = value
-            expected = args[0]
-            if lookup != expected:
-                self.error(f"{lookup} was not equal to: {expected}")
-            return self
-
-        return _dynamic_callable
+        # The lookup is shared by every instance, the accessors it uses are cached per type of value.
+        return types.MethodType(lookup(item[:-3]), self)
 
     def __repr__(self) -> str:
-        return f"Asserto(value={self.actual}, category={self.category})"
+        limits = self.render_limits or get_render_limits()
+        return f"Asserto(value={limits.str(self.actual)}, category={self.category})"
 
     def __enter__(self) -> Asserto:
         """
@@ -420,9 +647,13 @@ class Asserto(AssertsStringsMixin):
         ignored until the context is exited at which point any assertions will cause test
         failure(s) and raise the sequence of AssertionError's in the order in which they
         occurred.
+
+        Each thread or asyncio task may enter the context of a shared instance; failures of nested
+        contexts are merged into the enclosing one when they exit.  Worker threads (that do not run
+        in a copy of the current `contextvars.Context`) collect into the outermost active context.
         :return: The instance of `Asserto`.
         """
-        self._in_context = True
+        self.error_handler.enter_soft()
         return self
 
     def __exit__(
@@ -433,5 +664,4 @@ class Asserto(AssertsStringsMixin):
     ):
         if self.warn_unused and not self._triggered:
             self._warn_not_triggered()
-        self._error_handler.check_soft_raise()
-        self._error_handler.reset()
+        self.error_handler.exit_soft()
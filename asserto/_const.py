@@ -8,6 +8,9 @@ class Methods(str, Enum):
     to various handlers responsible for individual assertion methods.
     """
 
+    # Members are hashed as their (equal) values, by the C implementation; dispatch hashes them per assertion.
+    __hash__ = str.__hash__
+
     # -- Strings
 
     ENDS_WITH: str = "ends_with"
@@ -24,6 +27,10 @@ class Methods(str, Enum):
     FULLMATCH: str = "fullmatch"
     FINDALL: str = "findall"
 
+    # -- Bytes
+
+    HAS_SLICE: str = "has_slice"
+
     # -- Base Objects
 
     IS_TRUE: str = "is_true"
@@ -39,6 +46,13 @@ class Methods(str, Enum):
     IS_NONE: str = "is_none"
     IS_NOT_NONE: str = "is_not_none"
 
+    # -- Iterables
+
+    IS_EMPTY: str = "is_empty"
+    IS_NOT_EMPTY: str = "is_not_empty"
+    CONTAINS: str = "contains"
+    DOES_NOT_CONTAIN: str = "does_not_contain"
+
     # -- Numeric
     IS_ZERO: str = "is_zero"
     IS_NOT_ZERO: str = "is_not_zero"
@@ -5,14 +5,25 @@ import typing
 def update_triggered(fn: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable[[typing.Any], typing.Any]:
     """
     Track the triggered state on any asserto calls to ensure no instances were created
-    and used without calling any assertable methods.
+    and used without calling any assertable methods.  Coroutine functions are wrapped
+    in a coroutine function, to be awaited on the caller's running event loop.
     :param fn: The asserting function
     """
+    import inspect
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs) -> typing.Any:
+            args[0]._triggered = True
+            return await fn(*args, **kwargs)
+
+        return async_wrapper
 
     @functools.wraps(fn)
     def wrapper(*args, **kwargs) -> typing.Callable[[typing.Any], typing.Any]:
         instance = args[0]
-        instance.triggered = True
+        instance._triggered = True
         return fn(*args, **kwargs)
 
     return wrapper
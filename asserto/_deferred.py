@@ -0,0 +1,296 @@
+"""
+Deferred evaluation of assertions, for expensive checks in latency sensitive code: chained
+assertions are recorded on the calling thread and performed by a bounded pool of background
+threads, failures are reported to a sink (logged by default) instead of being raised.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import logging
+import queue
+import random
+import threading
+import typing
+import weakref
+
+from ._plan import _label
+
+if typing.TYPE_CHECKING:
+    from ._asserto import Asserto
+    from ._rendering import RenderLimits
+
+STEP_ALIAS = typing.Tuple[str, typing.Tuple[typing.Any, ...], typing.Dict[str, typing.Any]]
+
+DROP = "drop"
+BLOCK = "block"
+SAMPLE = "sample"
+POLICIES = (DROP, BLOCK, SAMPLE)
+
+logger = logging.getLogger("asserto")
+
+# Stops a worker thread when dequeued.
+_STOP = object()
+_default: typing.Optional[DeferredChecker] = None
+_default_lock = threading.Lock()
+# The checkers whose workers were started, flushed at interpreter exit: the workers are daemon threads.
+_started: weakref.WeakSet = weakref.WeakSet()
+
+
+class DeferredFailure(typing.NamedTuple):
+    """The failure of a deferred chain of assertions, passed to the failure sink of a checker."""
+
+    value: typing.Any
+    step: str
+    error: Exception
+
+
+def _log_failure(failure: DeferredFailure) -> None:
+    if isinstance(failure.error, AssertionError):
+        logger.error("deferred assertion %s failed: %s", failure.step, failure.error)
+    else:
+        logger.error("deferred assertion %s errored", failure.step, exc_info=failure.error)
+
+
+class _Task(typing.NamedTuple):
+    """A chain of assertions and the state of its `Asserto` when submitted, the `Asserto` is not retained."""
+
+    asserter: typing.Type[Asserto]
+    actual: typing.Any
+    category: typing.Optional[str]
+    description: typing.Optional[str]
+    render_limits: typing.Optional[RenderLimits]
+    steps: typing.Tuple[STEP_ALIAS, ...]
+
+
+@atexit.register
+def _flush_started() -> None:
+    for checker in list(_started):
+        checker.flush()
+
+
+class DeferredChecker:
+    """
+    A bounded queue of deferred assertion chains, performed by background worker threads.  Chains
+    are replayed against a fresh `Asserto` of the value (through the same methods, handlers and
+    dispatch as the fluent API) so deferred and immediate assertions always agree.  Values are
+    checked as they are when a worker reaches them, defer immutable values (or copies).  Chains
+    still queued when the interpreter exits are checked before it does.
+
+    When the queue is full, the policy decides the fate of further chains:
+
+        drop: The chain is discarded (and counted as dropped), the caller never waits.
+        block: The caller waits for room in the queue.
+        sample: The caller never waits; once the queue is half full only `sample_rate` of the chains
+            are queued (the rest dropped), preserving a uniform sample of the checks under load.
+
+    :param maxsize: The maximum number of chains waiting to be checked.
+    :param workers: The number of worker threads, started on the first submission.
+    :param policy: The backpressure policy, one of `drop`, `block` or `sample`.
+    :param on_failure: Called (on a worker thread) with a `DeferredFailure` for every failing chain,
+        failures are logged to the `asserto` logger by default.
+    :param sample_rate: The fraction of chains queued under load with the `sample` policy.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        workers: int = 1,
+        policy: str = DROP,
+        on_failure: typing.Optional[typing.Callable[[DeferredFailure], typing.Any]] = None,
+        sample_rate: float = 0.1,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"unknown backpressure {policy=}, expected one of: {', '.join(POLICIES)}.")
+        if maxsize < 1 or workers < 1:
+            raise ValueError(f"{maxsize=} and {workers=} must be positive integers.")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"{sample_rate=} must be between 0 and 1.")
+        self.maxsize = maxsize
+        self.workers = workers
+        self.policy = policy
+        self.on_failure = on_failure or _log_failure
+        self.sample_rate = sample_rate
+        self.submitted = 0
+        self.dropped = 0
+        self.checked = 0
+        self.failed = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._threads: typing.List[threading.Thread] = []
+        self._lock = threading.Lock()
+        # Held while starting or stopping the workers, never by the workers themselves.
+        self._lifecycle = threading.Lock()
+        self._random = random.Random()
+
+    def submit(self, task: _Task) -> bool:
+        """
+        Queues a chain of assertions, as snapshotted by `Deferred.submit`.
+
+        :return: True if the chain was queued, False if it was dropped.
+        """
+        if self.policy == SAMPLE and self._queue.qsize() * 2 >= self.maxsize:
+            if self._random.random() >= self.sample_rate:
+                return self._drop()
+        try:
+            self._queue.put(task, block=self.policy == BLOCK)
+        except queue.Full:
+            return self._drop()
+        # Checked once queued: a chain queued behind the workers being stopped by `close` restarts them.
+        if not self._threads:
+            self._start()
+        with self._lock:
+            self.submitted += 1
+        return True
+
+    def _drop(self) -> bool:
+        with self._lock:
+            self.dropped += 1
+        return False
+
+    def _start(self) -> None:
+        with self._lifecycle:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"asserto-deferred-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            _started.add(self)
+
+    def _work(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is _STOP:
+                    return
+                self._check(task)
+            finally:
+                self._queue.task_done()
+
+    def _check(self, task: _Task) -> None:
+        probe = task.asserter(task.actual, render_limits=task.render_limits)
+        probe.category, probe.description = task.category, task.description
+        step: typing.Optional[STEP_ALIAS] = None
+        # Every step is performed on what the previous one returned, as chained: `each()` switches modes.
+        target: typing.Any = probe
+        try:
+            for step in task.steps:
+                name, args, kwargs = step
+                target = getattr(target, name)(*args, **kwargs)
+        except Exception as exc:
+            with self._lock:
+                self.checked += 1
+                self.failed += 1
+            try:
+                self.on_failure(DeferredFailure(task.actual, _label(*step), exc))  # type: ignore[misc]
+            except Exception:
+                logger.exception("the deferred assertion failure sink raised")
+            return
+        with self._lock:
+            self.checked += 1
+
+    def flush(self) -> None:
+        """Waits until every queued chain has been checked."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Checks every queued chain, then stops the worker threads.  Chains submitted later restart them."""
+        # Workers started while stopping could take the place of those stopped (and never stop), until
+        # they have all stopped no worker is started.
+        with self._lifecycle:
+            threads, self._threads = self._threads, []
+            for _ in threads:
+                self._queue.put(_STOP)
+            for thread in threads:
+                thread.join()
+
+    def install(self) -> DeferredChecker:
+        """Makes this checker the default of `deferred()`, closing the previous default (if any)."""
+        global _default
+        with _default_lock:
+            previous, _default = _default, self
+        if previous is not None and previous is not self:
+            previous.close()
+        return self
+
+    def __enter__(self) -> DeferredChecker:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(policy={self.policy!r}, submitted={self.submitted}, dropped={self.dropped}, "
+            f"checked={self.checked}, failed={self.failed})"
+        )
+
+
+def get_deferred_checker() -> DeferredChecker:
+    """Retrieve the default checker of `deferred()`, created (with default settings) on first use."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = DeferredChecker()
+    return _default
+
+
+class Deferred:
+    """
+    Records chained assertions for deferred evaluation, for example:
+
+        Example:
+            Usage::
+                asserto(response).deferred().is_instance(dict).has_length(3).submit()
+
+    Recording only validates the names of the assertions, nothing is evaluated until the chain is
+    submitted and a worker of the checker replays it, each step on the result of the previous one.
+    Switches whose result cannot be replayed on a worker (`deferred`, `eventually_async` &
+    `should_raise`) cannot be recorded.  Submitting snapshots the value, category,
+    description & render limits of the referent, later changes to it do not affect the chain.
+
+    :param referent: The `Asserto` instance wrapping the value.
+    :param checker: The checker the chain is submitted to, the default checker if omitted.
+    """
+
+    __slots__ = ("asserto_ref", "checker", "steps")
+
+    _unrecordable = frozenset(("deferred", "eventually_async", "should_raise"))
+
+    def __init__(self, referent: Asserto, checker: typing.Optional[DeferredChecker] = None) -> None:
+        self.asserto_ref = referent
+        self.checker = checker
+        self.steps: typing.List[STEP_ALIAS] = []
+
+    def __getattr__(self, item: str) -> typing.Callable[..., Deferred]:
+        if item.startswith("_") or not (hasattr(type(self.asserto_ref), item) or item.endswith("_is")):
+            raise AttributeError(f"unknown assertion method: {item}")
+        if item in self._unrecordable:
+            raise AttributeError(f"{item} cannot be deferred, its result cannot be replayed on a worker")
+        return functools.partial(self._record, item)
+
+    def _record(self, name: str, *args: typing.Any, **kwargs: typing.Any) -> Deferred:
+        self.asserto_ref._triggered = True
+        self.steps.append((name, args, kwargs))
+        return self
+
+    def submit(self) -> bool:
+        """
+        Hands the recorded chain to the checker, subject to its backpressure policy.
+
+        :return: True if the chain was queued, False if it was dropped.
+        """
+        checker = self.checker or get_deferred_checker()
+        referent = self.asserto_ref
+        return checker.submit(
+            _Task(
+                type(referent),
+                referent.actual,
+                referent.category,
+                referent.description,
+                referent.render_limits,
+                tuple(self.steps),
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(_label(*step) for step in self.steps)})"
@@ -0,0 +1,426 @@
+"""
+Differences between values, reported for failed equality assertions: structural differences between
+containers and windowed differences between large strings (or bytes).
+"""
+from __future__ import annotations
+
+import collections.abc
+import typing
+
+from ._rendering import FailureMessage
+from ._rendering import RenderLimits
+from ._rendering import get_render_limits
+from ._rendering import truncate
+from ._util import MISSING
+from ._util import is_namedtuple_like
+
+# Sequences are compared a chunk at a time (in C) before looking for the differing items in python.
+CHUNK_SIZE = 1024
+# Values of these types are compared as a whole, they are never traversed.
+_SCALARS = frozenset((int, float, complex, bool, str, bytes, type(None)))
+# Strings & bytes are compared a chunk at a time to find where they first differ.
+TEXT_CHUNK_SIZE = 64 * 1024
+# The characters (or bytes) of context shown either side of where text differs.
+TEXT_WINDOW = 40
+# The lines of context (and the most lines compared) around where line oriented text differs.
+DIFF_CONTEXT = 3
+DIFF_LINES = 30
+
+# Templates of each kind of difference, rendered with the bounded `path`, `actual` and `expected`.
+VALUE = "{path}: {actual} != {expected}"
+UNEXPECTED = "{path}: unexpected {actual}"
+MISSING_VALUE = "{path}: missing {expected}"
+UNEXPECTED_ITEM = "{path}: unexpected item {actual}"
+MISSING_ITEM = "{path}: missing item {expected}"
+
+# A path is a linked (parent, key, is_attribute) tuple, only rendered for the differences reported.
+PATH_ALIAS = typing.Optional[typing.Tuple[typing.Any, typing.Any, bool]]
+_PAIR_ALIAS = typing.Tuple[PATH_ALIAS, typing.Any, typing.Any]
+
+
+class Difference:
+    """A single difference between the actual & expected values, at a path within them."""
+
+    __slots__ = ("path", "kind", "actual", "expected")
+
+    def __init__(self, path: PATH_ALIAS, kind: str, actual: typing.Any, expected: typing.Any) -> None:
+        self.path = path
+        self.kind = kind
+        self.actual = actual
+        self.expected = expected
+
+    def render(self, limits: RenderLimits) -> str:
+        return self.kind.format(
+            path=render_path(self.path, limits),
+            actual=limits.repr(self.actual),
+            expected=limits.repr(self.expected),
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.render(get_render_limits())!r})"
+
+
+def render_path(path: PATH_ALIAS, limits: RenderLimits) -> str:
+    """Renders a path such as `root['a'][3].b`."""
+    segments = []
+    while path is not None:
+        path, key, is_attribute = path
+        segments.append(f".{key}" if is_attribute else f"[{limits.repr(key)}]")
+    return "root" + "".join(reversed(segments))
+
+
+def is_diffable(actual: typing.Any, expected: typing.Any) -> bool:
+    """Checks if both values are containers of the same kind, which can be diffed structurally."""
+    return _expander(actual, expected) is not None
+
+
+def differences(actual: typing.Any, expected: typing.Any, limit: int) -> typing.Tuple[typing.List[Difference], bool]:
+    """
+    Finds the differences between two values, depth first in the order of the actual value.  Nested
+    containers are traversed rather than compared as a whole (unless identical, or only holding scalars)
+    so every value is compared at most twice whatever its depth; the traversal is iterative and stops
+    once more than `limit` differences are found.
+
+    :param actual: The actual value.
+    :param expected: The expected value.
+    :param limit: The maximum number of differences to find.
+    :return: The differences and whether there were more differences than the limit.
+    """
+    found: typing.List[Difference] = []
+    stack: typing.List[typing.Iterator[typing.Union[Difference, _PAIR_ALIAS]]] = [iter(((None, actual, expected),))]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+        if type(item) is not Difference:
+            path, left, right = item  # type: ignore[misc]
+            expand = _expander(left, right)
+            if expand is not None:
+                stack.append(expand(path, left, right))
+                continue
+            item = Difference(path, VALUE, left, right)
+        if len(found) == limit:
+            return found, True
+        found.append(item)  # type: ignore[arg-type]
+    return found, False
+
+
+def _differs(left: typing.Any, right: typing.Any) -> bool:
+    """
+    Checks if a pair of values may differ: containers of the same kind are left to the traversal (comparing
+    them here would compare their items again at every level below) unless they only hold scalars, other
+    values are compared.
+    """
+    if left is right:
+        return False
+    if type(left) in _SCALARS:
+        return left != right
+    expand = _expander(left, right)
+    if expand is None or expand is _set:
+        return left != right
+    if expand is _sequence and _all_scalars(left) or expand is _mapping and _all_scalars(left.values()):
+        return left != right
+    return True
+
+
+def _all_scalars(values: typing.Iterable[typing.Any]) -> bool:
+    return _SCALARS.issuperset(map(type, values))
+
+
+def _mapping(path: PATH_ALIAS, actual: typing.Mapping, expected: typing.Mapping) -> typing.Iterator:
+    for key, value in actual.items():
+        if key not in expected:
+            yield Difference((path, key, False), UNEXPECTED, value, MISSING)
+            continue
+        other = expected[key]
+        if _differs(value, other):
+            yield (path, key, False), value, other
+    for key, value in expected.items():
+        if key not in actual:
+            yield Difference((path, key, False), MISSING_VALUE, MISSING, value)
+
+
+def _sequence(path: PATH_ALIAS, actual: typing.Sequence, expected: typing.Sequence) -> typing.Iterator:
+    common = min(len(actual), len(expected))
+    # Chunks of the root are compared as a whole, every item is compared once by them; below the root
+    # only chunks of scalars are, as the chunks of each level would compare the items of the levels below.
+    root = path is None
+    for start in range(0, common, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, common)
+        chunk, other = actual[start:stop], expected[start:stop]
+        if (root or _all_scalars(chunk)) and chunk == other:
+            continue
+        for index, left, right in zip(range(start, stop), chunk, other):
+            if _differs(left, right):
+                yield (path, index, False), left, right
+    for index in range(common, len(actual)):
+        yield Difference((path, index, False), UNEXPECTED, actual[index], MISSING)
+    for index in range(common, len(expected)):
+        yield Difference((path, index, False), MISSING_VALUE, MISSING, expected[index])
+
+
+def _set(path: PATH_ALIAS, actual: typing.AbstractSet, expected: typing.AbstractSet) -> typing.Iterator:
+    for item in actual - expected:
+        yield Difference(path, UNEXPECTED_ITEM, item, MISSING)
+    for item in expected - actual:
+        yield Difference(path, MISSING_ITEM, MISSING, item)
+
+
+def _attributes(names: typing.Iterable[str]) -> typing.Callable[..., typing.Iterator]:
+    def expand(path: PATH_ALIAS, actual: typing.Any, expected: typing.Any) -> typing.Iterator:
+        for name in names:
+            left, right = getattr(actual, name), getattr(expected, name)
+            if _differs(left, right):
+                yield (path, name, True), left, right
+
+    return expand
+
+
+def _expander(actual: typing.Any, expected: typing.Any) -> typing.Optional[typing.Callable[..., typing.Iterator]]:
+    """Resolves how to traverse a pair of values, None if they are not containers of the same kind."""
+    kind = type(actual)
+    if kind is type(expected):
+        expand = _BUILTINS.get(kind)
+        if expand is not None:
+            return expand
+        if is_namedtuple_like(actual):
+            return _attributes(actual._fields)
+        if hasattr(kind, "__dataclass_fields__"):
+            # The dataclass is already defined, importing `dataclasses` is free.
+            import dataclasses
+
+            return _attributes([field.name for field in dataclasses.fields(actual) if field.compare])
+    if isinstance(actual, (str, bytes, bytearray)):
+        return None
+    if isinstance(actual, collections.abc.Mapping) and isinstance(expected, collections.abc.Mapping):
+        return _mapping
+    if isinstance(actual, (list, tuple)) and type(expected) is kind:
+        return _sequence
+    if isinstance(actual, (set, frozenset)) and isinstance(expected, (set, frozenset)):
+        return _set
+    return None
+
+
+# The expanders of builtin containers, resolved by type alone.
+_BUILTINS = {dict: _mapping, list: _sequence, tuple: _sequence, set: _set, frozenset: _set}
+
+
+class StructuralDiff(FailureMessage):
+    """
+    The differences between two containers, appended to an equality failure message.  Like any
+    `FailureMessage` nothing is computed until the message is read, the number of differences
+    reported is bounded by `RenderLimits.maxdiffs`.
+    """
+
+    def __init__(self, actual: typing.Any, expected: typing.Any) -> None:
+        super().__init__("", actual=actual, expected=expected)
+
+    def render(self, limits: typing.Optional[RenderLimits] = None) -> str:
+        limits = self.limits or limits or get_render_limits()
+        found, truncated = differences(self.values["actual"], self.values["expected"], limits.maxdiffs)
+        if not found:
+            return ""
+        lines = ["", "differences:"]
+        lines.extend(f"    {difference.render(limits)}" for difference in found)
+        if truncated:
+            lines.append(f"    ... stopped after {limits.maxdiffs} differences")
+        return "\n".join(lines)
+
+
+def byte_view(value: typing.Union[bytes, bytearray, memoryview]) -> memoryview:
+    """
+    A flat view of the bytes of a value, without copying them.  Only non contiguous (strided) views
+    are copied, their bytes cannot be viewed flat.
+    """
+    view = memoryview(value)
+    return view.cast("B") if view.c_contiguous else memoryview(view.tobytes())
+
+
+def _view(value: typing.Union[str, bytes, bytearray, memoryview]) -> typing.Any:
+    """Slices of strings are compared directly, bytes through a memoryview to avoid copying them."""
+    return value if isinstance(value, str) else byte_view(value)
+
+
+def common_prefix(actual: typing.Any, expected: typing.Any) -> int:
+    """
+    The length of the common prefix of two strings (or bytes), the offset at which they first differ.
+    Chunks are compared in C, only the first differing chunk is bisected.
+    """
+    left, right = _view(actual), _view(expected)
+    common = min(len(left), len(right))
+    start = 0
+    while start < common:
+        stop = min(start + TEXT_CHUNK_SIZE, common)
+        if not _equal(left[start:stop], right[start:stop]):
+            # The chunk differs; bisect for the offset, keeping [start, stop) around it.
+            while stop - start > 1:
+                middle = (start + stop) // 2
+                if _equal(left[start:middle], right[start:middle]):
+                    start = middle
+                else:
+                    stop = middle
+            return start
+        start = stop
+    return common
+
+
+def common_suffix(actual: typing.Any, expected: typing.Any) -> int:
+    """The length of the common suffix of two strings (or bytes), see `common_prefix`."""
+    left, right = _view(actual), _view(expected)
+    common = min(len(left), len(right))
+    matched = 0
+    while matched < common:
+        size = min(TEXT_CHUNK_SIZE, common - matched)
+        if not _tails_equal(left, right, matched, size):
+            # The chunk differs; bisect for the last differing offset, shrinking the chunk around it.
+            while size > 1:
+                half = size // 2
+                if _tails_equal(left, right, matched, half):
+                    matched += half
+                    size -= half
+                else:
+                    size = half
+            return matched
+        matched += size
+    return common
+
+
+def _tails_equal(left: typing.Any, right: typing.Any, matched: int, size: int) -> bool:
+    """Checks if the `size` items before the last `matched` (equal) items are equal."""
+    left_stop, right_stop = len(left) - matched, len(right) - matched
+    return _equal(left[left_stop - size : left_stop], right[right_stop - size : right_stop])
+
+
+def _equal(left: typing.Any, right: typing.Any) -> bool:
+    """
+    Compares slices of the same length, of strings or of byte views.  Memoryviews compare item by item
+    (several times slower than a copy), so the left slice (a chunk at most) is copied to compare in C.
+    """
+    if isinstance(left, str):
+        return left == right
+    return left.tobytes().startswith(right)
+
+
+def _is_text(value: typing.Any) -> bool:
+    return isinstance(value, (str, bytes, bytearray, memoryview))
+
+
+class TextDiff(FailureMessage):
+    """
+    Where two large strings (or bytes) differ, appended to a failure message when the bounded
+    rendering of the values would hide it: the offset, a window of each value around it and for
+    line oriented text a unified diff of the lines around it.  Only the offset is searched for
+    (in chunks), the cost of rendering does not depend on the size of the values.
+
+    :param actual: The actual value.
+    :param expected: The expected value, prefix or suffix.
+    :param mode: What is checked, one of `EQUAL`, `PREFIX` or `SUFFIX`.
+    """
+
+    EQUAL = "equal"
+    PREFIX = "prefix"
+    SUFFIX = "suffix"
+
+    def __init__(self, actual: typing.Any, expected: typing.Any, mode: str = EQUAL) -> None:
+        super().__init__("", actual=actual, expected=expected)
+        self.mode = mode
+
+    def render(self, limits: typing.Optional[RenderLimits] = None) -> str:
+        limits = self.limits or limits or get_render_limits()
+        actual, expected = self.values["actual"], self.values["expected"]
+        if max(len(actual), len(expected)) <= limits.maxstring:
+            return ""
+        # The number of characters rendered from each end of a truncated value.
+        visible = max(0, (limits.maxstring - 3) // 2)
+        if self.mode == self.SUFFIX:
+            matched = common_suffix(actual, expected)
+            if matched < visible:
+                return ""
+            at_actual, at_expected = len(actual) - matched, len(expected) - matched
+            lines = ["", f"the last {matched} {_unit(actual)} matched, they differ before:"]
+        else:
+            at_actual = at_expected = common_prefix(actual, expected)
+            if at_actual < visible:
+                return ""
+            lines = ["", f"first difference at index {at_actual}{_position(actual, at_actual)}:"]
+        lines.append(f"    actual{_window(actual, at_actual)}")
+        lines.append(f"    {self.mode if self.mode != self.EQUAL else 'expected'}{_window(expected, at_expected)}")
+        if self.mode == self.EQUAL and isinstance(actual, str) and isinstance(expected, str):
+            lines.extend(_unified(actual, expected, at_actual))
+        return "\n".join(lines)
+
+
+def _unit(value: typing.Any) -> str:
+    return "characters" if isinstance(value, str) else "bytes"
+
+
+def _position(value: typing.Any, offset: int) -> str:
+    if not isinstance(value, str):
+        return ""
+    line = value.count("\n", 0, offset) + 1
+    column = offset - (value.rfind("\n", 0, offset) + 1) + 1
+    return f" (line {line}, column {column})"
+
+
+def _window(value: typing.Any, offset: int) -> str:
+    start, stop = max(0, offset - TEXT_WINDOW), min(len(value), offset + TEXT_WINDOW)
+    window = value[start:stop] if isinstance(value, str) else bytes(_view(value)[start:stop])
+    return f"[{start}:{stop}]: {window!r}"
+
+
+def _lines(value: str, start: int, count: int) -> typing.List[str]:
+    """Splits at most `count` lines of a string from an offset, without splitting the whole string."""
+    stop = start
+    for _ in range(count):
+        stop = value.find("\n", stop) + 1
+        if not stop:
+            stop = len(value)
+            break
+    return value[start:stop].splitlines()
+
+
+def _unified(actual: str, expected: str, offset: int) -> typing.List[str]:
+    """A unified diff of the lines around `offset`, where the strings first differ (and are equal before)."""
+    start = actual.rfind("\n", 0, offset) + 1
+    for _ in range(DIFF_CONTEXT):
+        if not start:
+            break
+        start = actual.rfind("\n", 0, start - 1) + 1
+    before, after = _lines(actual, start, DIFF_LINES), _lines(expected, start, DIFF_LINES)
+    if len(before) < 2 and len(after) < 2:
+        return []
+    import difflib
+
+    first_line = actual.count("\n", 0, start)
+    lines = ["--- actual", "+++ expected"]
+    for group in difflib.SequenceMatcher(None, before, after, autojunk=False).get_grouped_opcodes(DIFF_CONTEXT):
+        old = _range(first_line + group[0][1], group[-1][2] - group[0][1])
+        new = _range(first_line + group[0][3], group[-1][4] - group[0][3])
+        lines.append(f"@@ -{old} +{new} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                lines.extend(f" {truncate(line, 2 * TEXT_WINDOW)}" for line in before[i1:i2])
+                continue
+            lines.extend(f"-{truncate(line, 2 * TEXT_WINDOW)}" for line in before[i1:i2])
+            lines.extend(f"+{truncate(line, 2 * TEXT_WINDOW)}" for line in after[j1:j2])
+    return lines
+
+
+def _range(start: int, length: int) -> str:
+    """Formats a unified diff range, as `difflib.unified_diff` does."""
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+
+def describe_difference(actual: typing.Any, expected: typing.Any) -> typing.Union[FailureMessage, str]:
+    """
+    Describes where unequal values differ, appended to their failure message: a `TextDiff` for
+    strings (or bytes), a `StructuralDiff` for containers of the same kind, otherwise nothing.
+    """
+    if _is_text(actual) and _is_text(expected) and isinstance(actual, str) is isinstance(expected, str):
+        return TextDiff(actual, expected)
+    if is_diffable(actual, expected):
+        return StructuralDiff(actual, expected)
+    return ""
@@ -0,0 +1,64 @@
+import typing
+
+from ._exceptions import UnsupportedHandlerTypeError
+from .handlers import Handler
+
+DISPATCH_KEY_ALIAS = typing.Tuple[type, typing.Type[Handler], str]
+
+# (type(actual), handler, method) -> the unbound handler function, or None if the handler rejects the type.
+_dispatch_cache: typing.Dict[DISPATCH_KEY_ALIAS, typing.Optional[typing.Callable[..., typing.Any]]] = {}
+# type(actual) -> the asserter class chosen by `asserto()` for values of that type, see `_specialized`.
+_asserter_cache: typing.Dict[type, typing.Any] = {}
+# The number of types an asserter class is cached for, types are created dynamically by some programs.
+ASSERTER_CACHE_SIZE = 1024
+
+
+def resolve(handler: typing.Type[Handler], method: str, actual: typing.Any) -> typing.Callable[..., typing.Any]:
+    """
+    Resolve the unbound handler function responsible for `method` given the actual value.  Whether
+    or not the handler accepts the type of the actual value and the function to call are cached per
+    `(type(actual), handler, method)` so repeated assertions skip validation and attribute lookups.
+
+    :param handler: The handler type responsible for the assertion.
+    :param method: The name of the assertion method on the handler.
+    :param actual: The actual value the assertion is to be performed against.
+    :raises UnsupportedHandlerTypeError: If the handler cannot accept the type of actual value.
+    :raises TypeError: If the method is not a callable on the handler.
+    :return: The unbound function, to be called with a handler instance.
+    """
+    key = (type(actual), handler, method)
+    try:
+        function = _dispatch_cache[key]
+    except KeyError:
+        function = _dispatch_cache[key] = _resolve(handler, method, actual)
+    if function is None:
+        raise UnsupportedHandlerTypeError(handler, method, actual)
+    return function
+
+
+def _resolve(
+    handler: typing.Type[Handler], method: str, actual: typing.Any
+) -> typing.Optional[typing.Callable[..., typing.Any]]:
+    """Performs the (uncached) resolution of a handler function for the type of the actual value."""
+    if not handler.accepts(actual):
+        return None
+    function = getattr(handler, method, None)
+    if not callable(function):
+        raise TypeError(f"assertion method: {method} was not a callable on the handler {handler.__name__}")
+    return function
+
+
+def asserter_for(actual: typing.Any) -> typing.Any:
+    """Retrieve the asserter class for the type of the actual value, chosen once per type."""
+    try:
+        return _asserter_cache[type(actual)]
+    except KeyError:
+        from ._specialized import specialize
+
+        return specialize(actual)
+
+
+def clear_dispatch_cache() -> None:
+    """Clears all cached dispatch resolutions, and the asserter classes chosen per type."""
+    _dispatch_cache.clear()
+    _asserter_cache.clear()
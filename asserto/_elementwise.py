@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import typing
+
+from ._const import Methods
+from .handlers import ElementwiseNumberHandler
+
+if typing.TYPE_CHECKING:
+    from ._asserto import Asserto
+
+
+class Elementwise:
+    """
+    Encapsulation of the asserto elementwise (bulk) numeric assertions.  Each assertion is
+    evaluated against every element of the actual value in a single pass and reports a single
+    failure summarising the offending elements.
+
+    :param referent: The `Asserto` instance wrapping the sequence of values.
+    :param report: The maximum number of offending indices and values to report on failure.
+    """
+
+    __slots__ = ("asserto_ref", "report")
+
+    def __init__(self, referent: Asserto, report: int = 10) -> None:
+        self.asserto_ref = referent
+        self.report = report
+
+    def is_zero(self) -> Elementwise:
+        """Asserts that every element is equal to 0."""
+        return self._dispatch(Methods.IS_ZERO)
+
+    def is_not_zero(self) -> Elementwise:
+        """Asserts that no element is equal to 0."""
+        return self._dispatch(Methods.IS_NOT_ZERO)
+
+    def is_positive(self) -> Elementwise:
+        """Asserts that every element is greater than 0."""
+        return self._dispatch(Methods.IS_POSITIVE)
+
+    def is_negative(self) -> Elementwise:
+        """Asserts that every element is lesser than 0."""
+        return self._dispatch(Methods.IS_NEGATIVE)
+
+    def is_greater_than(self, other: float) -> Elementwise:
+        """Asserts that every element is greater than other."""
+        return self._dispatch(Methods.IS_GREATER_THAN, other)
+
+    def is_lesser_than(self, other: float) -> Elementwise:
+        """Asserts that every element is lesser than other."""
+        return self._dispatch(Methods.IS_LESSER_THAN, other)
+
+    def is_between(self, low: float, high: float, inclusive: bool = False) -> Elementwise:
+        """Asserts that every element is between the low and high bounds."""
+        return self._dispatch(Methods.IS_BETWEEN, low, high, inclusive)
+
+    def is_not_between(self, low: float, high: float, inclusive: bool = False) -> Elementwise:
+        """Asserts that no element is between the low and high bounds."""
+        return self._dispatch(Methods.IS_NOT_BETWEEN, low, high, inclusive)
+
+    def _dispatch(self, method: str, *args: typing.Any) -> Elementwise:
+        __tracebackhide__ = True  # pytest magic.
+        self.asserto_ref._dispatch(ElementwiseNumberHandler, method, *args, report=self.report)
+        return self
@@ -1,69 +1,172 @@
+from __future__ import annotations
+
 import abc
+import contextvars
 import typing
 
-from ._softly import AssertionErrorContainer
+from ._rendering import FailureMessage
+from ._rendering import LazyAssertionError
+
+if typing.TYPE_CHECKING:
+    from ._softly import AssertionErrorContainer
 
 
 class RaisesErrors(typing.Protocol):
     @abc.abstractmethod
     def check_should_raise(
         self,
-        softly: bool,
-        cause: typing.Union[AssertionError, str],
+        cause: typing.Union[AssertionError, FailureMessage, str],
         description: typing.Optional[str] = None,
         category: typing.Optional[str] = None,
     ) -> None:
         """Checks and raises immediately for hard failures when not used in a context"""
 
     @abc.abstractmethod
-    def check_soft_raise(self):
-        """Checks and raises for soft failures when exiting the context"""
+    def configure_soft(
+        self,
+        max_stored: typing.Optional[int] = None,
+        fail_after: typing.Optional[int] = None,
+        group_identical: bool = False,
+    ) -> None:
+        """Configures the collection of soft failures."""
+
+    @abc.abstractmethod
+    def enter_soft(self) -> None:
+        """Enters a soft context, for the current thread or task."""
+
+    @abc.abstractmethod
+    def exit_soft(self) -> None:
+        """Exits the soft context of the current thread or task, raising its failures if it is outermost."""
 
+    @property
     @abc.abstractmethod
-    def reset(self):
-        """Reset the soft context failures."""
+    def softly(self) -> bool:
+        """Checks if a soft context is active for the current thread or task."""
 
 
 class ErrorHandler:
     """
     The Error handler.  Responsible for raising the underlying AssertionError's when things
     are amiss for each individual handler instance.
+
+    Soft contexts are scoped per `contextvars.Context`; each asyncio task (and each thread
+    running a copied context) entering the context collects its own failures, which are merged
+    into the enclosing context when they exit.  Threads without a copy of the context (a plain
+    `ThreadPoolExecutor` for example) collect into the outermost context active in another thread.
     """
 
+    __slots__ = ("_scope", "_roots", "_tokens", "_soft_limits")
+
     def __init__(self):
-        self.context_failures = AssertionErrorContainer()
+        # Created on first entering a soft context; most instances are never used as a context manager.
+        self._scope: typing.Optional[contextvars.ContextVar[typing.Optional[AssertionErrorContainer]]] = None
+        # Outermost active contexts, appended & removed only, for threads the scope does not reach.
+        self._roots: typing.List[AssertionErrorContainer] = []
+        self._tokens: typing.Dict[int, contextvars.Token] = {}
+        self._soft_limits: typing.Dict[str, typing.Any] = {}
+
+    @property
+    def context_failures(self) -> typing.Optional[AssertionErrorContainer]:
+        """The failures of the soft context active for the current thread or task, if any."""
+        if self._scope is None:
+            return None
+        container = self._scope.get()
+        if container is not None:
+            return container
+        for root in reversed(self._roots):
+            if not root.owned_by_current_thread():
+                return root
+        return None
+
+    @property
+    def softly(self) -> bool:
+        return self.context_failures is not None
 
     def reset(self) -> None:
-        """Clear the underlying sequence of AssertionError instances."""
-        self.context_failures.clear()
+        """Clear the soft failures of the current context."""
+        container = self.context_failures
+        if container is not None:
+            container.clear()
+
+    def configure_soft(
+        self,
+        max_stored: typing.Optional[int] = None,
+        fail_after: typing.Optional[int] = None,
+        group_identical: bool = False,
+    ) -> None:
+        """
+        Configures the collection of soft failures, applied to the active and subsequently entered contexts.
+        :param max_stored: (Optional) The maximum number of failures to retain, further failures are only counted.
+        :param fail_after: (Optional) Fail the soft context early, once this many failures have occurred.
+        :param group_identical: Group failures with identical messages, displaying their number of occurrences.
+        """
+        self._soft_limits = dict(max_stored=max_stored, fail_after=fail_after, group_identical=group_identical)
+        container = self.context_failures
+        if container is not None:
+            container.max_stored, container.fail_after, container.group_identical = (
+                max_stored,
+                fail_after,
+                group_identical,
+            )
+
+    def enter_soft(self) -> None:
+        """Enters a soft context, nested in the context active for the current thread or task (if any)."""
+        from ._softly import AssertionErrorContainer
+
+        if self._scope is None:
+            self._scope = contextvars.ContextVar(f"asserto_soft_{id(self)}", default=None)
+        parent = self.context_failures
+        container = AssertionErrorContainer(**self._soft_limits)
+        self._tokens[id(container)] = self._scope.set(container)
+        if parent is None:
+            self._roots.append(container)
+
+    def exit_soft(self) -> None:
+        """
+        Exits the soft context of the current thread or task.  Nested contexts merge their failures
+        into the enclosing context, the outermost context raises every failure in the order they occurred.
+        """
+        container = self._scope.get() if self._scope is not None else None
+        if container is None:
+            return
+        self._scope.reset(self._tokens.pop(id(container)))
+        parent = self.context_failures
+        if container in self._roots:
+            self._roots.remove(container)
+        elif parent is not None:
+            parent.merge(container)
+            return
+        if container:
+            # The asserto instance had had some soft assertion failures; raise them now.
+            raise AssertionError(repr(container)) from None
 
     def check_should_raise(
         self,
-        softly: bool,
-        cause: typing.Union[AssertionError, str],
+        cause: typing.Union[AssertionError, FailureMessage, str],
         description: typing.Optional[str] = None,
         category: typing.Optional[str] = None,
     ) -> None:
         """
         Raise the AssertionError or build on the list of soft assertions which
         will be automatically raised when the context exits.  Error can except
-        an Assertion error or a string used as message for a newly created one.
+        an Assertion error or a (lazy) message used for a newly created one.
         """
         error = cause if isinstance(cause, AssertionError) else self.build_assertion_error(cause, description, category)
-        # Check if in 'soft' mode as in the `Asserto` instance was instantiated as a context manager.
-        if softly:
-            self.context_failures.store(error)
-            return
-        raise error from None
-
-    def check_soft_raise(self):
-        if self.context_failures:
-            # The asserto instance had had some soft assertion failures; raise them now.
-            raise AssertionError(repr(self.context_failures)) from None
+        # Check if in 'soft' mode as in the `Asserto` instance was used as a context manager.
+        container = self.context_failures
+        if container is None:
+            raise error from None
+        if container.store(error):
+            # Fail fast; the failures are raised now, the exit of the context has nothing left to raise.
+            error = AssertionError(repr(container))
+            container.clear()
+            raise error from None
 
     @staticmethod
     def build_assertion_error(
-        cause: str, description: typing.Optional[str] = None, category: typing.Optional[str] = None
+        cause: typing.Union[FailureMessage, str],
+        description: typing.Optional[str] = None,
+        category: typing.Optional[str] = None,
     ) -> AssertionError:
         """
         Generates exception messages for a given failure.
@@ -75,9 +178,11 @@ class ErrorHandler:
 
         Description gives the user the chance to interject their own bespoke error message on the assertions.
 
-        :param cause: A string for the error message, is always a string at this point.
+        :param cause: The error message, either a string or a lazily rendered `FailureMessage`.
         :param description: User defined description to provide a custom message on the AssertionError.
         :param category: A prefix for grouping purposes.
         """
         message = description or cause
-        return AssertionError(message if category is None else f"[{category}] {message}")
+        if category is not None:
+            message = FailureMessage("[{category}] {message}", category=category, message=message)
+        return LazyAssertionError(message) if isinstance(message, FailureMessage) else AssertionError(message)
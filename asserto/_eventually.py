@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import random
+import time
+import typing
+
+from ._rendering import FailureMessage
+from .descriptors import EnforcedCallable
+
+if typing.TYPE_CHECKING:
+    from ._asserto import Asserto
+
+STEP_ALIAS = typing.Tuple[str, typing.Tuple[typing.Any, ...], typing.Dict[str, typing.Any]]
+
+
+class Schedule:
+    """
+    An exponential (optionally jittered) backoff schedule of the delays between polling attempts.
+
+    :param interval: The delay (in seconds) after the first failed attempt.
+    :param backoff: The factor the delay is multiplied by after every failed attempt.
+    :param max_interval: The upper bound of the delay between attempts.
+    :param jitter: A fraction of every delay to randomly add or subtract, spreading out concurrent pollers.
+    """
+
+    def __init__(self, interval: float = 0.05, backoff: float = 2.0, max_interval: float = 1.0, jitter: float = 0.0):
+        if interval < 0 or backoff < 1 or max_interval < 0 or not 0 <= jitter <= 1:
+            raise ValueError(f"invalid schedule: {interval=}, {backoff=}, {max_interval=}, {jitter=}")
+        self.interval = interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self._random = random.Random()
+
+    def __iter__(self) -> typing.Iterator[float]:
+        delay = self.interval
+        while True:
+            capped = min(delay, self.max_interval)
+            yield capped * (1 + self._random.uniform(-self.jitter, self.jitter)) if self.jitter else capped
+            delay *= self.backoff
+
+
+class _Polling:
+    """
+    Shared machinery of the polling proxies.  Chained assertions are recorded as steps and every
+    attempt re-evaluates the actual value (the wrapped callable) before running all steps against it,
+    on a fresh `Asserto` instance, each step on the result of the previous one.  Switches whose result
+    cannot be polled (`deferred`, `eventually`, `eventually_async` & `should_raise`) cannot be recorded.
+    The first attempt passing every step is a success and the value becomes the actual value of the
+    referent, on timeout the last failure is reported via `error()`.
+    """
+
+    _source = EnforcedCallable()
+    _unrecordable = frozenset(("deferred", "eventually", "eventually_async", "should_raise"))
+
+    def __init__(self, referent: Asserto, timeout: float, schedule: Schedule) -> None:
+        self.asserto_ref = referent
+        self._source = referent.actual
+        self.timeout = timeout
+        self.schedule = schedule
+        self.steps: typing.List[STEP_ALIAS] = []
+
+    def __getattr__(self, item: str) -> typing.Callable[..., typing.Any]:
+        if item.startswith("_") or not (hasattr(type(self.asserto_ref), item) or item.endswith("_is")):
+            raise AttributeError(f"unknown assertion method: {item}")
+        if item in self._unrecordable:
+            raise AttributeError(f"{item} cannot be polled, its result is not checked when chained")
+        return functools.partial(self._record, item)
+
+    def _record(self, name: str, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        self.asserto_ref._triggered = True
+        self.steps.append((name, args, kwargs))
+        return self
+
+    def _attempt(self, value: typing.Any) -> typing.Optional[AssertionError]:
+        """Runs every step against the value, returning the failure (if any)."""
+        target: typing.Any = type(self.asserto_ref)(value, render_limits=self.asserto_ref.render_limits)
+        try:
+            for name, args, kwargs in self.steps:
+                # As chained: `each()` switches the steps after it to elementwise mode.
+                target = getattr(target, name)(*args, **kwargs)
+        except AssertionError as exc:
+            return exc
+        return None
+
+    def _timed_out(self, last: AssertionError, attempts: int, elapsed: float) -> None:
+        self.asserto_ref.error(
+            FailureMessage(
+                "{source} did not eventually pass within {timeout}s, {attempts} attempts in {elapsed}s, "
+                "last failure: {last}",
+                source=getattr(self._source, "__name__", self._source),
+                timeout=self.timeout,
+                attempts=attempts,
+                elapsed=round(elapsed, 3),
+                last=last,
+            )
+        )
+
+
+class Eventually(_Polling):
+    """
+    Polls the actual value (a callable) until the chained assertions pass, for example:
+
+        Example:
+            Usage::
+                asserto(lambda: service.status()).eventually(timeout=5).is_equal_to("ready")
+
+    Every chained assertion polls until it passes together with all assertions chained before it;
+    the timeout applies to the whole chain.
+
+    :param referent: The `Asserto` instance wrapping the callable.
+    :param timeout: The time (in seconds) after which polling stops and the last failure is raised.
+    :param schedule: The schedule of delays between attempts.
+    """
+
+    def __init__(self, referent: Asserto, timeout: float, schedule: Schedule) -> None:
+        super().__init__(referent, timeout, schedule)
+        self._started = time.monotonic()
+
+    def _record(self, name: str, *args: typing.Any, **kwargs: typing.Any) -> Eventually:
+        __tracebackhide__ = True  # pytest magic.
+        super()._record(name, *args, **kwargs)
+        self._poll()
+        return self
+
+    def _poll(self) -> None:
+        __tracebackhide__ = True  # pytest magic.
+        deadline = self._started + self.timeout
+        attempts = 0
+        for delay in self.schedule:
+            value = self._source()
+            attempts += 1
+            failure = self._attempt(value)
+            if failure is None:
+                self.asserto_ref.actual = value
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._timed_out(failure, attempts, time.monotonic() - self._started)
+                return
+            time.sleep(min(delay, remaining))
+
+
+class AsyncEventually(_Polling):
+    """
+    Polls the actual value (a callable, or a coroutine function) until the chained assertions pass
+    when awaited.  Delays are awaited on the running event loop, for example:
+
+        Example:
+            Usage::
+                await asserto(client.status).eventually_async(timeout=5).is_equal_to("ready")
+
+    :param referent: The `Asserto` instance wrapping the callable.
+    :param timeout: The time (in seconds) after which polling stops and the last failure is raised.
+    :param schedule: The schedule of delays between attempts.
+    """
+
+    def __await__(self) -> typing.Generator[typing.Any, None, Asserto]:
+        return self._poll().__await__()
+
+    async def _poll(self) -> Asserto:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.timeout
+        attempts = 0
+        for delay in self.schedule:
+            value = self._source()
+            if inspect.isawaitable(value):
+                value = await value
+            attempts += 1
+            failure = self._attempt(value)
+            if failure is None:
+                self.asserto_ref.actual = value
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._timed_out(failure, attempts, loop.time() - started)
+                break
+            await asyncio.sleep(min(delay, remaining))
+        return self.asserto_ref
@@ -1,6 +1,10 @@
+import inspect
 import re
+import sys
 import typing
 
+from . import _instrumentation
+from ._patterns import compile_pattern
 from ._types import EXC_TYPES_ALIAS
 from ._types import RE_PATTERN_ALIAS
 from ._util import to_iterable
@@ -24,38 +28,79 @@ class ExceptionChecker:
         self.exc_types: typing.Iterable[typing.Type[BaseException]] = to_iterable(exc_types)
         self._proxy_val = value
         self.asserto_ref = _referent
-        self.pattern: typing.Optional[re.Pattern[str]] = re.compile(match) if isinstance(match, str) else match
+        self.pattern: typing.Optional[re.Pattern[str]] = compile_pattern(match) if match is not None else None
 
-    def when_called_with(self, *args, **kwargs) -> None:
+    def when_called_with(self, *args, **kwargs) -> typing.Optional[typing.Awaitable[None]]:
         """
         Call the underlying function with the user supplied arguments;  This returns the result
         of the function back to the asserto instance to enforce error handling & assertion errors
         there.
 
+        If the underlying function returns an awaitable (a coroutine function for example) the
+        checks are deferred until it is awaited, an awaitable is returned which must be awaited
+        on the running event loop:
+
+            Example:
+                Usage::
+                    await asserto(fetch).should_raise(TimeoutError).when_called_with(url)
+
         If reason is provided; asserto will enforce the exception message is explicitly equal to.
 
         # Todo: In future support a pattern match.
         # Todo: limitations in this API; what if the called arg has a `reason` attribute?
         """
+        if _instrumentation.profiler is not None:
+            # Awaitables are measured until they are returned, not until they are awaited.
+            return _instrumentation.profiler.measure(
+                self.__class__.__name__, "when_called_with", ExceptionChecker._call, self, args, kwargs
+            )
+        return self._call(*args, **kwargs)
+
+    def _call(self, *args, **kwargs) -> typing.Optional[typing.Awaitable[None]]:
+        """Calls the underlying function, checking the exception it raised (if any)."""
         try:
             # update 'triggered' status to avoid unnecessary warnings
-            self.asserto_ref.triggered = True  # type: ignore[attr-defined]
-            self._proxy_val(*args, **kwargs)
+            self.asserto_ref._triggered = True  # type: ignore[attr-defined]
+            result = self._proxy_val(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._when_awaited(result, args, kwargs)
             # No exception was raised at all; raise an assertion error.
             self.asserto_ref.error(f"{self._proxy_val} never raised any of: {self.exc_types}")
         except BaseException as e:
-            exc_type, exc_string = type(e), str(e)
-            if isinstance(e, self.exc_types):  # type: ignore [arg-type]
-                if self.pattern:
-                    if self.pattern.match(exc_string) is None:
-                        # Type matched, but the pattern regex did not, raise.
-                        self.asserto_ref.error(
-                            f"{exc_type} occurred but did not match pattern: {self.pattern} instead was: {exc_string}"
-                        )
-                # type matched, no expected pattern, it was a success.
-                return
-            # The exception was not as expected, raise an assertion error against the type.
-            arguments = f"{args, kwargs}" if all((args, kwargs)) else "no arguments"
-            self.asserto_ref.error(
-                f"{self._proxy_val.__name__} did not raise any of {self.exc_types}.  Instead it raised {exc_type} when called with {arguments}."  # noqa
-            )
+            self._check_raised(e, args, kwargs)
+        return None
+
+    async def _when_awaited(self, awaitable: typing.Awaitable[typing.Any], args, kwargs) -> None:
+        """Awaits the result of the underlying function, checking the exception it raised (if any)."""
+        try:
+            await awaitable
+            self.asserto_ref.error(f"{self._proxy_val} never raised any of: {self.exc_types}")
+        except BaseException as e:
+            if _is_cancellation(e) and not isinstance(e, self.exc_types):  # type: ignore [arg-type]
+                # Never swallow the cancellation of the awaiting task.
+                raise
+            self._check_raised(e, args, kwargs)
+
+    def _check_raised(self, e: BaseException, args, kwargs) -> None:
+        """Checks a raised exception against the expected types (and pattern)."""
+        exc_type, exc_string = type(e), str(e)
+        if isinstance(e, self.exc_types):  # type: ignore [arg-type]
+            if self.pattern:
+                if self.pattern.match(exc_string) is None:
+                    # Type matched, but the pattern regex did not, raise.
+                    self.asserto_ref.error(
+                        f"{exc_type} occurred but did not match pattern: {self.pattern} instead was: {exc_string}"
+                    )
+            # type matched, no expected pattern, it was a success.
+            return
+        # The exception was not as expected, raise an assertion error against the type.
+        arguments = f"{args, kwargs}" if all((args, kwargs)) else "no arguments"
+        self.asserto_ref.error(
+            f"{self._proxy_val.__name__} did not raise any of {self.exc_types}.  Instead it raised {exc_type} when called with {arguments}."  # noqa
+        )
+
+
+def _is_cancellation(e: BaseException) -> bool:
+    """Checks if an exception is the cancellation of an asyncio task, without importing asyncio."""
+    asyncio = sys.modules.get("asyncio")
+    return asyncio is not None and isinstance(e, asyncio.CancelledError)
@@ -27,4 +27,6 @@ class UnsupportedHandlerTypeError(ValueError):
     """Raised when the actual value passed to a handler is not suitable for it to handle."""
 
     def __init__(self, handler: typing.Type[Handler], method: str, value: typing.Any) -> None:
+        # `Methods` members format differently across python versions; always report the plain name.
+        method = getattr(method, "value", method)
         super().__init__(f"`{handler.__name__}` cannot accept type: {type(value)} when calling: {method}")
@@ -0,0 +1,186 @@
+"""
+Opt-in profiling of assertions.  Instrumented code checks the module level `profiler` attribute,
+which is None unless profiling is enabled; that single check is the only cost of instrumentation
+when it is disabled.
+"""
+from __future__ import annotations
+
+import time
+import typing
+
+# The enabled profiler, checked by instrumented code as `_instrumentation.profiler is not None`.
+profiler: typing.Optional[Profiler] = None
+
+
+class Measurement(typing.NamedTuple):
+    """A single measured assertion, passed to the hook of a profiler."""
+
+    owner: str
+    method: str
+    duration_ns: int
+    failed: bool
+
+
+class MethodStats:
+    """
+    The statistics of a single assertion method: counts, failures and latencies.  Percentiles are
+    computed from a uniform (reservoir) sample of the latencies, bounding memory per method.
+    """
+
+    __slots__ = ("count", "failures", "total_ns", "max_ns", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples: typing.List[int] = []
+
+    def percentile(self, percent: float) -> int:
+        """The latency (in nanoseconds) at a percentile (0-100) of the sampled latencies."""
+        if not self.samples:
+            return 0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "failure_rate": self.failures / self.count if self.count else 0.0,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "max_ns": self.max_ns,
+        }
+
+
+class Profiler:
+    """
+    Records the count, latency and failure rate of every assertion performed while enabled, per
+    method of each handler (or mixin), as well as `should_raise(...).when_called_with(...)`.  Only
+    the assertion itself is timed, not the construction of `Asserto` instances or handlers.
+
+        Example:
+            Usage::
+                with asserto.Profiler() as profiler:
+                    run_the_tests()
+                print(profiler.to_json())
+
+    :param hook: An optional callable, called with the `Measurement` of every assertion.
+    :param sample_size: The number of latencies sampled per method for percentiles.
+    """
+
+    def __init__(
+        self, hook: typing.Optional[typing.Callable[[Measurement], typing.Any]] = None, sample_size: int = 1024
+    ) -> None:
+        import random
+        import threading
+
+        self.hook = hook
+        self.sample_size = sample_size
+        self.methods: typing.Dict[typing.Tuple[str, str], MethodStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._random = random.Random()
+
+    def enable(self) -> Profiler:
+        """Enables the profiler (replacing any other enabled profiler) for every thread."""
+        global profiler
+        profiler = self
+        return self
+
+    def disable(self) -> None:
+        """Disables the profiler, if it is enabled."""
+        global profiler
+        if profiler is self:
+            profiler = None
+
+    def measure(
+        self,
+        owner: str,
+        method: str,
+        fn: typing.Callable[..., typing.Any],
+        instance: typing.Any,
+        args: tuple,
+        kwargs: dict,
+    ) -> typing.Any:
+        """Performs (and measures) an assertion, `fn(instance, *args, **kwargs)`."""
+        __tracebackhide__ = True
+        failures = self._failures()
+        failures.append(False)
+        start = time.perf_counter_ns()
+        try:
+            return fn(instance, *args, **kwargs)
+        except AssertionError:
+            failures[-1] = True
+            raise
+        finally:
+            self.record(owner, method, time.perf_counter_ns() - start, failures.pop())
+
+    def failed(self) -> None:
+        """Marks the assertion being measured (on this thread) as failed, for failures recorded softly."""
+        failures = self._failures()
+        if failures:
+            failures[-1] = True
+
+    def _failures(self) -> typing.List[bool]:
+        try:
+            return self._local.failures
+        except AttributeError:
+            failures = self._local.failures = []
+            return failures
+
+    def record(self, owner: str, method: str, duration_ns: int, failed: bool) -> None:
+        """Records the measurement of an assertion."""
+        # Handler methods are dispatched by `Methods` members, record their plain names.
+        method = getattr(method, "value", method)
+        with self._lock:
+            stats = self.methods.get((owner, method))
+            if stats is None:
+                stats = self.methods[(owner, method)] = MethodStats()
+            stats.count += 1
+            stats.failures += failed
+            stats.total_ns += duration_ns
+            stats.max_ns = max(stats.max_ns, duration_ns)
+            if len(stats.samples) < self.sample_size:
+                stats.samples.append(duration_ns)
+            else:
+                index = self._random.randrange(stats.count)
+                if index < self.sample_size:
+                    stats.samples[index] = duration_ns
+        if self.hook is not None:
+            self.hook(Measurement(owner, method, duration_ns, failed))
+
+    def stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """The statistics of every method measured, keyed by `owner.method` in descending total time."""
+        with self._lock:
+            ordered = sorted(self.methods.items(), key=lambda item: item[1].total_ns, reverse=True)
+            return {f"{owner}.{method}": stats.as_dict() for (owner, method), stats in ordered}
+
+    def to_json(self, indent: typing.Optional[int] = 2) -> str:
+        """Exports the statistics of every method measured as JSON."""
+        import json
+
+        return json.dumps(self.stats(), indent=indent)
+
+    def reset(self) -> None:
+        """Discards everything recorded so far."""
+        with self._lock:
+            self.methods.clear()
+
+    def __enter__(self) -> Profiler:
+        return self.enable()
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.disable()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(methods={len(self.methods)}, enabled={profiler is self})"
+
+
+def get_profiler() -> typing.Optional[Profiler]:
+    """Retrieve the enabled profiler, if any."""
+    return profiler
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import operator
+import typing
+
+from ._exceptions import DynamicCallableWithArgsError
+from ._rendering import FailureMessage
+from ._util import is_namedtuple_like
+
+if typing.TYPE_CHECKING:
+    from ._asserto import Asserto
+
+# The separator of nested lookups, `address__city_is` looks up `city` of the `address`.
+PATH_SEPARATOR = "__"
+
+ACCESSOR_ALIAS = typing.Tuple[typing.Callable[[typing.Any], typing.Any], bool]
+
+# (type(obj), name) -> the accessor of `name` on objects of that type, and whether it looks up a key.
+_accessor_cache: typing.Dict[typing.Tuple[type, str], ACCESSOR_ALIAS] = {}
+# name -> the reusable dynamic lookup, the shape of the actual value is resolved by the accessors.
+_lookup_cache: typing.Dict[str, DynamicLookup] = {}
+
+
+def is_mapping_like(obj: typing.Any) -> bool:
+    """Mappings (and other subscriptable iterables) are looked up by key, named tuples by attribute."""
+    return not is_namedtuple_like(obj) and isinstance(obj, typing.Iterable) and hasattr(obj, "__getitem__")
+
+
+def accessor(obj: typing.Any, name: str) -> ACCESSOR_ALIAS:
+    """
+    Resolve the accessor of `name` for objects of the type of `obj`, an `operator.itemgetter` for
+    mapping like objects otherwise an `operator.attrgetter`.  The shape of a type is only inspected
+    once, subsequent lookups reuse the cached accessor.
+
+    :param obj: An object of the type to resolve the accessor for.
+    :param name: The name of the key or attribute.
+    :return: The accessor and whether it looks up a key.
+    """
+    key = (type(obj), name)
+    try:
+        return _accessor_cache[key]
+    except KeyError:
+        by_key = is_mapping_like(obj)
+        found = _accessor_cache[key] = (operator.itemgetter(name) if by_key else operator.attrgetter(name), by_key)
+        return found
+
+
+class DynamicLookup:
+    """
+    A reusable `<name>_is` assertion, bound to `Asserto` instances as a method rather than creating
+    a closure per lookup.  Nested paths (`a__b_is`) look up every part in turn, each part resolved
+    once per type of the object it is looked up on.
+
+    :param name: The name (or `__` separated path) of the key or attribute to look up.
+    """
+
+    __slots__ = ("name", "path")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        parts = tuple(name.split(PATH_SEPARATOR))
+        # Names with leading, trailing or runs of underscores (such as dunders) are never nested paths.
+        self.path = parts if all(parts) else (name,)
+
+    def __call__(self, referent: Asserto, *args: typing.Any) -> Asserto:
+        referent._triggered = True  # Dynamic wrapper has been invoked!
+        value = referent.actual
+        for part in self.path:
+            getter, by_key = accessor(value, part)
+            try:
+                value = getter(value)
+            except (KeyError, AttributeError, IndexError, TypeError):
+                template = "{actual!r} missing key: {key}" if by_key else "{actual!r} missing attribute: {key}"
+                referent.error(FailureMessage(template, actual=value, key=part))
+                return referent
+        if len(args) != 1:
+            raise TypeError(f"Dynamic assertion takes 1 argument but {len(args)} was given. {args}")
+        if callable(value):
+            try:
+                value = value()
+            except TypeError:
+                raise DynamicCallableWithArgsError(f"{self.name} expects arguments, this is not supported") from None
+        expected = args[0]
+        if value != expected:
+            referent.error(FailureMessage("{lookup} was not equal to: {expected}", lookup=value, expected=expected))
+        return referent
+
+
+def lookup(name: str) -> DynamicLookup:
+    """
+    Retrieve the (cached) dynamic lookup of `name`.
+
+    :param name: The name (or path) looked up, without the `_is` suffix.
+    """
+    try:
+        return _lookup_cache[name]
+    except KeyError:
+        found = _lookup_cache[name] = DynamicLookup(name)
+        return found
+
+
+def clear_lookup_cache() -> None:
+    """Clears all cached accessors & dynamic lookups."""
+    _accessor_cache.clear()
+    _lookup_cache.clear()
@@ -0,0 +1,170 @@
+"""
+Global assertion modes, for running assertions in production code:
+
+    full: Every assertion is performed (the default).
+    sampled: Only a fraction of assertion chains are performed, chosen at random per `asserto()` call.
+    off: No assertions are performed, `asserto()` returns a shared no-op object.
+
+The mode is read from the `ASSERTO_MODE` environment variable on import (`off`, `full` or
+`sampled:<rate>`, for example `sampled:0.01`) and can be changed at runtime with `set_mode`.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import typing
+
+from ._asserto import Asserto
+
+if typing.TYPE_CHECKING:
+    from ._rendering import RenderLimits
+
+ENV_VAR = "ASSERTO_MODE"
+FULL = "full"
+SAMPLED = "sampled"
+OFF = "off"
+
+# Decides if an assertion chain is skipped, None when every chain is performed; checked by `asserto()`.
+skip: typing.Optional[typing.Callable[[], bool]] = None
+_mode = FULL
+_rate = 1.0
+
+
+def _is_assertion(name: str) -> bool:
+    """Checks if `name` is an assertion method of `Asserto`, including dynamic `_is` lookups & registered assertions."""
+    return not name.startswith("_") and (name.endswith("_is") or callable(getattr(Asserto, name, None)))
+
+
+class NoOpDeferred:
+    """Stands in for `Deferred` when assertions are skipped, nothing is recorded nor submitted."""
+
+    __slots__ = ()
+
+    def __getattr__(self, item: str) -> typing.Callable[..., NoOpDeferred]:
+        if not _is_assertion(item):
+            raise AttributeError(f"unknown assertion method: {item}")
+        return self._chain
+
+    def _chain(self, *args: typing.Any, **kwargs: typing.Any) -> NoOpDeferred:
+        return self
+
+    def submit(self) -> bool:
+        """Nothing is queued, the chain is dropped."""
+        return False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+NOOP_DEFERRED = NoOpDeferred()
+
+
+class NoOpAsserto:
+    """
+    Stands in for `Asserto` when assertions are skipped, a single stateless instance is shared so a
+    skipped chain allocates nothing.  Every assertion method (including dynamic `_is` lookups &
+    registered assertions) returns the shared instance immediately, so chains of any length are
+    no-ops; it is also a no-op (soft) context manager and awaitable.  Other attributes are not
+    assertions: the data attributes of an `Asserto` are None (the value is not retained), unknown
+    names raise an `AttributeError`.
+    """
+
+    __slots__ = ()
+
+    actual: typing.Any = None
+    category: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    render_limits: typing.Optional[RenderLimits] = None
+    warn_unused = False
+
+    def __getattr__(self, item: str) -> typing.Callable[..., NoOpAsserto]:
+        if not _is_assertion(item):
+            raise AttributeError(f"unknown assertion method: {item}")
+        return _noop
+
+    def deferred(self, checker: typing.Any = None) -> NoOpDeferred:
+        return NOOP_DEFERRED
+
+    def when_called_with(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Stands in for `ExceptionChecker.when_called_with` (after `should_raise`), the value is not called."""
+        return None
+
+    def __enter__(self) -> NoOpAsserto:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        return None
+
+    def __await__(self) -> typing.Generator[typing.Any, None, NoOpAsserto]:
+        return self
+        yield  # noqa
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+NOOP = NoOpAsserto()
+
+
+def _noop(*args: typing.Any, **kwargs: typing.Any) -> NoOpAsserto:
+    return NOOP
+
+
+# The assertion methods are plain functions on the class, avoiding a failed lookup (& `__getattr__`) per call.
+for _name in dir(Asserto):
+    if _is_assertion(_name) and _name not in vars(NoOpAsserto):
+        setattr(NoOpAsserto, _name, staticmethod(_noop))
+
+
+def _sampler(rate: float) -> typing.Callable[[], bool]:
+    """Skips all but `rate` of chains, with a PRNG per thread so threads never contend on a lock."""
+    import random
+    import threading
+
+    local = threading.local()
+
+    def _skip() -> bool:
+        try:
+            return local.random() >= rate
+        except AttributeError:
+            local.random = random.Random().random
+            return local.random() >= rate
+
+    return _skip
+
+
+def set_mode(mode: str, rate: typing.Optional[float] = None) -> None:
+    """
+    Set the global assertion mode, for every thread.
+
+    :param mode: One of `full`, `off` or `sampled`, the rate can be given as `sampled:<rate>`.
+    :param rate: The fraction (0 to 1) of assertion chains performed in `sampled` mode.
+    """
+    global skip, _mode, _rate
+    name, _, suffix = mode.strip().lower().partition(":")
+    if suffix:
+        if rate is not None:
+            raise ValueError(f"the rate of {mode=} was given twice.")
+        try:
+            rate = float(suffix)
+        except ValueError:
+            raise ValueError(f"invalid sampling rate in {mode=}.") from None
+    if name == FULL:
+        skip, _rate = None, 1.0
+    elif name == OFF:
+        skip, _rate = itertools.repeat(True).__next__, 0.0
+    elif name == SAMPLED:
+        if rate is None or not 0.0 <= rate <= 1.0:
+            raise ValueError(f"sampled mode requires a rate between 0 and 1, not: {rate}.")
+        skip, _rate = _sampler(rate), rate
+    else:
+        raise ValueError(f"unknown assertion mode: {mode!r}, expected one of: {FULL}, {SAMPLED}:<rate> or {OFF}.")
+    _mode = name
+
+
+def get_mode() -> str:
+    """Retrieve the global assertion mode, in the format accepted by `set_mode`."""
+    return f"{SAMPLED}:{_rate}" if _mode == SAMPLED else _mode
+
+
+set_mode(os.environ.get(ENV_VAR) or FULL)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import itertools
+import operator
+import os
+import typing
+
+from ._asserto import Asserto
+from ._plan import PlanReport
+
+if typing.TYPE_CHECKING:
+    from ._spec import SpecReport
+
+REPORT_ALIAS = typing.Union[PlanReport, "SpecReport"]
+
+
+def _check_chunk(check: typing.Any, chunk: typing.List[typing.Any], max_failures: int) -> REPORT_ALIAS:
+    """
+    Checks a chunk of values in a worker process.  Only the report is sent back, its size depends
+    on the number of failures (at most `max_failures` are retained) rather than the chunk size.
+    """
+    check_many = getattr(check, "check_many", None)
+    if check_many is not None:
+        return check_many(chunk, max_failures=max_failures)
+    report = PlanReport(max_failures)
+    label = getattr(check, "__name__", repr(check))
+    for index, value in enumerate(chunk):
+        try:
+            check(Asserto(value))
+        except AssertionError as exc:
+            report.record(index, value, label, exc)
+    report.checked = len(chunk)
+    return report
+
+
+def _merge(report: typing.Optional[REPORT_ALIAS], part: REPORT_ALIAS, offset: int) -> REPORT_ALIAS:
+    """
+    Merges the report of a chunk starting at `offset` of the input into the overall report.  Chunks
+    complete in any order, the failures of both (each ordered by index) are merged in input order
+    and only the first `max_failures` kept.
+    """
+    failures = [(index + offset, *rest) for index, *rest in part.failures]
+    if report is None:
+        part.failures = failures  # type: ignore[assignment]
+        return part
+    report.checked += part.checked
+    report.failed += part.failed
+    for label, count in part.counts.items():
+        report.counts[label] = report.counts.get(label, 0) + count
+    merged = heapq.merge(report.failures, failures, key=operator.itemgetter(0))
+    report.failures = list(itertools.islice(merged, report.max_failures))  # type: ignore[arg-type]
+    return report
+
+
+def parallel(
+    values: typing.Iterable[typing.Any],
+    check: typing.Any,
+    chunk_size: int = 10_000,
+    workers: typing.Optional[int] = None,
+    max_failures: int = 10,
+) -> REPORT_ALIAS:
+    """
+    Checks values across a pool of processes, sharding them into chunks.  Values are consumed
+    lazily with at most two chunks per worker in flight, failures are merged into a single report
+    ordered by the position of the values in the input.
+
+    :param values: The values to check, any iterable.
+    :param check: A `Plan` or `Spec`, or a function called with an `Asserto` of each value (such as a
+        function registered with `register_assert`).  It is sent to the workers so must be picklable.
+    :param chunk_size: The number of values sent to a worker at a time.
+    :param workers: The number of worker processes, defaults to the number of processors.
+    :param max_failures: The maximum number of failing values retained in the report.
+    :return: The report of the check, a `SpecReport` for specs otherwise a `PlanReport`.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"{chunk_size=} must be a positive integer.")
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(values)
+    report: typing.Optional[REPORT_ALIAS] = None
+    offset = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: typing.Dict[concurrent.futures.Future, int] = {}
+        try:
+            while True:
+                while len(in_flight) < 2 * workers:
+                    chunk = list(itertools.islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+                    in_flight[executor.submit(_check_chunk, check, chunk, max_failures)] = offset
+                    offset += len(chunk)
+                if not in_flight:
+                    break
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    report = _merge(report, future.result(), in_flight.pop(future))
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+    if report is None:
+        report = _check_chunk(check, [], max_failures)
+    return report
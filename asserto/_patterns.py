@@ -0,0 +1,106 @@
+"""
+A shared, size bounded cache of compiled regular expressions.
+"""
+import collections
+import re
+import threading
+import typing
+
+from ._types import RE_FLAGS_ALIAS
+from ._types import RE_PATTERN_ALIAS
+
+
+class CacheInfo(typing.NamedTuple):
+    """Statistics of the pattern cache, similar to `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PatternCache:
+    """
+    A least recently used cache of compiled patterns keyed on `(pattern, flags)`.  The `re` module
+    keeps its own (small) cache which thrashes once a suite uses many distinct patterns, asserto
+    compiles through this cache instead so repeated assertions never recompile a pattern.
+
+    :param maxsize: The maximum number of compiled patterns to retain.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        if maxsize < 1:
+            raise ValueError(f"{maxsize=} must be at least 1.")
+        self.maxsize = maxsize
+        self._patterns: "collections.OrderedDict[typing.Tuple[typing.AnyStr, int], re.Pattern[typing.Any]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def compile(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> "re.Pattern[typing.Any]":
+        """
+        Retrieve the compiled pattern, compiling (and caching) it if it has not been seen recently.
+        Already compiled patterns are returned as is.
+
+        :param pattern: The regular expression pattern (str or bytes) or a compiled pattern.
+        :param flags: An integer (or RegexFlag) representing flags to apply.
+        """
+        if isinstance(pattern, re.Pattern):
+            if flags:
+                raise ValueError("cannot process flags argument with a compiled pattern")
+            return pattern
+        key = (pattern, int(flags))
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._hits += 1
+                self._patterns.move_to_end(key)
+                return compiled
+            self._misses += 1
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            if len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def precompile(self, *patterns: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> None:
+        """
+        Warm the cache, typically at import time of a test module so assertions never compile.
+
+        :param patterns: The regular expression patterns to compile.
+        :param flags: An integer (or RegexFlag) representing flags to apply to every pattern.
+        """
+        for pattern in patterns:
+            self.compile(pattern, flags)
+
+    def info(self) -> CacheInfo:
+        """Retrieve the hit & miss statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._patterns))
+
+    def clear(self) -> None:
+        """Remove all compiled patterns and reset the statistics."""
+        with self._lock:
+            self._patterns.clear()
+            self._hits = self._misses = 0
+
+
+pattern_cache = PatternCache()
+
+
+def compile_pattern(pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> "re.Pattern[typing.Any]":
+    """Compile a pattern through the shared pattern cache."""
+    return pattern_cache.compile(pattern, flags)
+
+
+def precompile(*patterns: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> None:
+    """Warm the shared pattern cache with the given patterns."""
+    pattern_cache.precompile(*patterns, flags=flags)
+
+
+def pattern_cache_info() -> CacheInfo:
+    """Retrieve the hit & miss statistics of the shared pattern cache."""
+    return pattern_cache.info()
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+from ._asserto import Asserto
+from ._const import Methods
+from ._dispatch import resolve
+from ._rendering import get_render_limits
+from ._util import MISSING
+from .handlers import Handler
+
+# The names of every assertion method in the instruction set.
+_INSTRUCTIONS = frozenset(method.value for method in Methods)
+
+
+class _Recorder(Asserto):
+    """
+    An `Asserto` which records dispatched assertions instead of performing them.  Assertions choose
+    their handler by the type of the actual value, which is recorded against `actual`.
+    """
+
+    __slots__ = ("dispatched",)
+
+    def __init__(self, actual: typing.Any = MISSING) -> None:
+        super().__init__(actual)
+        self.dispatched: typing.List[typing.Tuple[typing.Type[Handler], str, tuple, dict]] = []
+
+    def _dispatch(self, handler: typing.Type[Handler], method: str, *args, **kwargs) -> Asserto:
+        self.dispatched.append((handler, method, args, kwargs))
+        return self
+
+
+_BINDING_ALIAS = typing.Tuple[typing.Any, typing.Callable[[], typing.Any]]
+
+
+def _raises(error: Exception) -> None:
+    raise error
+
+
+_DISPATCHED_ALIAS = typing.Tuple[typing.Type[Handler], str, tuple, dict]
+
+
+class _DispatchStep:
+    """
+    A check dispatched directly to a handler function, the `position`th dispatch of the `Asserto` method
+    `name`.  The handler & method recorded when the plan is built are those of values of no particular
+    type, the method is recorded again for the type of value bound.
+    """
+
+    __slots__ = ("label", "name", "call", "position", "handler", "method", "args", "kwargs")
+
+    def __init__(
+        self, label: str, name: str, call: typing.Tuple[tuple, dict], position: int, dispatched: _DISPATCHED_ALIAS
+    ) -> None:
+        self.label = label
+        self.name = name
+        self.call = call
+        self.position = position
+        self.handler, self.method, self.args, self.kwargs = dispatched
+
+    def bind(self, value: typing.Any, bound: typing.Dict[typing.Any, typing.Any]) -> _BINDING_ALIAS:
+        """
+        Binds the step for values of the type of `value`, returning the handler instance to rebind to
+        each value and the call performing the check.  Handlers accept (or reject) values by type only,
+        a single instance of each handler is shared by every step & value.
+        """
+        handler, method, args, kwargs = self._route(value)
+        function = resolve(handler, method, value)
+        instance = bound.get(handler)
+        if instance is None:
+            instance = bound[handler] = handler(value)
+        return instance, functools.partial(function, instance, *args, **kwargs)
+
+    def _route(self, value: typing.Any) -> _DISPATCHED_ALIAS:
+        """Records the method against `value`, dispatching to the handler the fluent API would for its type."""
+        recorder = _Recorder(value)
+        args, kwargs = self.call
+        getattr(recorder, self.name)(*args, **kwargs)
+        if self.position < len(recorder.dispatched):
+            return recorder.dispatched[self.position]
+        return self.handler, self.method, self.args, self.kwargs
+
+
+class _MethodStep:
+    """A check performed by an `Asserto` method which does not dispatch to a handler (mixins, `_is` lookups)."""
+
+    __slots__ = ("label", "name", "args", "kwargs")
+
+    def __init__(self, label: str, name: str, args: tuple, kwargs: dict) -> None:
+        self.label = label
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def bind(self, value: typing.Any, bound: typing.Dict[typing.Any, typing.Any]) -> _BINDING_ALIAS:
+        """Binds the step to an `Asserto` shared by every method step, rebound to each value."""
+        referent = bound.get(Asserto)
+        if referent is None:
+            referent = bound[Asserto] = Asserto(value)
+        # Dynamic `_is` lookups inspect the actual value when looked up, they cannot be bound up front.
+        return referent, functools.partial(self._perform, referent)
+
+    def _perform(self, referent: Asserto) -> None:
+        getattr(referent, self.name)(*self.args, **self.kwargs)
+
+
+def bind_steps(
+    steps: typing.Sequence[typing.Union[_DispatchStep, _MethodStep]],
+    value: typing.Any,
+    bound: typing.Dict[typing.Any, typing.Any],
+) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Tuple[typing.Tuple[str, typing.Callable[[], typing.Any]], ...]]:
+    """
+    Binds every step for values of the type of `value`, returning the distinct instances to rebind to
+    each value and the (label, call) of each step.  A step which cannot be bound for the type raises
+    when (and only if) it is reached, as the fluent API would.
+    """
+    instances: typing.Dict[int, typing.Any] = {}
+    calls = []
+    for step in steps:
+        try:
+            instance, call = step.bind(value, bound)
+        except (TypeError, ValueError) as exc:
+            calls.append((step.label, functools.partial(_raises, exc)))
+            continue
+        instances[id(instance)] = instance
+        calls.append((step.label, call))
+    return tuple(instances.values()), tuple(calls)
+
+
+class PlanReport:
+    """
+    The aggregate outcome of checking values against a plan.  Values stop being checked at their
+    first failing step, the number of failures is counted per step.
+
+    :param max_failures: The maximum number of failing values (index, value & error) to retain.
+    """
+
+    __slots__ = ("checked", "failed", "counts", "failures", "max_failures")
+
+    def __init__(self, max_failures: int = 10) -> None:
+        self.checked = 0
+        self.failed = 0
+        self.counts: typing.Dict[str, int] = {}
+        self.failures: typing.List[typing.Tuple[int, typing.Any, AssertionError]] = []
+        self.max_failures = max_failures
+
+    @property
+    def ok(self) -> bool:
+        """Checks if every value passed every step."""
+        return not self.failed
+
+    def record(self, index: int, value: typing.Any, label: str, error: AssertionError) -> None:
+        """Register the failure of a value at a step."""
+        self.failed += 1
+        self.counts[label] = self.counts.get(label, 0) + 1
+        if len(self.failures) < self.max_failures:
+            self.failures.append((index, value, error))
+
+    def raise_if_failed(self) -> None:
+        """Raises an AssertionError summarising the report if any value failed."""
+        if self.failed:
+            raise AssertionError(str(self)) from None
+
+    def __str__(self) -> str:
+        lines = [f"{self.failed} of {self.checked} values failed"]
+        lines.extend(f"    {label}: {count}" for label, count in self.counts.items())
+        if self.failures:
+            limits = get_render_limits()
+            lines.append(f"first {len(self.failures)} (index, value): failure")
+            lines.extend(f"    ({index}, {limits.repr(value)}): {error}" for index, value, error in self.failures)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(checked={self.checked}, failed={self.failed})"
+
+
+class Plan:
+    """
+    A chain of assertions compiled once and applied to many values, for example:
+
+        Example:
+            Usage::
+                plan = asserto.plan().is_instance(int).is_between(0, 10).is_not_zero()
+                plan.check_many(values).raise_if_failed()
+
+    Chained assertions are recorded through the `Asserto` methods themselves, so a plan always
+    performs the same checks as the fluent API; every step is resolved to the underlying handler
+    function (per type of value) up front, skipping the fluent machinery for every value.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self) -> None:
+        self.steps: typing.List[typing.Union[_DispatchStep, _MethodStep]] = []
+
+    def __getattr__(self, item: str) -> typing.Callable[..., Plan]:
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return functools.partial(self._compile, item)
+
+    def _compile(self, name: str, *args: typing.Any, **kwargs: typing.Any) -> Plan:
+        label = _label(name, args, kwargs)
+        recorder = _Recorder()
+        method = None if name.endswith("_is") else getattr(recorder, name, None)
+        if callable(method):
+            try:
+                method(*args, **kwargs)
+            except (TypeError, ValueError):
+                # Mixin assertions validate the actual value up front; they become method steps.
+                recorder.dispatched.clear()
+        if recorder.dispatched:
+            for position, dispatched in enumerate(recorder.dispatched):
+                self.steps.append(_DispatchStep(label, name, (args, kwargs), position, dispatched))
+        elif name in _INSTRUCTIONS or name.endswith("_is"):
+            self.steps.append(_MethodStep(label, name, args, kwargs))
+        else:
+            raise AttributeError(f"{name} cannot be used in a plan, it is not an assertion method")
+        return self
+
+    def check(self, value: typing.Any) -> PlanReport:
+        """Checks a single value against the plan."""
+        return self.check_many((value,))
+
+    def check_many(self, values: typing.Iterable[typing.Any], max_failures: int = 10) -> PlanReport:
+        """
+        Checks every value against the plan in a single pass, values are consumed lazily.
+
+        :param values: The values to check, any iterable.
+        :param max_failures: The maximum number of failing values (index, value & error) retained in the report.
+        """
+        report = PlanReport(max_failures)
+        # Handler instances (and the `Asserto` for method steps) rebound to every value, local to this call.
+        bound: typing.Dict[typing.Any, typing.Any] = {}
+        bindings: typing.Dict[type, typing.Any] = {}
+        index = -1
+        for index, value in enumerate(values):
+            binding = bindings.get(type(value))
+            if binding is None:
+                binding = bindings[type(value)] = bind_steps(self.steps, value, bound)
+            instances, calls = binding
+            for instance in instances:
+                instance.actual = value
+            label = None
+            try:
+                for label, call in calls:
+                    call()
+            except AssertionError as exc:
+                report.record(index, value, label, exc)  # type: ignore[arg-type]
+        report.checked = index + 1
+        return report
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(step.label for step in self.steps)})"
+
+
+def _label(name: str, args: tuple, kwargs: dict) -> str:
+    arguments = [repr(arg) for arg in args] + [f"{key}={value!r}" for key, value in kwargs.items()]
+    return f"{name}({', '.join(arguments)})"
@@ -0,0 +1,101 @@
+"""
+Pooling of `Asserto` instances for hot loops.  Reuse is explicit and scoped: the instances handed out
+while a pool is entered are only reused once the scope they were handed out in has exited.
+"""
+from __future__ import annotations
+
+import typing
+
+from ._asserto import Asserto
+from ._dispatch import asserter_for
+
+# The state of each thread, created on first entering a pool: the entered `pool`, the instances `handed` out
+# in its scopes and the enclosing `pools` & `marks` (where in `handed` each scope starts) of its scopes.
+# `asserto()` checks its `pool`.  Scopes are entered per iteration of a hot loop and allocate nothing.
+local: typing.Any = None
+
+
+def _state() -> typing.Any:
+    global local
+    if local is None:
+        import threading
+
+        local = threading.local()
+    if not hasattr(local, "pools"):
+        local.pool = None
+        local.handed = []
+        local.pools = []
+        local.marks = []
+    return local
+
+
+class Pool:
+    """
+    A small pool of `Asserto` instances, each scope of the pool (entering it) reuses the instances of
+    the previous ones, for example:
+
+        Example:
+            Usage::
+                pool = asserto.pool()
+                for value in values:
+                    with pool:
+                        asserto(value).is_positive()
+
+    While entered, `asserto()` on the same thread draws from the pool, calling the pool itself does
+    the same.  The instances handed out in a scope must not be used once it exits; they are returned
+    to the pool then, unless the scope exits with an exception (whose traceback may reference them).
+    No instance is handed out twice in the same scope.  A pool must not be shared between threads;
+    pooled instances reference the value they were last bound to until reused (or `clear`ed).
+
+    :param size: The maximum number of instances kept, a scope using more allocates the others.
+    """
+
+    __slots__ = ("size", "_instances")
+
+    def __init__(self, size: int = 4) -> None:
+        if size < 1:
+            raise ValueError(f"{size=} must be a positive integer.")
+        self.size = size
+        self._instances: typing.List[Asserto] = []
+
+    def __call__(self, actual: typing.Any, warn_unused: bool = False) -> Asserto:
+        if self._instances:
+            # Through the class: `Asserto.__getattr__` makes every `instance.method` allocate a bound method.
+            instance = Asserto.rebind(self._instances.pop(), actual, warn_unused)
+        else:
+            instance = asserter_for(actual)(actual, warn_unused)
+        state = local
+        if state is not None and state.pool is self:
+            state.handed.append(instance)
+        return instance
+
+    def __enter__(self) -> Pool:
+        state = _state()
+        state.pools.append(state.pool)
+        state.marks.append(len(state.handed))
+        state.pool = self
+        return self
+
+    def __exit__(self, exc_type: typing.Any, exc_value: typing.Any, traceback: typing.Any) -> None:
+        state = local
+        handed = state.handed
+        mark = state.marks.pop()
+        state.pool = state.pools.pop()
+        if exc_type is None:
+            instances = self._instances
+            # Indexing avoids allocating an iterator (or a slice) per scope.
+            index = mark
+            while index < len(handed) and len(instances) < self.size:
+                instance = handed[index]
+                # An instance left inside of its soft context cannot be rebound, it is not reused.
+                if instance._error_handler is None or not instance._error_handler.softly:
+                    instances.append(instance)
+                index += 1
+        del handed[mark:]
+
+    def clear(self) -> None:
+        """Drops the pooled instances, releasing the values they were last bound to."""
+        self._instances.clear()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size}, pooled={len(self._instances)})"
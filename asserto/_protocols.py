@@ -8,6 +8,8 @@ class HasActualValue(Protocol):
     This helps to support static type hinting with the mixins used
     to compose asserto."""
 
+    __slots__ = ()
+
     @property
     def actual(self) -> Any:
         ...
@@ -16,9 +18,20 @@ class HasActualValue(Protocol):
 class CanError(Protocol):
     """A simple interface for something that can raise an AssertionError."""
 
-    def error(self, cause: Union[AssertionError, str]) -> Any:
+    __slots__ = ()
+
+    def error(self, cause: Union[AssertionError, Any, str]) -> Any:
+        ...
+
+
+class CanDispatch(Protocol):
+    """A simple interface for something delegating assertions to handlers."""
+
+    __slots__ = ()
+
+    def _dispatch(self, handler: Any, method: str, *args: Any, **kwargs: Any) -> Any:
         ...
 
 
-class Assertable(HasActualValue, CanError):
-    ...
+class Assertable(HasActualValue, CanError, CanDispatch):
+    __slots__ = ()
@@ -0,0 +1,209 @@
+"""
+Bounded, lazy rendering of values into failure messages.
+"""
+import reprlib
+import typing
+
+# Types where str(obj) is equivalent to repr(obj), rendering them can safely go through `reprlib`.
+_REPR_EQUIVALENT_TYPES = (int, float, complex, list, tuple, dict, set, frozenset, type(None), memoryview)
+
+
+class RenderLimits:
+    """
+    Caps applied when rendering values into failure messages, a `reprlib` style truncation
+    so that failures against huge actual values do not allocate huge messages.
+
+    :param maxstring: The maximum number of characters rendered for strings & bytes.
+    :param maxlevel: The maximum depth rendered for nested containers.
+    :param maxitems: The maximum number of items rendered per container.
+    :param maxother: The maximum number of characters rendered for any other object.
+    :param maxdiffs: The maximum number of differences reported when containers are not equal.
+    """
+
+    def __init__(
+        self, maxstring: int = 1000, maxlevel: int = 6, maxitems: int = 100, maxother: int = 1000, maxdiffs: int = 10
+    ) -> None:
+        self.maxstring = maxstring
+        self.maxlevel = maxlevel
+        self.maxitems = maxitems
+        self.maxother = maxother
+        self.maxdiffs = maxdiffs
+
+    def repr(self, obj: typing.Any) -> str:
+        """Render the bounded equivalent of `repr(obj)`."""
+        return _BoundedRepr(self).repr(obj)
+
+    def str(self, obj: typing.Any) -> str:
+        """Render the bounded equivalent of `str(obj)`."""
+        if isinstance(obj, str):
+            return truncate(obj, self.maxstring)
+        if isinstance(obj, FailureMessage):
+            return obj.render(self)
+        if type(obj) in _REPR_EQUIVALENT_TYPES:
+            return self.repr(obj)
+        return truncate(str(obj), self.maxother)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(maxstring={self.maxstring}, maxlevel={self.maxlevel}, "
+            f"maxitems={self.maxitems}, maxother={self.maxother}, maxdiffs={self.maxdiffs})"
+        )
+
+
+class _BoundedRepr(reprlib.Repr):
+    """A `reprlib.Repr` configured from render limits, which also bounds binary data."""
+
+    def __init__(self, limits: RenderLimits) -> None:
+        super().__init__()
+        self.maxlevel = limits.maxlevel
+        self.maxtuple = self.maxlist = self.maxarray = limits.maxitems
+        self.maxdict = self.maxset = self.maxfrozenset = self.maxdeque = limits.maxitems
+        self.maxstring = limits.maxstring
+        self.maxlong = self.maxother = limits.maxother
+
+    def repr_str(self, x: str, level: int) -> str:
+        return _truncate_repr(x, self.maxstring)
+
+    def repr_bytes(self, x: bytes, level: int) -> str:
+        return _truncate_repr(x, self.maxstring)
+
+    def repr_bytearray(self, x: bytearray, level: int) -> str:
+        return f"bytearray({_truncate_repr(x, self.maxstring)})"
+
+    def repr_memoryview(self, x: memoryview, level: int) -> str:
+        if x.format != "B" or x.ndim != 1:
+            return repr(x)
+        return f"memoryview({_truncate_repr(x, self.maxstring)})"
+
+
+def truncate(value: str, limit: int, placeholder: str = "...") -> str:
+    """Truncates a string to at most `limit` characters, keeping its head and tail."""
+    if len(value) <= limit:
+        return value
+    head = max(0, (limit - len(placeholder)) // 2)
+    tail = max(0, limit - len(placeholder) - head)
+    return value[:head] + placeholder + (value[len(value) - tail :] if tail else "")
+
+
+def _truncate_repr(value: typing.Union[str, bytes, bytearray, memoryview], limit: int) -> str:
+    """Renders the repr of a string (or bytes) keeping only its head & tail, without a full copy."""
+    if len(value) <= limit:
+        return repr(_plain(value))
+    head = max(0, (limit - 3) // 2)
+    tail = max(0, limit - 3 - head)
+    rendered = f"{_plain(value[:head])!r}..."
+    return rendered + repr(_plain(value[len(value) - tail :])) if tail else rendered
+
+
+def _plain(value: typing.Union[str, bytes, bytearray, memoryview]) -> typing.Union[str, bytes]:
+    return bytes(value) if isinstance(value, (bytearray, memoryview)) else value
+
+
+class _Bounded:
+    """Renders a single template value through render limits; the template conversions (`!r`, `!s` or
+    none) call into this, format specs (`{elapsed:.2f}`) apply to the value itself."""
+
+    __slots__ = ("value", "limits")
+
+    def __init__(self, value: typing.Any, limits: RenderLimits) -> None:
+        self.value = value
+        self.limits = limits
+
+    def __repr__(self) -> str:
+        return self.limits.repr(self.value)
+
+    def __str__(self) -> str:
+        return self.limits.str(self.value)
+
+    def __format__(self, spec: str) -> str:
+        return format(self.value, spec) if spec else self.limits.str(self.value)
+
+
+class _BoundedValues:
+    """A mapping of template values, wrapping only the values a template refers to."""
+
+    __slots__ = ("values", "limits")
+
+    def __init__(self, values: typing.Dict[str, typing.Any], limits: RenderLimits) -> None:
+        self.values = values
+        self.limits = limits
+
+    def __getitem__(self, key: str) -> _Bounded:
+        return _Bounded(self.values[key], self.limits)
+
+
+class FailureMessage:
+    """
+    A lazily rendered failure message.  The template is a `str.format` style string, the
+    values are only rendered (bounded by render limits) when the message is read, for example
+    via `str(exc)` or when a soft assertion report is displayed.
+
+    :param template: The message template, `{name}` & `{name!r}` replacement fields are supported.
+    :param values: The values to render into the template.
+    """
+
+    def __init__(self, template: str, **values: typing.Any) -> None:
+        self.template = template
+        self.values = values
+        self.limits: typing.Optional[RenderLimits] = None
+
+    def render(self, limits: typing.Optional[RenderLimits] = None) -> str:
+        """Renders the message, limits bound to the message take precedence over the global limits."""
+        limits = self.limits or limits or get_render_limits()
+        return self.template.format_map(_BoundedValues(self.values, limits))
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return repr(self.render())
+
+
+class LazyAssertionError(AssertionError):
+    """
+    An AssertionError carrying a lazily rendered `FailureMessage`.  The message is only rendered
+    when it is read, `args` and `str()` behave as if the error was created with the rendered string.
+    """
+
+    def __init__(self, message: FailureMessage) -> None:
+        super().__init__(message)
+        self.message = message
+
+    @property  # type: ignore[override]
+    def args(self) -> typing.Tuple[str]:
+        return (str(self.message),)
+
+    @args.setter
+    def args(self, value: typing.Tuple[typing.Any, ...]) -> None:
+        BaseException.args.__set__(self, value)  # type: ignore[attr-defined]
+
+    def __str__(self) -> str:
+        return str(self.message)
+
+    def __repr__(self) -> str:
+        return f"AssertionError({str(self.message)!r})"
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        # The message values may not be picklable, transfer the rendered message instead.
+        return AssertionError, (str(self.message),)
+
+
+def bind_limits(cause: typing.Any, limits: RenderLimits) -> None:
+    """Binds render limits to a (lazy) failure message, or the one carried by an `AssertionError`."""
+    cause = getattr(cause, "message", cause)
+    if isinstance(cause, FailureMessage) and cause.limits is None:
+        cause.limits = limits
+
+
+_render_limits = RenderLimits()
+
+
+def get_render_limits() -> RenderLimits:
+    """Retrieve the global render limits, applied to all failure messages unless overridden."""
+    return _render_limits
+
+
+def set_render_limits(limits: RenderLimits) -> None:
+    """Set the global render limits applied to all failure messages unless overridden."""
+    global _render_limits
+    _render_limits = limits
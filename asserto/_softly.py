@@ -1,36 +1,176 @@
-import pprint
+import heapq
+import itertools
+import operator
+import threading
 import typing
 
+# Orders failures across every container, worker & context; `next()` on a count is atomic.
+_SEQUENCE = itertools.count()
+
+
+class _Bucket:
+    """The failures of a single worker (thread), only ever appended to by the thread owning it."""
+
+    __slots__ = ("entries", "groups", "total")
+
+    def __init__(self) -> None:
+        # [sequence, error, occurrences], appended in sequence order.
+        self.entries: typing.List[typing.List[typing.Any]] = []
+        # message -> entry, only populated when grouping.
+        self.groups: typing.Dict[str, typing.List[typing.Any]] = {}
+        self.total = 0
+
 
 class AssertionErrorContainer:
     """
     An object for storing AssertionError instances when asserto is being used in a soft
     context.  Instances are stored in an underlying sequence and this provides an improved
     API for registering and displaying the errors in a meaningful manner.
+
+    Failures are stored in a bucket per thread so concurrent workers never contend on a lock,
+    every failure is tagged with a global sequence number so the report is always in the order
+    the failures occurred.  Containers of nested contexts are merged into their parent on exit.
+
+    :param max_stored: (Optional) The maximum number of errors to retain, further failures are only counted.
+    :param fail_after: (Optional) The number of failures after which the soft context should fail early.
+    :param group_identical: Group failures with identical messages, displaying their number of occurrences.
     """
 
-    def __init__(self) -> None:
-        self.errors: typing.List[AssertionError] = []
+    __slots__ = (
+        "max_stored",
+        "fail_after",
+        "group_identical",
+        "owner",
+        "_buckets",
+        "_children",
+        "_stored",
+        "_failures",
+    )
+
+    def __init__(
+        self,
+        max_stored: typing.Optional[int] = None,
+        fail_after: typing.Optional[int] = None,
+        group_identical: bool = False,
+    ) -> None:
+        self.max_stored = max_stored
+        self.fail_after = fail_after
+        self.group_identical = group_identical
+        # The thread which entered the context, other threads fall back to the container.
+        self.owner = threading.get_ident()
+        self._buckets: typing.Dict[int, _Bucket] = {}
+        self._children: typing.List[AssertionErrorContainer] = []
+        self._stored = itertools.count()
+        self._failures = itertools.count(1)
+
+    def owned_by_current_thread(self) -> bool:
+        """Checks if the current thread entered the context."""
+        return self.owner == threading.get_ident()
 
     def register_error(self, error: AssertionError) -> None:
-        self.errors.append(error)
+        self.store(error)
 
     def __bool__(self) -> bool:
         """Allow the container to be checked that some errors have occurred."""
-        return bool(self.errors)
+        return bool(self.total)
 
     def __len__(self) -> int:
-        return len(self.errors)
+        return sum(1 for _ in self._entries())
+
+    @property
+    def errors(self) -> typing.List[AssertionError]:
+        """The stored errors, in the order in which they occurred."""
+        return [error for _, error, _ in self._entries()]
+
+    @property
+    def total(self) -> int:
+        """The number of failures which occurred, including those of merged contexts."""
+        return sum(bucket.total for bucket in list(self._buckets.values())) + sum(
+            child.total for child in list(self._children)
+        )
+
+    @property
+    def dropped(self) -> int:
+        """The number of failures which were counted but not stored (or grouped) due to `max_stored`."""
+        return self.total - sum(occurrences for _, _, occurrences in self._entries())
 
     def clear(self) -> None:
         """Reset all soft failures."""
-        self.errors.clear()
+        self._buckets.clear()
+        self._children.clear()
+        self._stored = itertools.count()
+        self._failures = itertools.count(1)
+
+    def store(self, error: AssertionError) -> bool:
+        """
+        Register a new AssertionError, safe to call from many threads (and tasks) at once.
 
-    def store(self, error: AssertionError) -> None:
-        """Register a new AssertionError."""
-        self.errors.append(error)
+        :return: `True` if this failure reached the fail fast threshold.
+        """
+        threshold_reached = next(self._failures) == self.fail_after
+        bucket = self._bucket()
+        bucket.total += 1
+        key = str(error) if self.group_identical else None
+        if key is not None:
+            entry = bucket.groups.get(key)
+            if entry is not None:
+                entry[2] += 1
+                return threshold_reached
+        if self.max_stored is not None and next(self._stored) >= self.max_stored:
+            return threshold_reached
+        entry = [next(_SEQUENCE), error, 1]
+        bucket.entries.append(entry)
+        if key is not None:
+            bucket.groups[key] = entry
+        return threshold_reached
+
+    def merge(self, child: "AssertionErrorContainer") -> None:
+        """
+        Merge the failures of a nested context, they are reported in the order they occurred.  The
+        `max_stored` of this container applies to the merged failures, further failures are only counted.
+        """
+        self._children.append(child)
+
+    def _bucket(self) -> _Bucket:
+        ident = threading.get_ident()
+        bucket = self._buckets.get(ident)
+        if bucket is None:
+            bucket = self._buckets.setdefault(ident, _Bucket())
+        return bucket
+
+    def _entries(self) -> typing.Iterator[typing.List[typing.Any]]:
+        """Every stored entry (of this container & merged ones), ordered by sequence."""
+        sources = [bucket.entries for bucket in list(self._buckets.values())]
+        sources.extend(child._entries() for child in list(self._children))
+        entries: typing.Iterator[typing.List[typing.Any]] = heapq.merge(*sources, key=operator.itemgetter(0))
+        if self.group_identical:
+            entries = iter(_regroup(entries))
+        if self.max_stored is not None and self._children:
+            # Merged containers store up to their own limit, only the first failures overall are kept.
+            entries = itertools.islice(entries, self.max_stored)
+        return entries
 
     def __repr__(self) -> str:
         # Todo: Outline the passes as well as the failures.
         # Todo: Improved tracebacks etc.
-        return f"{len(self.errors)} Soft Assertion Failures\n" + pprint.pformat(self.errors, indent=4)
+        # Rendered in time linear to the number of stored errors.
+        lines = [
+            repr(error) + (f" (x{occurrences})" if occurrences > 1 else "") for _, error, occurrences in self._entries()
+        ]
+        report = f"{self.total} Soft Assertion Failures\n"
+        report += f"[{''.join(lines)}]" if len(lines) <= 1 else "[   " + ",\n    ".join(lines) + "]"
+        if self.dropped:
+            report += f"\n... {self.dropped} further failures were not stored (max_stored={self.max_stored})"
+        return report
+
+
+def _regroup(entries: typing.Iterable[typing.List[typing.Any]]) -> typing.List[typing.List[typing.Any]]:
+    """Combines identical failures grouped independently by different workers, keeping the first."""
+    groups: typing.Dict[str, typing.List[typing.Any]] = {}
+    for sequence, error, occurrences in entries:
+        group = groups.get(str(error))
+        if group is None:
+            groups[str(error)] = [sequence, error, occurrences]
+        else:
+            group[2] += occurrences
+    return list(groups.values())
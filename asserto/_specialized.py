@@ -0,0 +1,259 @@
+"""
+Type specialized asserters, chosen by the `asserto()` factory per category of value: numbers, strings,
+bytes like values & other collections.  Their assertions call the handler functions directly, with a
+handler created without re-validating the value (the handlers are known to accept its type) and without
+resolving the function per call.  Behaviour is identical to `Asserto`: values of another category (after
+`rebind`, or when polling), of types which were not cached and profiled assertions take the generic path.
+"""
+from __future__ import annotations
+
+import collections.abc
+import numbers
+import types
+import typing
+
+from . import _instrumentation
+from ._asserto import Asserto
+from ._const import Methods
+from ._dispatch import ASSERTER_CACHE_SIZE
+from ._dispatch import _asserter_cache
+from ._types import BYTES_LIKE
+from ._types import BYTES_LIKE_ALIAS
+from ._types import RE_FLAGS_ALIAS
+from ._types import RE_PATTERN_ALIAS
+from .handlers import Handler
+from .handlers._base import BaseHandler
+from .handlers._bytes import BytesHandler
+from .handlers._iterables import IterableHandler
+from .handlers._numeric import NumberHandler
+from .handlers._regex import RegexHandler
+
+
+def _direct(
+    referent: _Specialized,
+    handler: typing.Type[Handler],
+    method: str,
+    function: typing.Callable[..., typing.Any],
+    *args: typing.Any,
+) -> Asserto:
+    """The equivalent of `Asserto._dispatch`, for a handler known to accept the type of the value."""
+    __tracebackhide__ = True  # pytest magic.
+    actual = referent._actual
+    if _asserter_cache.get(type(actual)) is not type(referent) or _instrumentation.profiler is not None:
+        return referent._dispatch(handler, method, *args)
+    referent._triggered = True
+    instances = referent._handlers
+    if instances is None:
+        instances = referent._handlers = {}
+    handler_instance = instances.get(handler)
+    if handler_instance is None:
+        handler_instance = instances[handler] = handler.trusted(actual)
+    elif handler_instance.actual is not actual:
+        handler_instance.actual = actual
+    try:
+        function(handler_instance, *args)
+    except AssertionError as exc:  # noqa
+        if referent.description:
+            exc = AssertionError(referent.description)
+        referent.error(exc)
+    return referent
+
+
+class _Specialized(Asserto):
+    """The assertions every specialized asserter performs directly, those of the `BaseHandler`."""
+
+    __slots__ = ()
+
+    # The handlers which must accept the type of value, checked once per type when the asserter is chosen.
+    requires: typing.Tuple[typing.Type[Handler], ...] = (BaseHandler,)
+
+    def is_true(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_TRUE, BaseHandler.is_true)
+
+    def is_truthy(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_TRUTHY, BaseHandler.is_truthy)
+
+    def is_false(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_FALSE, BaseHandler.is_false)
+
+    def is_falsy(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_FALSY, BaseHandler.is_falsy)
+
+    def is_equal_to(self, other: typing.Any) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_EQUAL_TO, BaseHandler.is_equal_to, other)
+
+    equals = is_equal_to
+
+    def is_not_equal_to(self, other: typing.Any) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_NOT_EQUAL_TO, BaseHandler.is_not_equal_to, other)
+
+    def is_instance(self, cls_or_tuple: typing.Union[typing.Any, typing.Iterable[typing.Any]]) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_INSTANCE, BaseHandler.is_instance, cls_or_tuple)
+
+    def has_same_identity_as(self, other: typing.Any) -> Asserto:
+        return _direct(self, BaseHandler, Methods.HAS_SAME_IDENTITY_AS, BaseHandler.has_same_identity_as, other)
+
+    def does_not_have_same_identity_as(self, other: typing.Any) -> Asserto:
+        return _direct(
+            self,
+            BaseHandler,
+            Methods.DOES_NOT_HAVE_SAME_IDENTITY_AS,
+            BaseHandler.does_not_have_same_identity_as,
+            other,
+        )
+
+    def is_none(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_NONE, BaseHandler.is_none)
+
+    def is_not_none(self) -> Asserto:
+        return _direct(self, BaseHandler, Methods.IS_NOT_NONE, BaseHandler.is_not_none)
+
+
+class NumberAsserto(_Specialized):
+    """The asserter of numbers."""
+
+    __slots__ = ()
+
+    requires = (BaseHandler, NumberHandler)
+
+    def is_zero(self) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_ZERO, NumberHandler.is_zero)
+
+    def is_not_zero(self) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_NOT_ZERO, NumberHandler.is_not_zero)
+
+    def is_greater_than(self, other: float) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_GREATER_THAN, NumberHandler.is_greater_than, other)
+
+    is_more_than = is_greater_than
+
+    def is_lesser_than(self, other: float) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_LESSER_THAN, NumberHandler.is_lesser_than, other)
+
+    is_less_than = is_lesser_than
+
+    def is_positive(self) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_POSITIVE, NumberHandler.is_positive)
+
+    def is_negative(self) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_NEGATIVE, NumberHandler.is_negative)
+
+    def is_between(self, low: float, high: float, inclusive: bool = False) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_BETWEEN, NumberHandler.is_between, low, high, inclusive)
+
+    def is_not_between(self, low: float, high: float, inclusive: bool = False) -> Asserto:
+        return _direct(self, NumberHandler, Methods.IS_NOT_BETWEEN, NumberHandler.is_not_between, low, high, inclusive)
+
+
+class CollectionAsserto(_Specialized):
+    """The asserter of sized collections (mappings, sequences, sets...), which are never iterators."""
+
+    __slots__ = ()
+
+    requires = (BaseHandler, IterableHandler)
+
+    def has_length(self, expected: int) -> Asserto:
+        return _direct(self, BaseHandler, Methods.HAS_LENGTH, BaseHandler.has_length, expected)
+
+    def is_empty(self) -> Asserto:
+        return _direct(self, IterableHandler, Methods.IS_EMPTY, IterableHandler.is_empty)
+
+    def is_not_empty(self) -> Asserto:
+        return _direct(self, IterableHandler, Methods.IS_NOT_EMPTY, IterableHandler.is_not_empty)
+
+    def contains(self, item: typing.Any) -> Asserto:
+        return _direct(self, IterableHandler, Methods.CONTAINS, IterableHandler.contains, item)
+
+    def does_not_contain(self, item: typing.Any) -> Asserto:
+        return _direct(self, IterableHandler, Methods.DOES_NOT_CONTAIN, IterableHandler.does_not_contain, item)
+
+
+class _SearchableAsserto(CollectionAsserto):
+    """The assertions of values searched by regular expressions, strings and bytes like values."""
+
+    __slots__ = ()
+
+    requires = (BaseHandler, IterableHandler, RegexHandler)
+
+    def match(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
+        return _direct(self, RegexHandler, Methods.MATCH, RegexHandler.match, pattern, flags)
+
+    def search(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
+        return _direct(self, RegexHandler, Methods.SEARCH, RegexHandler.search, pattern, flags)
+
+    def fullmatch(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
+        return _direct(self, RegexHandler, Methods.FULLMATCH, RegexHandler.fullmatch, pattern, flags)
+
+    def findall(self, pattern: RE_PATTERN_ALIAS, count: int, flags: RE_FLAGS_ALIAS = 0) -> Asserto:
+        return _direct(self, RegexHandler, Methods.FINDALL, RegexHandler.findall, pattern, count, flags)
+
+
+class StrAsserto(_SearchableAsserto):
+    """The asserter of strings."""
+
+    __slots__ = ()
+
+
+class BytesAsserto(_SearchableAsserto):
+    """
+    The asserter of bytes like values, which are compared without copying them.  Values of another type
+    are asserted as `Asserto` does, by the handler it chooses for them.
+    """
+
+    __slots__ = ()
+
+    requires = (BaseHandler, IterableHandler, RegexHandler, BytesHandler)
+
+    def is_equal_to(self, other: typing.Any) -> Asserto:
+        if _asserter_cache.get(type(self._actual)) is not type(self):
+            return Asserto.is_equal_to(self, other)
+        return _direct(self, BytesHandler, Methods.IS_EQUAL_TO, BytesHandler.is_equal_to, other)
+
+    equals = is_equal_to
+
+    def starts_with(self, prefix: BYTES_LIKE_ALIAS) -> Asserto:
+        if _asserter_cache.get(type(self._actual)) is not type(self) or not isinstance(prefix, BYTES_LIKE):
+            return Asserto.starts_with(self, prefix)
+        return _direct(self, BytesHandler, Methods.STARTS_WITH, BytesHandler.starts_with, prefix)
+
+    def ends_with(self, suffix: BYTES_LIKE_ALIAS) -> Asserto:
+        if _asserter_cache.get(type(self._actual)) is not type(self) or not isinstance(suffix, BYTES_LIKE):
+            return Asserto.ends_with(self, suffix)
+        return _direct(self, BytesHandler, Methods.ENDS_WITH, BytesHandler.ends_with, suffix)
+
+    def has_slice(self, start: typing.Optional[int], stop: typing.Optional[int], expected: BYTES_LIKE_ALIAS) -> Asserto:
+        return _direct(self, BytesHandler, Methods.HAS_SLICE, BytesHandler.has_slice, start, stop, expected)
+
+
+def _family(actual: typing.Any) -> typing.Optional[typing.Type[_Specialized]]:
+    if isinstance(actual, str):
+        return StrAsserto
+    if isinstance(actual, BYTES_LIKE):
+        return BytesAsserto
+    if isinstance(actual, numbers.Number) and not isinstance(actual, bool):
+        return NumberAsserto
+    if isinstance(actual, collections.abc.Collection) and not isinstance(actual, collections.abc.Iterator):
+        return CollectionAsserto
+    return None
+
+
+def specialize(actual: typing.Any) -> typing.Type[Asserto]:
+    """
+    Choose (and cache) the asserter class for the type of `actual`, the class of its category.  Handlers
+    accept (or reject) values by type only, so whether they accept a type is decided by the first value
+    seen.  At most `ASSERTER_CACHE_SIZE` types are cached, values of other types take the generic path.
+    """
+    family = _family(actual)
+    asserter: typing.Type[Asserto] = Asserto
+    if family is not None and all(handler.accepts(actual) for handler in family.requires):
+        asserter = family
+    if len(_asserter_cache) < ASSERTER_CACHE_SIZE:
+        return _asserter_cache.setdefault(type(actual), asserter)
+    return asserter
+
+
+# The specialized assertions are documented by their generic counterparts.
+for _asserter in (_Specialized, NumberAsserto, CollectionAsserto, _SearchableAsserto, BytesAsserto):
+    for _name, _member in vars(_asserter).items():
+        if isinstance(_member, types.FunctionType) and not _name.startswith("_"):
+            _member.__doc__ = getattr(Asserto, _name).__doc__
@@ -1,7 +1,13 @@
-import re
 import typing
 
+if typing.TYPE_CHECKING:
+    # Patterns are compiled on first use, `re` is not imported by `import asserto`.
+    import re
+
 EXC_TYPES_ALIAS = typing.Union[typing.Type[BaseException], typing.Iterable[typing.Type[BaseException]]]
 CALLABLE_ALIAS = typing.Callable[[typing.Any], typing.Any]
-RE_FLAGS_ALIAS = typing.Union[int, re.RegexFlag]
-RE_PATTERN_ALIAS = typing.Union[str, typing.Pattern[str]]
+RE_FLAGS_ALIAS = typing.Union[int, "re.RegexFlag"]
+RE_PATTERN_ALIAS = typing.Union[str, bytes, typing.Pattern[str], typing.Pattern[bytes]]
+BYTES_LIKE_ALIAS = typing.Union[bytes, bytearray, memoryview]
+# The types of bytes like values, asserted through memoryviews of them.
+BYTES_LIKE = (bytes, bytearray, memoryview)
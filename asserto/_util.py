@@ -1,3 +1,5 @@
+import collections.abc
+import itertools
 import typing
 
 T = typing.TypeVar("T")
@@ -39,3 +41,32 @@ def is_namedtuple_like(obj: typing.Any) -> bool:
     if not isinstance(fields, tuple):
         return False
     return all(isinstance(f, str) for f in fields)
+
+
+MISSING = object()
+
+
+def last(iterable: typing.Iterable[T], default: typing.Any = None) -> typing.Any:
+    """
+    Retrieve the last element of an iterable without materializing it.  Sequences are indexed
+    directly, anything else is streamed through holding only a single element at a time.
+    :param iterable: The iterable to retrieve the last element of.
+    :param default: A value to return if the iterable was empty.
+    """
+    if isinstance(iterable, collections.abc.Sequence):
+        return iterable[-1] if len(iterable) else default
+    tail = collections.deque(iterable, maxlen=1)
+    return tail[0] if tail else default
+
+
+def count_up_to(iterable: typing.Iterable[T], limit: int) -> int:
+    """
+    Count the elements of an iterable, stopping once the count exceeds `limit` so that at
+    most `limit + 1` elements are ever consumed.
+    :param iterable: The iterable to count the elements of.
+    :param limit: The count after which counting can stop.
+    """
+    count = 0
+    for count, _ in enumerate(itertools.islice(iterable, limit + 1), start=1):
+        pass
+    return count
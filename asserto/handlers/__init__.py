@@ -1,6 +1,45 @@
-from ._base import BaseHandler
+import importlib
+import typing
+
 from ._handler import Handler
-from ._numeric import NumberHandler
-from ._regex import RegexHandler
 
-__all__ = ("RegexHandler", "BaseHandler", "NumberHandler", "Handler")
+if typing.TYPE_CHECKING:
+    from ._base import BaseHandler
+    from ._bytes import BytesHandler
+    from ._elementwise import ElementwiseNumberHandler
+    from ._iterables import IterableHandler
+    from ._numeric import NumberHandler
+    from ._regex import RegexHandler
+
+# Handlers are imported on first use, most test modules only ever dispatch to a few of them.
+_LAZY_HANDLERS = {
+    "BaseHandler": "._base",
+    "BytesHandler": "._bytes",
+    "ElementwiseNumberHandler": "._elementwise",
+    "IterableHandler": "._iterables",
+    "NumberHandler": "._numeric",
+    "RegexHandler": "._regex",
+}
+
+__all__ = (
+    "RegexHandler",
+    "BaseHandler",
+    "BytesHandler",
+    "NumberHandler",
+    "Handler",
+    "ElementwiseNumberHandler",
+    "IterableHandler",
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module = _LAZY_HANDLERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    handler = globals()[name] = getattr(importlib.import_module(module, __name__), name)
+    return handler
+
+
+def __dir__() -> typing.List[str]:
+    return sorted([*globals(), *_LAZY_HANDLERS])
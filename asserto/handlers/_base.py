@@ -1,5 +1,6 @@
 import typing
 
+from .._diff import describe_difference
 from ._handler import Handler
 
 
@@ -8,6 +9,8 @@ class BaseHandler(Handler):
     A handler for all objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, actual: typing.Any) -> None:
         super().__init__(actual)
 
@@ -16,60 +19,62 @@ class BaseHandler(Handler):
         Asserts the actual value is explicitly True.
         """
         if not self.actual:
-            raise AssertionError(f"{self.actual} was not True")
+            raise self.failure("{actual} was not True")
 
     def is_truthy(self) -> None:
         """
         Asserts the actual value is True in a boolean context.
         """
         if not bool(self.actual):
-            raise AssertionError(f"{self.actual} was not truthy")
+            raise self.failure("{actual} was not truthy")
 
     def is_false(self) -> None:
         """
         Asserts the actual value is explicitly False.
         """
         if self.actual:
-            raise AssertionError(f"{self.actual} was not False")
+            raise self.failure("{actual} was not False")
 
     def is_falsy(self) -> None:
         """
         Asserts the actual value is False in a boolean context.
         """
         if bool(self.actual):
-            raise AssertionError(f"{self.actual} was not falsy")
+            raise self.failure("{actual} was not falsy")
 
     def is_equal_to(self, other: typing.Any) -> None:
         if self.actual != other:
-            raise AssertionError(f"{self.actual} is not equal to: {other}")
+            # Where the values differ is only computed when the message is read.
+            diff = describe_difference(self.actual, other)
+            raise self.failure("{actual} is not equal to: {other}{diff}", other=other, diff=diff)
 
     def is_not_equal_to(self, other: typing.Any) -> None:
         if self.actual == other:
-            raise AssertionError(f"{self.actual} was equal to: {other}")
+            raise self.failure("{actual} was equal to: {other}", other=other)
 
     def has_length(self, expected: int) -> None:
         if not isinstance(expected, int) or expected < 0:
             raise ValueError(f"{expected} must be an int and greater than 0")
 
         if len(self.actual) != expected:
-            raise AssertionError(f"Length of: {self.actual!r} was not equal to: {expected!r}")
+            raise self.failure("Length of: {actual!r} was not equal to: {expected!r}", expected=expected)
 
     def is_instance(self, *other: typing.Any) -> None:
         if not isinstance(self.actual, other):
-            raise AssertionError(f"{self.actual} was not an instance of: {other}")
+            raise self.failure("{actual} was not an instance of: {other}", other=other)
 
     def has_same_identity_as(self, other: typing.Any) -> None:
         if self.actual is not other:
-            raise AssertionError(f"{self.actual} does not share identity with: {other}")
+            raise self.failure("{actual} does not share identity with: {other}", other=other)
 
     def does_not_have_same_identity_as(self, other: typing.Any) -> None:
         if self.actual is other:
-            raise AssertionError(f"{self.actual} shares identity with: {other}")
+            raise self.failure("{actual} shares identity with: {other}", other=other)
 
     def is_none(self) -> None:
         if self.actual is not None:
-            raise AssertionError(f"{self.actual} is not None")
+            raise self.failure("{actual} is not None")
 
     def is_not_none(self) -> None:
         if self.actual is None:
-            raise AssertionError(f"{self.actual} is None")
+            raise self.failure("{actual} is None")
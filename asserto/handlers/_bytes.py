@@ -0,0 +1,164 @@
+import typing
+
+from .._diff import TEXT_CHUNK_SIZE
+from .._diff import TextDiff
+from .._diff import byte_view
+from .._diff import common_prefix
+from .._diff import describe_difference
+from .._rendering import RenderLimits
+from .._types import BYTES_LIKE
+from .._types import BYTES_LIKE_ALIAS
+from ._handler import Handler
+
+# Memoryviews of at most this many bytes compare faster item by item than through copies of their chunks.
+_ITEMWISE_SIZE = 256
+
+
+def _is_flat(value: typing.Any) -> bool:
+    """Checks if a value is a one dimensional buffer of unsigned bytes, which compare as bytes."""
+    if not isinstance(value, memoryview):
+        return isinstance(value, (bytes, bytearray))
+    return value.format == "B" and value.ndim == 1
+
+
+def _is_contiguous(value: typing.Any) -> bool:
+    return not isinstance(value, memoryview) or value.c_contiguous
+
+
+def _validate(value: typing.Any, name: str) -> None:
+    if not _is_flat(value):
+        raise TypeError(f"{name} must be bytes, a bytearray or a memoryview of bytes, not: {type(value)}")
+    if not len(value):
+        raise ValueError(f"{name} must not be empty.")
+
+
+def _equal(
+    actual: typing.Any, expected: typing.Any, start: typing.Optional[int] = None, stop: typing.Optional[int] = None
+) -> bool:
+    """
+    Compares the bytes of `actual[start:stop]` to those of expected, through views only alive while comparing;
+    a failure raised by the caller never holds an export of a bytearray (which could no longer be resized).
+    """
+    view = byte_view(actual)[start:stop]
+    if len(view) != len(expected):
+        return False
+    if len(view) <= TEXT_CHUNK_SIZE:
+        return view.tobytes().startswith(byte_view(expected))
+    return common_prefix(view, expected) == len(view)
+
+
+def _starts_with(actual: typing.Any, prefix: typing.Any) -> bool:
+    if not isinstance(actual, memoryview) and _is_contiguous(prefix):
+        # Bytes & bytearrays check a prefix (a contiguous buffer of any kind) in C.
+        return actual.startswith(prefix)
+    return _equal(actual, prefix, 0, len(prefix))
+
+
+def _ends_with(actual: typing.Any, suffix: typing.Any) -> bool:
+    if not isinstance(actual, memoryview) and _is_contiguous(suffix):
+        return actual.endswith(suffix)
+    return _equal(actual, suffix, -len(suffix))
+
+
+class BytesDiff(TextDiff):
+    """
+    A `TextDiff` of buffers which always reports where they first differ, differing bytes are hard to
+    spot in their rendering even when the values are short.  Views of the values are only created while
+    rendering.
+
+    :param actual: The actual value.
+    :param expected: The expected value, of `actual[start:stop]`.
+    :param start: The start of the slice of the actual value compared.
+    :param stop: The stop of the slice of the actual value compared.
+    """
+
+    def __init__(
+        self,
+        actual: typing.Any,
+        expected: typing.Any,
+        start: typing.Optional[int] = None,
+        stop: typing.Optional[int] = None,
+    ) -> None:
+        super().__init__(actual, expected)
+        self.start = start
+        self.stop = stop
+
+    def render(self, limits: typing.Optional[RenderLimits] = None) -> str:
+        view = byte_view(self.values["actual"])
+        start, stop, _ = slice(self.start, self.stop).indices(len(view))
+        if start == 0 and stop == len(view):
+            diff = super().render(limits)
+            if diff:
+                return diff
+        return f"\nfirst difference at index {start + common_prefix(view[start:stop], self.values['expected'])}"
+
+
+class BytesHandler(Handler):
+    """
+    A handler for bytes like values: bytes, bytearray & memoryview.  Values are read through memoryviews
+    of them and compared a chunk at a time, a large buffer is never copied as a whole.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, actual: BYTES_LIKE_ALIAS) -> None:
+        super().__init__(actual)
+        self._enforce_is_bytes_like()
+
+    def starts_with(self, prefix: BYTES_LIKE_ALIAS) -> None:
+        _validate(prefix, "prefix")
+        actual = self.actual
+        if not _starts_with(actual, prefix):
+            raise self.failure(
+                "{actual} did not begin with prefix={prefix!r}{diff}",
+                prefix=prefix,
+                diff=TextDiff(actual, prefix, TextDiff.PREFIX),
+            )
+
+    def ends_with(self, suffix: BYTES_LIKE_ALIAS) -> None:
+        _validate(suffix, "suffix")
+        actual = self.actual
+        if not _ends_with(actual, suffix):
+            raise self.failure(
+                "Expected `{actual}` to end with suffix={suffix!r} but it did not.{diff}",
+                suffix=suffix,
+                diff=TextDiff(actual, suffix, TextDiff.SUFFIX),
+            )
+
+    def is_equal_to(self, other: typing.Any) -> None:
+        actual = self.actual
+        # Bytes & bytearrays compare in C, memoryviews item by item; large views are compared a chunk at a time.
+        if isinstance(actual, memoryview) or isinstance(other, memoryview):
+            if len(actual) > _ITEMWISE_SIZE and _is_flat(actual) and _is_flat(other):
+                equal = _equal(actual, other)
+            else:
+                equal = actual == other
+        else:
+            equal = actual == other
+        if not equal:
+            if _is_flat(actual) and _is_flat(other):
+                diff: typing.Any = BytesDiff(actual, other)
+            else:
+                # Formatted views, and values which are not bytes, compare by their items.
+                diff = describe_difference(actual, other)
+            raise self.failure("{actual} is not equal to: {other}{diff}", other=other, diff=diff)
+
+    def has_slice(self, start: typing.Optional[int], stop: typing.Optional[int], expected: BYTES_LIKE_ALIAS) -> None:
+        if not _is_flat(expected):
+            raise TypeError(f"expected must be bytes, a bytearray or a memoryview of bytes, not: {type(expected)}")
+        if not _equal(self.actual, expected, start, stop):
+            raise self.failure(
+                "{actual}[{start}:{stop}] was not equal to: {expected!r}{diff}",
+                start="" if start is None else start,
+                stop="" if stop is None else stop,
+                expected=expected,
+                diff=BytesDiff(self.actual, expected, start, stop),
+            )
+
+    def _enforce_is_bytes_like(self) -> None:
+        """
+        Enforces that the actual value is bytes like.  Asserto is handling these type errors as part of
+        dispatching to rewrite and raise something more appropriate.
+        """
+        if not isinstance(self.actual, BYTES_LIKE):
+            raise ValueError
@@ -0,0 +1,149 @@
+import importlib
+import typing
+
+from .._rendering import FailureMessage
+from .._rendering import LazyAssertionError
+from ._handler import Handler
+
+# A predicate returning the elements which pass; written only with comparisons, `&` and `|` so
+# the same predicate applies to a single python number or a whole NumPy array at once.
+PREDICATE_ALIAS = typing.Callable[[typing.Any], typing.Any]
+
+_numpy: typing.Any = None
+
+
+def _load_numpy() -> typing.Any:
+    """Import NumPy on first use if it is installed; elementwise checks fall back to pure python."""
+    global _numpy
+    if _numpy is None:
+        try:
+            _numpy = importlib.import_module("numpy")
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+class ElementwiseNumberHandler(Handler):
+    """
+    A Handler for asserting numeric checks against every element of a sequence, iterable or
+    buffer (`array.array`, `memoryview`, NumPy arrays etc).  NumPy arrays and buffer protocol
+    objects are evaluated in a single vectorized pass when NumPy is installed, everything else
+    in a single pure python pass.
+
+    Failures report the number of offending elements alongside the first few indices and values.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, actual: typing.Iterable[float]) -> None:
+        super().__init__(actual)
+        self._enforce_is_iterable()
+
+    def is_zero(self, report: int = 10) -> None:
+        """Asserts that every element is equal to 0."""
+        self._check(lambda v: v == 0, "equal to 0", report)
+
+    def is_not_zero(self, report: int = 10) -> None:
+        """Asserts that no element is equal to 0."""
+        self._check(lambda v: v != 0, "not equal to 0", report)
+
+    def is_positive(self, report: int = 10) -> None:
+        """Asserts that every element is greater than 0."""
+        self._check(lambda v: v > 0, "greater than 0", report)
+
+    def is_negative(self, report: int = 10) -> None:
+        """Asserts that every element is lesser than 0."""
+        self._check(lambda v: v < 0, "lesser than 0", report)
+
+    def is_greater_than(self, other: float, report: int = 10) -> None:
+        """Asserts that every element is greater than other."""
+        self._check(lambda v: v > other, f"greater than {other}", report)
+
+    def is_lesser_than(self, other: float, report: int = 10) -> None:
+        """Asserts that every element is lesser than other."""
+        self._check(lambda v: v < other, f"lesser than {other}", report)
+
+    def is_between(self, low: float, high: float, inclusive: bool = False, report: int = 10) -> None:
+        """Asserts that every element is between low and high, mirroring `NumberHandler.is_between`."""
+        if inclusive:
+            self._check(lambda v: (low <= v) & (v <= high), f"inclusively between: ({low}, ..., {high})", report)
+        else:
+            self._check(lambda v: (low < v) & (v < high), f"between ({low}, ..., {high})", report)
+
+    def is_not_between(self, low: float, high: float, inclusive: bool = False, report: int = 10) -> None:
+        """Asserts that no element is between low and high, mirroring `NumberHandler.is_not_between`."""
+        if inclusive:
+            self._check(lambda v: (v <= low) | (v >= high), f"not between ({low}, ..., {high})", report)
+        else:
+            self._check(lambda v: (v < low) | (v > high), f"not between ({low}, ..., {high})", report)
+
+    def _check(self, passes: PREDICATE_ALIAS, expectation: str, report: int) -> None:
+        """Evaluates the predicate against every element and raises a single summarised failure."""
+        array = self._as_array()
+        if array is not None:
+            failures, total, offending = self._vectorized_scan(array, passes, report)
+        else:
+            failures, total, offending = self._python_scan(passes, report)
+        if failures:
+            raise LazyAssertionError(
+                FailureMessage(
+                    "Expected every element to be {expectation} but {failures} of {total} were not, "
+                    "first {shown} (index, value): {offending}",
+                    failures=failures,
+                    total=total,
+                    expectation=expectation,
+                    shown=len(offending),
+                    offending=offending,
+                )
+            )
+
+    def _as_array(self) -> typing.Any:
+        """Retrieve a (zero copy) NumPy view of the actual value, if it is a NumPy array or a buffer."""
+        if isinstance(self.actual, (list, tuple, range)):
+            return None
+        is_array, is_buffer = hasattr(self.actual, "__array__"), _supports_buffer(self.actual)
+        if not (is_array or is_buffer):
+            return None
+        numpy = _load_numpy()
+        if not numpy:
+            return None
+        return numpy.asarray(self.actual if is_array else memoryview(self.actual)).ravel()
+
+    @staticmethod
+    def _vectorized_scan(array: typing.Any, passes: PREDICATE_ALIAS, report: int) -> typing.Tuple[int, int, list]:
+        failing = ~passes(array)
+        indices = failing.nonzero()[0]
+        offending = [(int(i), array[i].item()) for i in indices[:report]]
+        return len(indices), len(array), offending
+
+    def _python_scan(self, passes: PREDICATE_ALIAS, report: int) -> typing.Tuple[int, int, list]:
+        values = self.actual
+        if isinstance(values, memoryview) and values.ndim > 1:
+            values = values.cast("B").cast(values.format)
+        failures = total = 0
+        offending = []
+        for total, value in enumerate(values, start=1):
+            if not passes(value):
+                failures += 1
+                if failures <= report:
+                    offending.append((total - 1, value))
+        return failures, total, offending
+
+    def _enforce_is_iterable(self) -> None:
+        """
+        Enforces that the actual value is an iterable of (what should be) numbers, strings are
+        rejected outright.  Asserto is handling these type errors as part of dispatching.
+        """
+        if isinstance(self.actual, str):
+            raise ValueError
+        if not hasattr(self.actual, "__iter__") and not _supports_buffer(self.actual):
+            raise ValueError
+
+
+def _supports_buffer(value: typing.Any) -> bool:
+    """Checks if a value supports the buffer protocol."""
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
@@ -1,5 +1,9 @@
 import typing
 
+from .._rendering import FailureMessage
+from .._rendering import LazyAssertionError
+from .._rendering import get_render_limits
+
 
 class Handler:
     """
@@ -8,9 +12,31 @@ class Handler:
     internally to wrap and bubble something more user-friendly back to the user.
     """
 
+    __slots__ = ("actual",)
+
     def __init__(self, actual: typing.Any) -> None:
         self.actual = actual
 
+    @classmethod
+    def accepts(cls, actual: typing.Any) -> bool:
+        """Checks if the handler is able to handle the actual value.  Handlers reject values by
+        raising a `ValueError` (directly, or via their descriptors) during instantiation.
+
+        Note: The result of this is cached per type of actual value by the dispatcher, handlers
+        must only accept or reject values based on their type."""
+        try:
+            cls(actual)
+        except ValueError:
+            return False
+        return True
+
+    @classmethod
+    def trusted(cls, actual: typing.Any) -> "Handler":
+        """Creates a handler for a value of a type it is known to accept, skipping its validation."""
+        handler = cls.__new__(cls)
+        handler.actual = actual
+        return handler
+
     @staticmethod
     def dispatch_and_raise(fn, expected, error, *args, **kwargs):
         """
@@ -20,6 +46,11 @@ class Handler:
         if fn(*args, **kwargs) != expected:
             raise AssertionError(error)
 
+    def failure(self, template: str, **values: typing.Any) -> AssertionError:
+        """Builds an AssertionError carrying a lazily rendered message, `{actual}` is always available
+        to the template."""
+        return LazyAssertionError(FailureMessage(template, actual=self.actual, **values))
+
     def raise_if_length_equals(self, length: int = 0) -> typing.Literal[True]:
         """Checks the length of a Sized implementation and raises a ValueError if it is zero.
         Returns `True` if it succeeds to allow chaining of checks in handler subclasses."""
@@ -28,4 +59,4 @@ class Handler:
         return True
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(actual={self.actual!r})"
+        return f"{self.__class__.__name__}(actual={get_render_limits().repr(self.actual)})"
@@ -0,0 +1,72 @@
+import collections.abc
+import typing
+
+from .._util import MISSING
+from .._util import count_up_to
+from ._handler import Handler
+
+
+class IterableHandler(Handler):
+    """
+    A streaming handler for iterables.  Sized containers are checked directly; one-shot
+    iterators and generators are streamed in O(1) memory, consuming only as many elements
+    as are required to decide the outcome of the assertion.
+
+    Note: Checks against an iterator consume (some of) it.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, actual: typing.Iterable[typing.Any]) -> None:
+        super().__init__(actual)
+        self._enforce_is_iterable()
+
+    def has_length(self, expected: int) -> None:
+        """Asserts the number of elements is equal to expected, stopping once the count exceeds it."""
+        if not isinstance(expected, int) or expected < 0:
+            raise ValueError(f"{expected} must be an int and greater than 0")
+        if isinstance(self.actual, collections.abc.Sized):
+            length = len(self.actual)
+        else:
+            length = count_up_to(self.actual, expected)
+        if length != expected:
+            raise self.failure("Length of: {actual!r} was not equal to: {expected!r}", expected=expected)
+
+    def is_empty(self) -> None:
+        """Asserts the actual value has no elements, peeking at most a single element."""
+        if not self._is_empty():
+            raise self.failure("{actual!r} was not empty")
+
+    def is_not_empty(self) -> None:
+        """Asserts the actual value has at least one element, peeking at most a single element."""
+        if self._is_empty():
+            raise self.failure("{actual!r} was empty")
+
+    def contains(self, item: typing.Any) -> None:
+        """Asserts the item is within the actual value, stopping at the first occurrence."""
+        if item not in self._container():
+            raise self.failure("{actual!r} did not contain: {item!r}", item=item)
+
+    def does_not_contain(self, item: typing.Any) -> None:
+        """Asserts the item is not within the actual value, stopping at the first occurrence."""
+        if item in self._container():
+            raise self.failure("{actual!r} contained: {item!r}", item=item)
+
+    def _is_empty(self) -> bool:
+        if isinstance(self.actual, collections.abc.Sized):
+            return not len(self.actual)
+        return next(iter(self.actual), MISSING) is MISSING
+
+    def _container(self) -> typing.Any:
+        """Containers use their own (typically O(1)) membership, iterators are streamed by `in`."""
+        if isinstance(self.actual, collections.abc.Container):
+            return self.actual
+        return iter(self.actual)
+
+    def _enforce_is_iterable(self) -> None:
+        """
+        Enforces that the actual value is iterable.  Asserto is handling these type errors as part of
+        dispatching to rewrite and raise something more appropriate.
+        """
+        if not isinstance(self.actual, collections.abc.Iterable):
+            raise ValueError
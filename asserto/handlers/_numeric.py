@@ -13,6 +13,8 @@ class NumberHandler(Handler):
     but should they reside in a separate handler?
     """
 
+    __slots__ = ()
+
     def __init__(self, actual: float) -> None:
         super().__init__(actual)
         self._enforce_is_number()
@@ -20,22 +22,22 @@ class NumberHandler(Handler):
     def is_zero(self) -> None:
         """Asserts that the value is a numeric type and is equal to 0"""
         if self.actual != 0:
-            raise AssertionError(f"Expected {self.actual} to be 0 but it was not.")
+            raise self.failure("Expected {actual} to be 0 but it was not.")
 
     def is_not_zero(self) -> None:
         """Asserts that the value is numeric, and it is greater than other"""
         if self.actual == 0:
-            raise AssertionError(f"Expected {self.actual} to not be 0 but it was.")
+            raise self.failure("Expected {actual} to not be 0 but it was.")
 
     def is_greater_than(self, other: float) -> None:
         """Asserts that the value is numeric, and it is lesser than other"""
         if self.actual <= other:
-            raise AssertionError(f"Expected {self.actual} to be greater than {other}, but it was not.")
+            raise self.failure("Expected {actual} to be greater than {other}, but it was not.", other=other)
 
     def is_lesser_than(self, other: float) -> None:
         """Asserts that the value is a numeric type and is lesser than other"""
         if self.actual >= other:
-            raise AssertionError(f"Expected {self.actual} to be lesser than {other}, but it was not.")
+            raise self.failure("Expected {actual} to be lesser than {other}, but it was not.", other=other)
 
     def is_positive(self) -> None:
         """Asserts that the value is numeric, and is greater than 0"""
@@ -50,21 +52,23 @@ class NumberHandler(Handler):
         is true, value is considered between if it equals either the lower or higher bounds.
         """
         if inclusive:
-            if low > self.actual > high:
-                raise AssertionError(f"Expected {self.actual} to be inclusively between: ({low}, ..., {high})")
+            if not low <= self.actual <= high:
+                raise self.failure(
+                    "Expected {actual} to be inclusively between: ({low}, ..., {high})", low=low, high=high
+                )
         else:
             if self.actual <= low or self.actual >= high:
-                raise AssertionError(f"Expected {self.actual} to be between ({low}, ..., {high})")
+                raise self.failure("Expected {actual} to be between ({low}, ..., {high})", low=low, high=high)
 
     def is_not_between(self, low: float, high: float, inclusive: bool = False):
         """Asserts that the value is numeric and is not between a low and high bounds.  If inclusive
         is true, value is considered between if it equals either the low or high bounds."""
         if inclusive:
             if low < self.actual < high:
-                raise AssertionError(f"Expected {self.actual} to not be between ({low}, ..., {high})")
+                raise self.failure("Expected {actual} to not be between ({low}, ..., {high})", low=low, high=high)
         else:
             if low <= self.actual <= high:
-                raise AssertionError(f"Expected {self.actual} to not be between ({low}, ..., {high})")
+                raise self.failure("Expected {actual} to not be between ({low}, ..., {high})", low=low, high=high)
 
     def _enforce_is_number(self):
         """
@@ -1,6 +1,8 @@
 import re
 import typing
 
+from .._patterns import compile_pattern
+from .._types import BYTES_LIKE
 from .._types import RE_FLAGS_ALIAS
 from .._types import RE_PATTERN_ALIAS
 from ..descriptors import ValidatesInstanceOf
@@ -9,37 +11,43 @@ from ._handler import Handler
 
 class RegexHandler(Handler):
     """
-    Regular expression handler.
+    Regular expression handler, of strings and bytes like values (which are searched without copying them).
     """
 
-    actual: typing.Any = ValidatesInstanceOf(str, re.Pattern)
+    # Storage of the validated actual value, see `ValidatesInstanceOf`.
+    __slots__ = ("_actual",)
+
+    actual: typing.Any = ValidatesInstanceOf(str, re.Pattern, *BYTES_LIKE)
 
     def __init__(self, actual: typing.Any) -> None:
         super().__init__(actual)
 
     def match(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> None:
         """Matches the beginning of a string"""
-        if not re.match(pattern, self.actual, flags):
-            raise AssertionError(f"{self.actual} did not begin with pattern: {pattern=}")
+        if not compile_pattern(pattern, flags).match(self.actual):
+            raise self.failure("{actual} did not begin with pattern: pattern={pattern!r}", pattern=pattern)
 
     def does_not_match(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS = 0) -> None:
         try:
             self.match(pattern, flags)
-            raise AssertionError(f"{self.actual} was a match with pattern: {pattern=}")
+            raise self.failure("{actual} was a match with pattern: pattern={pattern!r}", pattern=pattern)
         except AssertionError:
             pass
 
     def search(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS) -> None:
-        if re.search(pattern, self.actual, flags) is None:
-            raise AssertionError(f"{self.actual} did not contain any matches for: {pattern=}")
+        if compile_pattern(pattern, flags).search(self.actual) is None:
+            raise self.failure("{actual} did not contain any matches for: pattern={pattern!r}", pattern=pattern)
 
     def fullmatch(self, pattern: RE_PATTERN_ALIAS, flags: RE_FLAGS_ALIAS) -> None:
-        if re.fullmatch(pattern, self.actual, flags) is None:
-            raise AssertionError(f"{self.actual} was not matched entirely by: {pattern=}")
+        if compile_pattern(pattern, flags).fullmatch(self.actual) is None:
+            raise self.failure("{actual} was not matched entirely by: pattern={pattern!r}", pattern=pattern)
 
     def findall(self, pattern: RE_PATTERN_ALIAS, count: int, flags: RE_FLAGS_ALIAS) -> None:
-        matches = re.findall(pattern, self.actual, flags)
+        matches = compile_pattern(pattern, flags).findall(self.actual)
         if len(matches) != count:
-            raise AssertionError(
-                f"{self.actual} had: {len(matches)} non overlapping occurrences for pattern: {pattern}, not: {count}"
+            raise self.failure(
+                "{actual} had: {found} non overlapping occurrences for pattern: {pattern}, not: {count}",
+                found=len(matches),
+                pattern=pattern,
+                count=count,
             )
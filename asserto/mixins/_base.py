@@ -1,2 +1,4 @@
 class BaseMixin:
     """A Base mixin for useful functionality across all assertion mixins."""
+
+    __slots__ = ()
@@ -1,22 +1,36 @@
-import inspect
+import functools
 import typing
 
+from .. import _instrumentation
 from ._const import ACTUAL_TYPE_ERROR
 
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
 
-def enforce_type_of(object: typing.Any, types: typing.Any) -> None:
-    """Ensures a particular object has an expected type else raises
-    a Type error including the caller of this functions name. This
-    should typically only be called by a mixin method performing
-    an assertion.
 
-    This unwinds the call stack to derive this information.
+def enforce_type_of(types: typing.Any) -> typing.Callable[[F], F]:
+    """Decorates a mixin assertion method, ensuring the actual value has an expected
+    type before the assertion is performed, else raises a Type error including the
+    decorated methods name.
 
-    :param object: The object to check the type of.
-    :param types: The type it should be of."""
-    __tracebackhide__ = True
-    current_frame = inspect.currentframe()
-    caller = inspect.getouterframes(current_frame, 2)
-    method_name = caller[1][3]
-    if not isinstance(object, types):
-        raise TypeError(ACTUAL_TYPE_ERROR.format(object, types, method_name, type(object)))
+    The method name is captured once at decoration time, so a successful check costs
+    a single `isinstance` call regardless of the depth of the call stack.
+
+    :param types: The type (or tuple of types) the actual value should be of."""
+
+    def decorator(fn: F) -> F:
+        method_name = fn.__name__
+        owner = fn.__qualname__.rpartition(".")[0] or fn.__module__
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            __tracebackhide__ = True
+            actual = self.actual
+            if not isinstance(actual, types):
+                raise TypeError(ACTUAL_TYPE_ERROR.format(actual, types, method_name, type(actual)))
+            if _instrumentation.profiler is None:
+                return fn(self, *args, **kwargs)
+            return _instrumentation.profiler.measure(owner, method_name, fn, self, args, kwargs)
+
+        return typing.cast(F, wrapper)
+
+    return decorator
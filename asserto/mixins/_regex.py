@@ -3,3 +3,5 @@ from .._protocols import Assertable
 
 class AssertsPatternsMixin(Assertable):
     """Mixin class for bolting on regular expression based assertions."""
+
+    __slots__ = ()
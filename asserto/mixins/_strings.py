@@ -1,12 +1,20 @@
-from typing import Any
-from typing import Iterable
+from __future__ import annotations
 
-from typing_extensions import Self as Asserto
+from typing import TYPE_CHECKING
+from typing import Iterable
 
+from .. import handlers
+from .._const import Methods
 from .._protocols import Assertable
-from .._util import to_iterable
+from .._rendering import FailureMessage
+from .._types import BYTES_LIKE
+from .._util import MISSING
+from .._util import last
 from ._mixin_utils import enforce_type_of
 
+if TYPE_CHECKING:
+    from typing_extensions import Self as Asserto
+
 # Todo: end_with offering a `start` and `end`?
 # Todo: starts_with offering a `start` and `end`?
 # Todo: Docs reuse through __doc__ ?
@@ -17,10 +25,14 @@ from ._mixin_utils import enforce_type_of
 class AssertsStringsMixin(Assertable):
     """Mixin responsible for composing assertions for string types."""
 
+    __slots__ = ()
+
+    @enforce_type_of(Iterable)
     def ends_with(self, suffix: str) -> Asserto:
         """Asserts the actual value ends with a given prefix.  If the actual
         value is an iterable, the last element within it will be compared for
-        equality (==) against the suffix.
+        equality (==) against the suffix.  Bytes like values must end with the bytes of a bytes like
+        suffix, which are compared without copying the value; any other suffix is compared to the last byte.
 
         :param suffix: The expected substring for the actual value to end with.
 
@@ -32,24 +44,40 @@ class AssertsStringsMixin(Assertable):
 
         :return: The `Asserto` instance for fluent chaining.
         """
-        enforce_type_of(self.actual, Iterable)
-
+        if isinstance(self.actual, BYTES_LIKE) and isinstance(suffix, BYTES_LIKE):
+            return self._dispatch(handlers.BytesHandler, Methods.ENDS_WITH, suffix)
         if isinstance(self.actual, str):
             if not suffix:
                 raise ValueError(f"{suffix=} must not be empty.")
             if not isinstance(suffix, str):
                 raise TypeError(f"{suffix=} must be a string.")
             if not self.actual.endswith(suffix):
-                self.error(f"Expected `{self.actual}` to end with {suffix=} but it did not.")
+                from .._diff import TextDiff
+
+                self.error(
+                    FailureMessage(
+                        "Expected `{actual}` to end with suffix={suffix!r} but it did not.{diff}",
+                        actual=self.actual,
+                        suffix=suffix,
+                        diff=TextDiff(self.actual, suffix, TextDiff.SUFFIX),
+                    )
+                )
         else:
-            if not self.actual:
+            # Streamed; generators & huge sequences are never materialized to find the last element.
+            final = last(self.actual, MISSING)
+            if final is MISSING:
                 raise ValueError(f"{self.actual} must not be empty.")
-
-            last: Iterable[Any] = to_iterable(self.actual)[-1]
-            if last != suffix:
-                self.error(f"Expected `{self.actual}` to end with {suffix=} but it did not.")
+            if final != suffix:
+                self.error(
+                    FailureMessage(
+                        "Expected `{actual}` to end with suffix={suffix!r} but it did not.",
+                        actual=self.actual,
+                        suffix=suffix,
+                    )
+                )
         return self
 
+    @enforce_type_of(str)
     def is_alpha(self) -> Asserto:
         """Asserts the actual value is considered alphabetic.  Empty strings will
         not be considered alphabetic for this case.
@@ -59,12 +87,12 @@ class AssertsStringsMixin(Assertable):
 
         :return: The `Asserto` instance for fluent chaining.
         """
-        enforce_type_of(self.actual, str)
         if not self.actual.isalpha():
-            self.error(f"{self.actual} is not alphabetic.")
+            self.error(FailureMessage("{actual} is not alphabetic.", actual=self.actual))
 
         return self
 
+    @enforce_type_of(str)
     def is_digit(self) -> Asserto:
         """Asserts the actual value is a digit string.  Empty strings will not be considered
         digit strings for this case.
@@ -74,25 +102,27 @@ class AssertsStringsMixin(Assertable):
 
         :return: The `Asserto` instance for fluent chaining.
         """
-        enforce_type_of(self.actual, str)
         if not self.actual.isdigit():
-            self.error(f"{self.actual} is not a digit string.")
+            self.error(FailureMessage("{actual} is not a digit string.", actual=self.actual))
         return self
 
+    @enforce_type_of(str)
     def is_blank(self) -> Asserto:
         """Asserts the actual value is an empty (blank) string.
 
         :raises TypeError: If the actual value is not of type string.
         :raises AssertionError: If the actual value is not an empty string
         """
-        enforce_type_of(self.actual, str)
         if len(self.actual):
-            self.error(f"{self.actual} was not an empty string.")
+            self.error(FailureMessage("{actual} was not an empty string.", actual=self.actual))
         return self
 
+    @enforce_type_of(Iterable)
     def starts_with(self, prefix: str) -> Asserto:
         """Asserts the actual value starts with the prefix.  If the actual value is
-        an iterable the first element is compared for equality (==) against the prefix.
+        an iterable the first element is compared for equality (==) against the prefix.  Bytes like values
+        must begin with the bytes of a bytes like prefix, which are compared without copying the value; a string
+        prefix is compared to the first byte.
 
 
         :param prefix: The value to check the actual value starts with.
@@ -100,7 +130,8 @@ class AssertsStringsMixin(Assertable):
         :return: The `Asserto` instance for fluent chaining.
 
         """
-        enforce_type_of(self.actual, Iterable)
+        if isinstance(self.actual, BYTES_LIKE) and isinstance(prefix, BYTES_LIKE):
+            return self._dispatch(handlers.BytesHandler, Methods.STARTS_WITH, prefix)
         if not isinstance(prefix, str):
             raise TypeError(f"starts_with prefix must be a string, not: {type(prefix)}")
         if not prefix:
@@ -109,12 +140,23 @@ class AssertsStringsMixin(Assertable):
         if isinstance(self.actual, Iterable):
             if isinstance(self.actual, str):
                 if not self.actual.startswith(prefix):
-                    self.error(f"{self.actual} did not begin with {prefix=}")
+                    from .._diff import TextDiff
+
+                    self.error(
+                        FailureMessage(
+                            "{actual} did not begin with prefix={prefix!r}{diff}",
+                            actual=self.actual,
+                            prefix=prefix,
+                            diff=TextDiff(self.actual, prefix, TextDiff.PREFIX),
+                        )
+                    )
             else:
                 iterable = iter(self.actual)
                 first = next(iterable, None)
                 if first is None:
                     raise ValueError(f"cannot check if an empty iterable started with {prefix}")
                 if first != prefix:
-                    self.error(f"{self.actual} did not start with {prefix}")
+                    self.error(
+                        FailureMessage("{actual} did not start with {prefix}", actual=self.actual, prefix=prefix)
+                    )
         return self
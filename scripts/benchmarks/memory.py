@@ -0,0 +1,105 @@
+#!/bin/env python3
+"""
+Measures the memory allocated per assertion with tracemalloc.
+
+    retained: The bytes held per `Asserto` instance (and everything it references) once the assertion ran.
+    peak: The peak bytes traced while running a single assertion, without retaining the instance.
+    pooled: The peak bytes traced per assertion in a scope of an `asserto.pool()`, where instances are rebound.
+    leaked: The bytes still traced after `number` pooled assertions, the steady state allocates nothing.
+
+Run with: poetry run python scripts/benchmarks/memory.py
+"""
+import argparse
+import gc
+import tracemalloc
+import typing
+
+import asserto as asserto_package
+from asserto import asserto
+
+# Assertions on their success path, returning the `Asserto` instance.
+CASES: typing.Dict[str, typing.Callable[[], typing.Any]] = {
+    "instance": lambda: asserto(1),
+    "is_equal_to": lambda: asserto(1).is_equal_to(1),
+    "is_positive": lambda: asserto(1).is_positive(),
+    "chained": lambda: asserto(1).is_positive().is_lesser_than(2).is_equal_to(1),
+    "match": lambda: asserto("foobar").match("foo"),
+    "starts_with": lambda: asserto("foobar").starts_with("foo"),
+    "soft": lambda: _soft(),
+}
+
+
+def _soft() -> typing.Any:
+    with asserto(1) as soft:
+        soft.is_equal_to(1)
+    return soft
+
+
+def build_namespace() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=10_000, help="Assertions per measurement.")
+    return parser.parse_args()
+
+
+def retained(fn: typing.Callable[[], typing.Any], number: int) -> float:
+    """Returns the bytes retained per instance, when `number` instances are kept alive."""
+    fn()  # warm up caches (dispatch, patterns etc.) so they are not attributed to the instances.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [fn() for _ in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Account for the list holding the instances.
+    return (after - before - instances.__sizeof__()) / number
+
+
+def peak(fn: typing.Callable[[], typing.Any], number: int) -> float:
+    """Returns the mean peak of bytes traced while running an assertion, the instances are discarded."""
+    fn()
+    gc.collect()
+    tracemalloc.start()
+    total = 0
+    for _ in range(number):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        fn()
+        total += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return total / number
+
+
+def pooled(fn: typing.Callable[[], typing.Any], number: int) -> typing.Tuple[float, int]:
+    """Returns the mean peak of bytes traced per assertion inside of a pool, and the bytes left traced after all."""
+    pool = asserto_package.pool()
+
+    def scoped() -> None:
+        with pool:
+            fn()
+
+    total = peak(scoped, number)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(number):
+        scoped()
+    leaked = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return total, leaked
+
+
+def main() -> int:
+    namespace = build_namespace()
+    print(f"{'assertion':<14}{'retained':>14}{'peak':>14}{'pooled':>14}{'leaked':>14}")
+    for name, fn in CASES.items():
+        number = namespace.number
+        pooled_peak, leaked = pooled(fn, number)
+        print(
+            f"{name:<14}{retained(fn, number):>12,.0f}B{peak(fn, number):>12,.0f}B"
+            f"{pooled_peak:>12,.0f}B{leaked:>12,}B"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+#!/bin/env python3
+import argparse
+import timeit
+import typing
+
+from asserto import asserto
+
+# The string mixin assertions, invoked on their success path.
+CASES: typing.Dict[str, typing.Callable[[], typing.Any]] = {
+    "ends_with": lambda: asserto("foobar").ends_with("bar"),
+    "starts_with": lambda: asserto("foobar").starts_with("foo"),
+    "is_alpha": lambda: asserto("foobar").is_alpha(),
+    "is_digit": lambda: asserto("1234").is_digit(),
+    "is_blank": lambda: asserto("").is_blank(),
+}
+
+
+def build_namespace() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depths", nargs="+", type=int, default=[0, 100, 500], help="Stack depths to measure at.")
+    parser.add_argument("--number", type=int, default=20_000, help="Assertions per measurement.")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per case, the best is reported.")
+    return parser.parse_args()
+
+
+def at_depth(depth: int, fn: typing.Callable[[], typing.Any]) -> typing.Any:
+    """Invoke `fn` with (at least) `depth` additional frames on the call stack."""
+    if depth <= 0:
+        return fn()
+    return at_depth(depth - 1, fn)
+
+
+def measure(fn: typing.Callable[[], typing.Any], depth: int, number: int, repeat: int) -> float:
+    """Returns the best observed time per assertion in nanoseconds at the given stack depth."""
+    timer = timeit.Timer(stmt=fn)
+    best = at_depth(depth, lambda: min(timer.repeat(repeat=repeat, number=number)))
+    return best / number * 1e9
+
+
+def main() -> int:
+    namespace = build_namespace()
+    depths = sorted(namespace.depths)
+    print(f"{'assertion':<12}" + "".join(f"{f'depth={d}':>14}" for d in depths) + f"{'ratio':>10}")
+    for name, fn in CASES.items():
+        timings = [measure(fn, depth, namespace.number, namespace.repeat) for depth in depths]
+        row = "".join(f"{f'{t:,.0f}ns':>14}" for t in timings)
+        print(f"{name:<12}{row}{timings[-1] / timings[0]:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    """
+    Measures the success path of the string mixin assertions at increasing stack depths.  The
+    cost per assertion should remain flat (a ratio close to 1.0) as the stack grows.
+    From the root directory of `asserto`:
+        poetry run python scripts/benchmarks/stack_depth.py
+    """
+    raise SystemExit(main())
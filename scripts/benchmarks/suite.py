@@ -0,0 +1,424 @@
+#!/bin/env python3
+"""
+The asserto benchmark suite, measuring the hot paths of assertions fully offline.
+
+    run: Measures every case and writes the results as JSON.
+    compare: Compares results against a stored baseline, exiting non zero on regressions.
+
+Typical usage:
+
+    poetry run python scripts/benchmarks/suite.py run --output scripts/benchmarks/baseline.json
+    # ... make changes ...
+    poetry run python scripts/benchmarks/suite.py run --output current.json
+    poetry run python scripts/benchmarks/suite.py compare scripts/benchmarks/baseline.json current.json
+
+Timings are machine specific, baselines are not committed: record one before making changes.
+
+Failure path cases catch the AssertionError without rendering its message, as a passing
+test suite never renders them either.
+"""
+import argparse
+import collections
+import datetime
+import fnmatch
+import json
+import platform
+import re
+import subprocess
+import sys
+import timeit
+import typing
+
+import asserto as asserto_package
+from asserto import asserto
+
+CASE_ALIAS = typing.Callable[[], typing.Any]
+CASES: typing.Dict[str, CASE_ALIAS] = {}
+# The relative cost of a call of each case, which is measured `number // weight` times.
+WEIGHTS: typing.Dict[str, int] = {}
+
+
+def case(name: str, weight: int = 1) -> typing.Callable[[CASE_ALIAS], CASE_ALIAS]:
+    """
+    Registers a benchmark case, measured per call.
+
+    :param name: The name of the case.
+    :param weight: The relative cost of a call, expensive cases (such as those running a 1000 assertions
+        per call) are measured fewer times.
+    """
+
+    def decorator(fn: CASE_ALIAS) -> CASE_ALIAS:
+        CASES[name] = fn
+        WEIGHTS[name] = weight
+        return fn
+
+    return decorator
+
+
+def failing(fn: CASE_ALIAS) -> CASE_ALIAS:
+    """Wraps an assertion expected to fail, so its failure path can be measured."""
+
+    def wrapper() -> None:
+        try:
+            fn()
+        except AssertionError:
+            return
+        raise RuntimeError(f"{fn} was expected to fail.")
+
+    return wrapper
+
+
+# Handlers: one pass & one fail case per assertion family, dispatched through `Asserto._dispatch`.
+_HANDLER_CASES: typing.Dict[str, typing.Tuple[CASE_ALIAS, CASE_ALIAS]] = {
+    "base.is_true": (lambda: asserto(True).is_true(), lambda: asserto(False).is_true()),
+    "base.is_equal_to": (lambda: asserto(1).is_equal_to(1), lambda: asserto(1).is_equal_to(2)),
+    "base.is_instance": (lambda: asserto(1).is_instance(int), lambda: asserto(1).is_instance(str)),
+    "base.has_length": (lambda: asserto([1, 2]).has_length(2), lambda: asserto([1, 2]).has_length(3)),
+    "base.is_none": (lambda: asserto(None).is_none(), lambda: asserto(1).is_none()),
+    "numeric.is_positive": (lambda: asserto(1).is_positive(), lambda: asserto(-1).is_positive()),
+    "numeric.is_between": (lambda: asserto(5).is_between(1, 10), lambda: asserto(50).is_between(1, 10)),
+    "numeric.chained": (
+        lambda: asserto(5).is_positive().is_greater_than(1).is_lesser_than(10),
+        lambda: asserto(5).is_positive().is_greater_than(1).is_lesser_than(2),
+    ),
+    "regex.match": (lambda: asserto("foobar").match("foo"), lambda: asserto("foobar").match("bar")),
+    "regex.search": (lambda: asserto("foobar").search("b.r"), lambda: asserto("foobar").search("baz")),
+    "iterable.contains": (
+        lambda: asserto(iter(range(100))).contains(50),
+        lambda: asserto(iter(range(100))).contains(500),
+    ),
+    "elementwise.is_positive": (
+        lambda: asserto(list(range(1, 1001))).each().is_positive(),
+        lambda: asserto(list(range(-1, 999))).each().is_positive(),
+    ),
+    "strings.starts_with": (
+        lambda: asserto("foobar").starts_with("foo"),
+        lambda: asserto("foobar").starts_with("bar"),
+    ),
+    "strings.ends_with": (lambda: asserto("foobar").ends_with("bar"), lambda: asserto("foobar").ends_with("foo")),
+    "strings.is_alpha": (lambda: asserto("foobar").is_alpha(), lambda: asserto("foo1").is_alpha()),
+    "bytes.starts_with": (
+        lambda: asserto(b"foobar").starts_with(b"foo"),
+        lambda: asserto(b"foobar").starts_with(b"bar"),
+    ),
+    "bytes.is_equal_to": (
+        lambda: asserto(memoryview(b"foobar")).is_equal_to(b"foobar"),
+        lambda: asserto(memoryview(b"foobar")).is_equal_to(b"foobaz"),
+    ),
+}
+
+for _name, (_passes, _fails) in _HANDLER_CASES.items():
+    case(f"{_name}.pass")(_passes)
+    case(f"{_name}.fail")(failing(_fails))
+
+
+# Failed equality of large containers, including rendering the structural diff of the message.
+_LARGE_DICT = {i: i for i in range(200_000)}
+_LARGE_DICT_OTHER = {**_LARGE_DICT, 100_000: -1}
+
+
+@case("diff.large_dict.rendered", weight=10_000)
+def _diff_large_dict() -> None:
+    try:
+        asserto(_LARGE_DICT).is_equal_to(_LARGE_DICT_OTHER)
+    except AssertionError as exc:
+        str(exc)
+
+
+_LARGE_TEXT = "".join(f"<p>line {i}</p>\n" for i in range(200_000))
+_LARGE_TEXT_OTHER = _LARGE_TEXT.replace("<p>line 150000</p>", "<p>line 150000!</p>")
+
+
+@case("diff.large_text.rendered", weight=1000)
+def _diff_large_text() -> None:
+    try:
+        asserto(_LARGE_TEXT).is_equal_to(_LARGE_TEXT_OTHER)
+    except AssertionError as exc:
+        str(exc)
+
+
+# Bytes like values: a large memoryview compared to bytes (and a slice of them) without copying either.
+_LARGE_BUFFER = bytes(16 * 1024 * 1024)
+_LARGE_VIEW = memoryview(bytearray(_LARGE_BUFFER))
+_BUFFER_TAIL = _LARGE_BUFFER[-4096:]
+
+
+@case("bytes.large_view.pass", weight=1000)
+def _bytes_large_view() -> None:
+    asserto(_LARGE_VIEW).is_equal_to(_LARGE_BUFFER).has_slice(-4096, None, _BUFFER_TAIL)
+
+
+# Profiling: the cost of an assertion measured by an enabled profiler, see `base.is_equal_to.pass`.
+_PROFILER = asserto_package.Profiler()
+
+
+@case("profiled.is_equal_to.pass")
+def _profiled_is_equal_to() -> None:
+    _PROFILER.enable()
+    try:
+        asserto(1).is_equal_to(1)
+    finally:
+        _PROFILER.disable()
+
+
+# Modes: the cost of a chain of assertions per mode, measured per 1000 chains with the mode set around them.
+def _chains(mode: str) -> CASE_ALIAS:
+    def chains() -> None:
+        original = asserto_package.get_mode()
+        asserto_package.set_mode(mode)
+        try:
+            for value in range(1, 1001):
+                asserto(value).is_positive().is_between(0, 1001).is_not_zero()
+        finally:
+            asserto_package.set_mode(original)
+
+    return chains
+
+
+case("modes.full.1000_chains", weight=1000)(_chains("full"))
+case("modes.sampled_1pct.1000_chains", weight=1000)(_chains("sampled:0.01"))
+case("modes.off.1000_chains", weight=1000)(_chains("off"))
+
+
+@case("modes.off.1000_dynamic_chains", weight=1000)
+def _off_dynamic_chains() -> None:
+    # Dynamic lookups & mode switches are skipped alike, a skipped chain costs a fraction of a performed one.
+    original = asserto_package.get_mode()
+    asserto_package.set_mode("off")
+    try:
+        for value in range(1, 1001):
+            asserto(value).is_positive().is_between(0, 1001).is_equal_to(value).x_is(1).each().is_positive()
+    finally:
+        asserto_package.set_mode(original)
+
+
+_INVENTORY = list(range(10_000))
+_DEFERRED_CHECKER = asserto_package.DeferredChecker(maxsize=1000)
+
+
+@case("deferred.immediate.1000_chains", weight=1000)
+def _deferred_immediate() -> None:
+    for _ in range(1000):
+        asserto(_INVENTORY).contains(9_999).has_length(10_000)
+
+
+@case("deferred.submitted.1000_chains", weight=1000)
+def _deferred_submitted() -> None:
+    # Recording & queueing on the calling thread, then waiting for the workers: none are left checking
+    # chains (competing with the calling thread) during later cases.
+    for _ in range(1000):
+        asserto(_INVENTORY).deferred(_DEFERRED_CHECKER).contains(9_999).has_length(10_000).submit()
+    _DEFERRED_CHECKER.flush()
+
+
+class _Point(typing.NamedTuple):
+    x: int
+    y: int
+
+
+class _Obj:
+    def __init__(self) -> None:
+        self.name = "asserto"
+
+
+@case("dynamic.attribute.pass")
+def _dynamic_attribute() -> None:
+    asserto(_Obj()).name_is("asserto")
+
+
+@case("dynamic.mapping.pass")
+def _dynamic_mapping() -> None:
+    asserto({"name": "asserto"}).name_is("asserto")
+
+
+@case("dynamic.namedtuple.pass")
+def _dynamic_namedtuple() -> None:
+    asserto(_Point(1, 2)).x_is(1)
+
+
+@case("dynamic.nested.pass")
+def _dynamic_nested() -> None:
+    asserto({"address": {"city": "Dublin"}}).address__city_is("Dublin")
+
+
+case("dynamic.attribute.fail")(failing(lambda: asserto(_Obj()).name_is("other")))
+
+
+def _raiser(x: bool) -> None:
+    if x:
+        raise ValueError("This is broken.")
+
+
+@case("should_raise.pass")
+def _should_raise() -> None:
+    asserto(_raiser).should_raise(ValueError).when_called_with(True)
+
+
+@case("should_raise.match.pass")
+def _should_raise_match() -> None:
+    asserto(_raiser).should_raise(ValueError, match="This is").when_called_with(True)
+
+
+case("should_raise.fail")(failing(lambda: asserto(_raiser).should_raise(KeyError).when_called_with(True)))
+
+
+# Soft mode: the throughput of collecting many failures, measured per context of 1000 failures.
+@case("soft.1000_failures", weight=1000)
+def _soft_failures() -> None:
+    try:
+        with asserto(1) as soft:
+            for i in range(1000):
+                soft.is_equal_to(i + 2)
+    except AssertionError:
+        pass
+
+
+@case("soft.1000_failures.rendered", weight=1000)
+def _soft_failures_rendered() -> None:
+    try:
+        with asserto(1) as soft:
+            for i in range(1000):
+                soft.is_equal_to(i + 2)
+    except AssertionError as exc:
+        str(exc)
+
+
+@case("soft.1000_passes", weight=1000)
+def _soft_passes() -> None:
+    with asserto(1) as soft:
+        for _ in range(1000):
+            soft.is_equal_to(1)
+
+
+_PLAN = asserto.plan().is_instance(int).is_between(0, 1001).is_not_zero()
+_PLAN_VALUES = list(range(1, 1001))
+
+
+@case("plan.check_many.1000_values", weight=1000)
+def _plan_check_many() -> None:
+    _PLAN.check_many(_PLAN_VALUES)
+
+
+@case("plan.fluent.1000_values", weight=1000)
+def _plan_fluent_equivalent() -> None:
+    for value in _PLAN_VALUES:
+        asserto(value).is_instance(int).is_between(0, 1001).is_not_zero()
+
+
+_SPEC = asserto.spec(
+    id=asserto.plan().is_instance(int).is_positive(),
+    score=asserto.plan().is_between(0, 100),
+    active=True,
+)
+_SPEC_RECORDS = [{"id": i, "score": i % 99 + 1, "active": True} for i in range(1, 1001)]
+
+
+@case("spec.check_many.1000_records", weight=1000)
+def _spec_check_many() -> None:
+    _SPEC.check_many(_SPEC_RECORDS)
+
+
+@case("spec.fluent.1000_records", weight=1000)
+def _spec_fluent_equivalent() -> None:
+    for record in _SPEC_RECORDS:
+        asserto(record["id"]).is_instance(int).is_positive()
+        asserto(record["score"]).is_between(0, 100)
+        asserto(record).active_is(True)
+
+
+def measure(fn: CASE_ALIAS, number: int, repeat: int) -> float:
+    """Returns the best observed time per call in nanoseconds."""
+    timer = timeit.Timer(stmt=fn)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def measure_import(repeat: int) -> float:
+    """Returns the best observed cumulative import time of `asserto` in nanoseconds, in a fresh interpreter."""
+    timings = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", "import asserto"), capture_output=True, text=True, check=True
+        )
+        # import time: self [us] | cumulative | imported package
+        for line in process.stderr.splitlines():
+            found = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+asserto$", line)
+            if found:
+                timings.append(int(found.group(1)) * 1e3)
+    return min(timings)
+
+
+def run(namespace: argparse.Namespace) -> int:
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = collections.OrderedDict()
+    for name, fn in CASES.items():
+        if not fnmatch.fnmatch(name, namespace.filter):
+            continue
+        number = max(1, namespace.number // WEIGHTS[name])
+        results[name] = {"ns_per_op": measure(fn, number, namespace.repeat), "number": number}
+        print(f"{name:<40}{results[name]['ns_per_op']:>16,.0f}ns")
+    if fnmatch.fnmatch("import", namespace.filter):
+        results["import"] = {"ns_per_op": measure_import(namespace.repeat), "number": 1}
+        print(f"{'import':<40}{results['import']['ns_per_op']:>16,.0f}ns")
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "repeat": namespace.repeat,
+        },
+        "results": results,
+    }
+    if namespace.output:
+        with open(namespace.output, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to: {namespace.output}")
+    return 0
+
+
+def compare(namespace: argparse.Namespace) -> int:
+    with open(namespace.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(namespace.current) as f:
+        current = json.load(f)["results"]
+    regressions = 0
+    print(f"{'case':<40}{'baseline':>16}{'current':>16}{'ratio':>10}")
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name]["ns_per_op"], current[name]["ns_per_op"]
+        ratio = after / before
+        regressed = ratio > 1 + namespace.threshold
+        regressions += regressed
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<40}{before:>14,.0f}ns{after:>14,.0f}ns{ratio:>10.2f}{flag}")
+    for label, only in (("baseline", baseline.keys() - current.keys()), ("current", current.keys() - baseline.keys())):
+        if only:
+            print(f"{len(only)} case(s) only present in the {label} results were skipped.")
+    print(f"{regressions} regression(s) beyond a threshold of {namespace.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def build_namespace() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--output", "-o", help="Write the results as JSON to this path.")
+    run_parser.add_argument("--number", type=int, default=20_000, help="Calls per measurement.")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Measurements per case, the best is reported.")
+    run_parser.add_argument("--filter", "-k", default="*", help="Only run cases matching this glob.")
+    run_parser.set_defaults(fn=run)
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline.")
+    compare_parser.add_argument("baseline", help="The baseline results.")
+    compare_parser.add_argument("current", help="The current results.")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.10, help="The slowdown (as a fraction) flagged as a regression."
+    )
+    compare_parser.set_defaults(fn=compare)
+    return parser.parse_args()
+
+
+def main() -> int:
+    namespace = build_namespace()
+    return namespace.fn(namespace)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+import array
+import re
+import tracemalloc
+
+import pytest
+
+from asserto import Asserto
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+from asserto.handlers import BytesHandler
+
+VALUES = (b"hello world", bytearray(b"hello world"), memoryview(b"hello world"))
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("asserter", (asserto, Asserto))
+def test_bytes_like_values_pass(value, asserter) -> None:
+    asserter(value).starts_with(b"hello").ends_with(bytearray(b"world")).is_equal_to(b"hello world").has_slice(
+        6, None, memoryview(b"world")
+    ).search(rb"o\sw").match(rb"h").has_length(11)
+
+
+@pytest.mark.parametrize("asserter", (asserto, Asserto))
+def test_prefix_and_suffix_failures(asserter) -> None:
+    with pytest.raises(AssertionError, match=r"^b'hello world' did not begin with prefix=b'help'$"):
+        asserter(b"hello world").starts_with(b"help")
+    with pytest.raises(
+        AssertionError,
+        match=re.escape("Expected `memoryview(b'hello world')` to end with suffix=b'worlds' but it did not."),
+    ):
+        asserter(memoryview(b"hello world")).ends_with(b"worlds")
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("asserter", (asserto, Asserto))
+def test_other_prefixes_and_suffixes_are_compared_to_the_first_and_last_bytes(value, asserter) -> None:
+    asserter(value).ends_with(ord("d"))
+    with pytest.raises(AssertionError, match=r"did not start with h$"):
+        asserter(value).starts_with("h")
+    with pytest.raises(AssertionError, match=r"to end with suffix='d' but it did not.$"):
+        asserter(value).ends_with("d")
+
+
+@pytest.mark.parametrize("asserter", (asserto, Asserto))
+def test_equality_failures_report_the_first_differing_offset(asserter) -> None:
+    with pytest.raises(AssertionError) as error:
+        asserter(bytearray(b"abcdef")).is_equal_to(memoryview(b"abcxef"))
+    asserto(str(error.value)).is_equal_to(
+        "bytearray(b'abcdef') is not equal to: memoryview(b'abcxef')\nfirst difference at index 3"
+    )
+    with pytest.raises(AssertionError, match=r"first difference at index 3$"):
+        asserter(b"abc").is_equal_to(b"abcd")
+
+
+def test_large_equality_failures_report_a_window() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(memoryview(b"x" * 100_000 + b"a")).is_equal_to(b"x" * 100_000 + b"b")
+    message = str(error.value)
+    asserto(message[message.index("\nfirst difference") + 1 :].splitlines()).is_equal_to(
+        [
+            "first difference at index 100000:",
+            "    actual[99960:100001]: b'" + "x" * 40 + "a'",
+            "    expected[99960:100001]: b'" + "x" * 40 + "b'",
+        ]
+    )
+
+
+def test_slice_failures_report_the_offset_within_the_value() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(memoryview(b"abcdef")).has_slice(-2, None, b"ex")
+    asserto(str(error.value)).is_equal_to(
+        "memoryview(b'abcdef')[-2:] was not equal to: b'ex'\nfirst difference at index 5"
+    )
+    with pytest.raises(AssertionError, match=r"\[2:4\] was not equal to: b'cde'"):
+        asserto(b"abcdef").has_slice(2, 4, b"cde")
+
+
+def test_formatted_views_compare_by_their_items() -> None:
+    view = memoryview(array.array("I", [1, 2]))
+    asserto(view).is_equal_to(array.array("I", [1, 2])).starts_with(b"\x01\x00")
+    with pytest.raises(AssertionError, match=r"is not equal to: b'\\x01\\x00\\x00\\x00\\x02\\x00\\x00\\x00'$"):
+        asserto(view).is_equal_to(bytes(view))
+
+
+@pytest.mark.parametrize(
+    "method, args, error",
+    [
+        ("starts_with", (memoryview(array.array("I", [1])),), TypeError),
+        ("ends_with", (b"",), ValueError),
+        ("has_slice", (0, 1, "a"), TypeError),
+        ("search", ("a",), TypeError),
+    ],
+)
+def test_invalid_expected_values(method, args, error) -> None:
+    with pytest.raises(error):
+        getattr(asserto(b"abc"), method)(*args)
+
+
+def test_other_values_are_rejected() -> None:
+    with pytest.raises(UnsupportedHandlerTypeError, match=r"`BytesHandler` cannot accept type: <class 'str'>"):
+        asserto("abc").has_slice(0, 1, b"a")
+    asserto(BytesHandler.accepts([1])).is_false()
+
+
+def test_failures_do_not_hold_exports_of_the_value() -> None:
+    value = bytearray(b"abc")
+    with pytest.raises(AssertionError) as error:
+        asserto(value).is_equal_to(b"abd")
+    value.extend(b"d")
+    asserto(str(error.value)).ends_with("first difference at index 2")
+
+
+def test_large_buffers_are_not_copied() -> None:
+    value = memoryview(bytearray(10_000_000))
+    expected = bytes(10_000_000)
+    prefix, tail = expected[:5_000_000], expected[1:]
+    tracemalloc.start()
+    try:
+        asserto(value).is_equal_to(expected).starts_with(prefix).has_slice(1, None, tail)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    asserto(peak).is_lesser_than(1_000_000)
+
+
+@pytest.mark.parametrize("asserter", (asserto, Asserto))
+def test_strided_views_are_compared_by_their_bytes(asserter) -> None:
+    view = memoryview(b"abcdef")[::2]
+    asserter(view).starts_with(b"a").ends_with(b"e").has_slice(0, 1, b"a").has_slice(1, None, view[1:])
+    asserter(b"ace").starts_with(view[:2]).ends_with(view).is_equal_to(view)
+    with pytest.raises(AssertionError, match=r"is not equal to: b'acx'\nfirst difference at index 2$"):
+        asserter(view).is_equal_to(b"acx")
+    with pytest.raises(AssertionError, match=r"did not begin with prefix=b'c'"):
+        asserter(view).starts_with(b"c")
+    with pytest.raises(AssertionError, match=r"\[1:2\] was not equal to: b'x'\nfirst difference at index 1$"):
+        asserter(view).has_slice(1, 2, b"x")
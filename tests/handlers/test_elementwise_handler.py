@@ -0,0 +1,93 @@
+import array
+import re
+
+import pytest
+
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+from asserto.handlers import ElementwiseNumberHandler
+from asserto.handlers import _elementwise
+
+
+@pytest.mark.parametrize(
+    "values",
+    (
+        [1, 2, 3],
+        (1.5, 2.5),
+        range(1, 100),
+        array.array("d", [1.0, 2.0]),
+        memoryview(array.array("i", [1, 2, 3])),
+        (x for x in (1, 2, 3)),
+    ),
+)
+def test_elementwise_success(values) -> None:
+    asserto(values).each().is_positive().is_not_zero()
+
+
+def test_elementwise_chaining_all_methods() -> None:
+    asserto([1, 2, 3]).each().is_greater_than(0).is_lesser_than(4).is_between(0, 4).is_not_between(5, 10)
+    asserto([-1, -2]).each().is_negative()
+    asserto([0, 0.0]).each().is_zero()
+    asserto([1, 2]).each().is_between(1, 2, inclusive=True)
+
+
+def test_failure_reports_count_and_first_offenders() -> None:
+    values = [5, -1, 7, -2, -3, 9]
+    expected = (
+        "Expected every element to be greater than 0 but 3 of 6 were not, first 2 (index, value): [(1, -1), (3, -2)]"
+    )
+    with pytest.raises(AssertionError, match=f"^{re.escape(expected)}$"):
+        asserto(values).each(report=2).is_positive()
+
+
+def test_single_failure_for_many_offenders() -> None:
+    with pytest.raises(AssertionError, match=r"1000000 of 1000000 were not.*\(9, 110\)\]$"):
+        asserto(range(101, 1_000_101)).each().is_between(0, 100)
+
+
+def test_buffer_failure() -> None:
+    with pytest.raises(AssertionError, match=re.escape("1 of 4 were not, first 1 (index, value): [(2, 0)]")):
+        asserto(memoryview(bytes([1, 2, 0, 3]))).each().is_not_zero()
+
+
+def test_multi_dimensional_buffer() -> None:
+    view = memoryview(array.array("i", [1, 2, -3, 4])).cast("B").cast("i", (2, 2))
+    with pytest.raises(AssertionError, match=re.escape("[(2, -3)]")):
+        asserto(view).each().is_positive()
+
+
+def test_not_between_mirrors_scalar_semantics() -> None:
+    asserto([5, 8]).each().is_not_between(5, 8, inclusive=True)
+    with pytest.raises(AssertionError, match=re.escape("[(0, 5)]")):
+        asserto([5]).each().is_not_between(5, 8)
+
+
+@pytest.mark.parametrize("values", ("one", 1, None))
+def test_unsupported_types(values) -> None:
+    with pytest.raises(UnsupportedHandlerTypeError, match="`ElementwiseNumberHandler` cannot accept type"):
+        asserto(values).each().is_positive()
+
+
+def test_numpy_arrays_are_vectorized() -> None:
+    numpy = pytest.importorskip("numpy")
+    values = numpy.arange(-5, 1_000_000)
+    expected = "6 of 1000005 were not, first 3 (index, value): [(0, -5), (1, -4), (2, -3)]"
+    with pytest.raises(AssertionError, match=re.escape(expected)):
+        asserto(values).each(report=3).is_positive()
+    asserto(numpy.ones((3, 3))).each().is_positive()
+
+
+def test_buffers_are_scanned_in_python_without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(_elementwise, "_numpy", False)
+    monkeypatch.setattr(ElementwiseNumberHandler, "_vectorized_scan", None)
+    values = array.array("d", [1.0, -2.0, 3.0, -4.0])
+    expected = "2 of 4 were not, first 1 (index, value): [(1, -2.0)]"
+    with pytest.raises(AssertionError, match=re.escape(expected)):
+        asserto(values).each(report=1).is_positive()
+    asserto(memoryview(values)).each().is_between(-5, 5)
+
+
+def test_elementwise_in_soft_context() -> None:
+    with pytest.raises(AssertionError, match="2 Soft Assertion Failures"):
+        with asserto([-1, 1]) as soft:
+            soft.each().is_positive().is_negative()
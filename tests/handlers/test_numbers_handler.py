@@ -108,3 +108,8 @@ def test_is_not_between_fails_correctly() -> None:
 def test_more_than_less_than() -> None:
     asserto(1).is_less_than(2)
     asserto(5).is_more_than(3)
+
+
+def test_is_between_inclusive_fails_correctly() -> None:
+    with pytest.raises(AssertionError, match=re.escape(r"Expected 102 to be inclusively between: (100, ..., 101)")):
+        asserto(102).is_between_inclusive(100, 101)
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 import pytest
 from tests.utility.error_templates import invalid_actual_regex
 
@@ -15,7 +17,7 @@ def test_prefix_with_empty_string_raises_value_error() -> None:
 
 
 def test_actual_not_string_or_iterable() -> None:
-    with pytest.raises(TypeError, match=invalid_actual_regex(None, str, "starts_with")):
+    with pytest.raises(TypeError, match=invalid_actual_regex(None, Iterable, "starts_with")):
         asserto(None).starts_with("foo")
 
 
@@ -1,5 +1,6 @@
 import pytest
 
+from asserto import Asserto
 from asserto import NoAssertAttemptedWarning
 from asserto import asserto
 
@@ -41,3 +42,25 @@ def test_can_be_reassigned() -> None:
         a.is_equal_to(100)
         a.actual = 200
         a.is_equal_to(200)
+
+
+def test_instances_are_slotted() -> None:
+    x = asserto(1)
+    asserto(hasattr(x, "__dict__")).is_false()
+    asserto(x._error_handler).is_none()
+    asserto(x._handlers).is_none()
+
+
+def test_error_handler_created_lazily() -> None:
+    x = asserto(1)
+    with x:
+        asserto(x._error_handler).is_not_none()
+
+
+def test_subclasses_can_add_attributes() -> None:
+    class Custom(Asserto):
+        def __init__(self, actual) -> None:
+            super().__init__(actual)
+            self.extra = "extra"
+
+    asserto(Custom(1).is_equal_to(1).extra).is_equal_to("extra")
@@ -0,0 +1,100 @@
+import asyncio
+import inspect
+import warnings
+
+import pytest
+
+from asserto import Asserto
+from asserto import asserto
+from asserto import register_assert
+
+
+async def _raiser(x: bool) -> None:
+    await asyncio.sleep(0)
+    if x:
+        raise ValueError("This is broken.")
+
+
+def test_async_should_raise() -> None:
+    asyncio.run(asserto(_raiser).should_raise(ValueError).when_called_with(True))
+
+
+def test_async_should_raise_returns_awaitable() -> None:
+    awaitable = asserto(_raiser).should_raise(ValueError).when_called_with(True)
+    asserto(inspect.isawaitable(awaitable)).is_true()
+    asyncio.run(awaitable)
+
+
+def test_async_should_raise_when_no_exc() -> None:
+    with pytest.raises(AssertionError, match=r"^_raiser did not raise any of \(<class 'ValueError'>,\)"):
+        asyncio.run(asserto(_raiser).should_raise(ValueError).when_called_with(False))
+
+
+def test_async_should_raise_wrong_exception() -> None:
+    async def raises() -> None:
+        raise RuntimeError("test")
+
+    with pytest.raises(AssertionError, match=r"Instead it raised <class 'RuntimeError'>"):
+        asyncio.run(asserto(raises).should_raise(ZeroDivisionError).when_called_with())
+
+
+def test_async_should_raise_pattern_mismatch() -> None:
+    with pytest.raises(AssertionError, match=r"occurred but did not match pattern"):
+        asyncio.run(asserto(_raiser).should_raise(ValueError, match="other").when_called_with(True))
+
+
+def test_async_should_raise_runs_on_the_running_loop() -> None:
+    loops = []
+
+    async def raises() -> None:
+        loops.append(asyncio.get_running_loop())
+        raise ValueError
+
+    async def main() -> asyncio.AbstractEventLoop:
+        await asserto(raises).should_raise(ValueError).when_called_with()
+        return asyncio.get_running_loop()
+
+    asserto(loops).is_equal_to([asyncio.run(main())])
+
+
+def test_async_should_raise_propagates_cancellation() -> None:
+    async def cancelled() -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(asserto(cancelled).should_raise(ValueError).when_called_with())
+    asyncio.run(asserto(cancelled).should_raise(asyncio.CancelledError).when_called_with())
+
+
+def test_should_raise_marks_triggered() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with asserto(_raiser, warn_unused=True) as a:
+            asyncio.run(a.should_raise(ValueError).when_called_with(True))
+
+
+async def is_eventually_five(self) -> Asserto:
+    await asyncio.sleep(0)
+    if self.actual != 5:
+        self.error(f"{self.actual} was not eventually 5")
+    return self
+
+
+@pytest.fixture(scope="function")
+def bind_async_function(request) -> None:
+    register_assert(is_eventually_five)
+    request.addfinalizer(lambda: delattr(Asserto, is_eventually_five.__name__))
+
+
+@pytest.mark.usefixtures("bind_async_function")
+def test_async_register_assert() -> None:
+    asserto(inspect.iscoroutinefunction(Asserto.is_eventually_five)).is_true()
+    a = asserto(5)
+    asserto(asyncio.run(a.is_eventually_five())).has_same_identity_as(a)
+    asserto(a._triggered).is_true()
+
+
+@pytest.mark.usefixtures("bind_async_function")
+def test_async_register_assert_failure() -> None:
+    with pytest.raises(AssertionError, match="4 was not eventually 5"):
+        asyncio.run(asserto(4).is_eventually_five())
@@ -0,0 +1,237 @@
+import logging
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from asserto import DeferredChecker
+from asserto import asserto
+from asserto import get_deferred_checker
+from asserto import set_mode
+from asserto._deferred import Deferred
+
+
+@pytest.fixture
+def failures():
+    return []
+
+
+@pytest.fixture
+def checker(failures):
+    with DeferredChecker(maxsize=16, on_failure=failures.append) as checker:
+        yield checker
+
+
+def _immediate_error(value, chain) -> str:
+    with pytest.raises(AssertionError) as error:
+        chain(asserto(value))
+    return str(error.value)
+
+
+def test_passing_chains_report_nothing(checker, failures) -> None:
+    for i in range(10):
+        asserto(asserto(i).deferred(checker).is_instance(int).is_between(-1, 10).submit()).is_true()
+    checker.flush()
+    asserto(failures).is_empty()
+    asserto((checker.submitted, checker.checked, checker.failed, checker.dropped)).is_equal_to((10, 10, 0, 0))
+
+
+def test_failures_agree_with_immediate_assertions(checker, failures) -> None:
+    asserto("foo").described_as("name").deferred(checker).starts_with("f").has_length(3).ends_with("x").submit()
+    asserto({"a": 1}).deferred(checker).a_is(2).submit()
+    checker.flush()
+    asserto([(failure.value, failure.step) for failure in failures]).is_equal_to(
+        [("foo", "ends_with('x')"), ({"a": 1}, "a_is(2)")]
+    )
+    asserto(str(failures[0].error)).is_equal_to(
+        _immediate_error("foo", lambda a: a.described_as("name").ends_with("x"))
+    )
+    asserto(str(failures[1].error)).is_equal_to(_immediate_error({"a": 1}, lambda a: a.a_is(2)))
+    asserto(checker.failed).is_equal_to(2)
+
+
+def test_errors_are_reported_as_failures(checker, failures) -> None:
+    asserto(1).deferred(checker).is_equal_to(1).has_length(1).submit()
+    checker.flush()
+    asserto(failures[0].step).is_equal_to("has_length(1)")
+    asserto(failures[0].error).is_instance(TypeError)
+
+
+def test_steps_are_replayed_on_the_result_of_the_previous_step(checker, failures) -> None:
+    asserto([1, 2]).deferred(checker).each().is_positive().submit()
+    asserto([1, -1]).deferred(checker).described_as("readings").each().is_positive().submit()
+    checker.flush()
+    asserto([failure.step for failure in failures]).is_equal_to(["is_positive()"])
+    asserto(str(failures[0].error)).is_equal_to(
+        _immediate_error([1, -1], lambda a: a.described_as("readings").each().is_positive())
+    )
+
+
+@pytest.mark.parametrize("name", ["should_raise", "eventually_async", "deferred"])
+def test_switches_which_cannot_be_replayed_are_rejected(checker, name) -> None:
+    with pytest.raises(AttributeError, match=f"{name} cannot be deferred"):
+        getattr(asserto(1).deferred(checker), name)
+
+
+def test_unknown_assertions_are_rejected_when_recorded(checker) -> None:
+    asserto(1).deferred(checker).is_equal_to(1).is_between_inclusive(0, 1)
+    with pytest.raises(AttributeError, match="unknown assertion method: foo"):
+        asserto(1).deferred(checker).foo()
+
+
+def test_recording_triggers_the_referent(checker) -> None:
+    referent = asserto(1)
+    deferred = referent.deferred(checker).is_positive()
+    asserto(referent._triggered).is_true()
+    asserto(repr(deferred)).is_equal_to("Deferred(is_positive())")
+
+
+class _Holder:
+    """Holds the worker thread of a checker (when checked) until released."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def hold(self) -> bool:
+        self.started.set()
+        return self.release.wait()
+
+
+def _block(checker: DeferredChecker) -> threading.Event:
+    holder = _Holder()
+    asserto(holder).deferred(checker).hold_is(True).submit()
+    holder.started.wait()
+    return holder.release
+
+
+def test_drop_policy_never_waits() -> None:
+    with DeferredChecker(maxsize=4, policy="drop") as checker:
+        release = _block(checker)
+        accepted = [asserto(i).deferred(checker).is_positive().submit() for i in range(10)]
+        release.set()
+    asserto(accepted).is_equal_to([True] * 4 + [False] * 6)
+    asserto((checker.dropped, checker.checked)).is_equal_to((6, 5))
+
+
+def test_block_policy_waits_for_room() -> None:
+    with DeferredChecker(maxsize=1, policy="block") as checker:
+        release = _block(checker)
+        asserto(1).deferred(checker).is_positive().submit()
+        submitter = threading.Thread(target=lambda: asserto(2).deferred(checker).is_positive().submit())
+        submitter.start()
+        submitter.join(0.05)
+        asserto(submitter.is_alive()).is_true()
+        release.set()
+        submitter.join()
+    asserto((checker.dropped, checker.checked)).is_equal_to((0, 3))
+
+
+def test_sample_policy_keeps_a_fraction_under_load() -> None:
+    with DeferredChecker(maxsize=1000, policy="sample", sample_rate=0.1) as checker:
+        release = _block(checker)
+        accepted = sum(asserto(i).deferred(checker).is_positive().submit() for i in range(10_000))
+        release.set()
+    # 500 chains fill half the queue, the remaining 500 places are filled by a sample of the rest.
+    asserto(accepted).is_equal_to(1000)
+    asserto(checker.dropped).is_equal_to(9000)
+
+
+def test_default_checker_logs_failures(caplog) -> None:
+    default = get_deferred_checker()
+    asserto(get_deferred_checker()).has_same_identity_as(default)
+    with caplog.at_level(logging.ERROR, logger="asserto"):
+        asserto(5).deferred().is_zero().submit()
+        default.flush()
+    asserto(caplog.text).contains("deferred assertion is_zero() failed: Expected 5 to be 0 but it was not.")
+
+
+def test_install_replaces_the_default_checker(failures) -> None:
+    previous = get_deferred_checker()
+    checker = DeferredChecker(on_failure=failures.append).install()
+    try:
+        asserto(get_deferred_checker()).has_same_identity_as(checker)
+        asserto(1).deferred().is_zero().submit()
+        checker.flush()
+        asserto(failures).has_length(1)
+    finally:
+        DeferredChecker().install()
+        checker.close()
+    asserto(get_deferred_checker()).is_not_none()
+    asserto(previous).is_not_none()
+
+
+def test_off_mode_skips_deferred_chains(checker) -> None:
+    set_mode("off")
+    try:
+        asserto(asserto(1).deferred(checker).is_zero().submit()).is_false()
+    finally:
+        set_mode("full")
+    asserto(checker.submitted).is_zero()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"policy": "wait"}, {"maxsize": 0}, {"workers": 0}, {"sample_rate": 2}],
+)
+def test_invalid_checkers(kwargs) -> None:
+    with pytest.raises(ValueError):
+        DeferredChecker(**kwargs)
+
+
+def test_chains_are_checked_against_the_referent_as_submitted(failures) -> None:
+    checker = DeferredChecker(on_failure=failures.append)
+    release = _block(checker)
+    referent = asserto(1).described_as("first")
+    referent.deferred(checker).is_zero().submit()
+    referent.rebind(2).described_as("second")
+    release.set()
+    checker.close()
+    asserto([(failure.value, str(failure.error)) for failure in failures]).is_equal_to([(1, "first")])
+
+
+def test_submitting_while_closing_never_hangs() -> None:
+    checker = DeferredChecker(maxsize=64, workers=2, policy="block")
+    stop = threading.Event()
+
+    def submit() -> None:
+        while not stop.is_set():
+            asserto(1).deferred(checker).is_positive().submit()
+
+    submitters = [threading.Thread(target=submit) for _ in range(2)]
+    for submitter in submitters:
+        submitter.start()
+    try:
+        for _ in range(50):
+            closer = threading.Thread(target=checker.close, daemon=True)
+            closer.start()
+            closer.join(5)
+            asserto(closer.is_alive()).is_false()
+    finally:
+        stop.set()
+        for submitter in submitters:
+            submitter.join()
+    checker.close()
+    asserto((checker.checked, checker.failed)).is_equal_to((checker.submitted, 0))
+
+
+def test_queued_chains_are_checked_at_exit() -> None:
+    code = (
+        "import time\n"
+        "from asserto import DeferredChecker, asserto\n"
+        "checker = DeferredChecker(on_failure=lambda failure: print(failure.step, flush=True))\n"
+        "class Slow:\n"
+        "    def wait(self):\n"
+        "        time.sleep(0.2)\n"
+        "        return True\n"
+        "asserto(Slow()).deferred(checker).wait_is(True).submit()\n"
+        "for i in range(3):\n"
+        "    asserto(i).deferred(checker).is_greater_than(5).submit()\n"
+    )
+    process = subprocess.run((sys.executable, "-c", code), capture_output=True, text=True, check=True)
+    asserto(process.stdout.splitlines()).is_equal_to(["is_greater_than(5)"] * 3)
+
+
+def test_deferred_is_compact() -> None:
+    asserto(hasattr(Deferred(asserto(1)), "__dict__")).is_false()
@@ -0,0 +1,205 @@
+import collections
+import dataclasses
+import re
+
+import pytest
+
+from asserto import Asserto
+from asserto import RenderLimits
+from asserto import asserto
+from asserto._diff import differences
+from asserto._rendering import FailureMessage
+
+Point = collections.namedtuple("Point", "x y")
+
+
+@dataclasses.dataclass
+class Item:
+    name: str
+    tags: list
+    cached: int = dataclasses.field(default=0, compare=False)
+
+
+def _failure(actual, expected) -> str:
+    with pytest.raises(AssertionError) as error:
+        asserto(actual).is_equal_to(expected)
+    return str(error.value)
+
+
+def _differences(message: str) -> list:
+    return message.split("\ndifferences:\n")[1].splitlines()
+
+
+def test_nested_paths() -> None:
+    actual = {"a": [1, 2, 3, Point(1, {"b": Item("x", [1])})]}
+    expected = {"a": [1, 2, 3, Point(1, {"b": Item("x", [2])})]}
+    asserto(_differences(_failure(actual, expected))).is_equal_to(["    root['a'][3].y['b'].tags[0]: 1 != 2"])
+
+
+def test_missing_and_unexpected_keys() -> None:
+    asserto(_differences(_failure({"a": 1, "b": 2}, {"b": 2, "c": 3}))).is_equal_to(
+        ["    root['a']: unexpected 1", "    root['c']: missing 3"]
+    )
+
+
+def test_sequence_lengths() -> None:
+    asserto(_differences(_failure([1, 2, 3], [1]))).is_equal_to(
+        ["    root[1]: unexpected 2", "    root[2]: unexpected 3"]
+    )
+    asserto(_differences(_failure((1,), (1, 2)))).is_equal_to(["    root[1]: missing 2"])
+
+
+def test_sets() -> None:
+    asserto(_differences(_failure({1, 2}, {2, 3}))).is_equal_to(
+        ["    root: unexpected item 1", "    root: missing item 3"]
+    )
+
+
+def test_dataclass_fields_excluded_from_comparison_are_ignored() -> None:
+    actual, expected = Item("x", [], cached=1), Item("y", [], cached=2)
+    asserto(_differences(_failure(actual, expected))).is_equal_to(["    root.name: 'x' != 'y'"])
+
+
+def test_differences_stop_after_the_limit() -> None:
+    actual = {i: i for i in range(200_000)}
+    expected = {i: i + 1 for i in range(200_000)}
+    found, truncated = differences(actual, expected, 10)
+    asserto(found).has_length(10)
+    asserto(truncated).is_true()
+    message = _failure(actual, expected)
+    asserto(message).ends_with("    ... stopped after 10 differences")
+    asserto(len(message)).is_lesser_than(2500)
+
+
+def test_large_sequence_reports_only_the_difference() -> None:
+    actual = list(range(1_000_000))
+    expected = actual[:-1] + [-1]
+    asserto(_differences(_failure(actual, expected))).is_equal_to(["    root[999999]: 999999 != -1"])
+
+
+class _Counted:
+    """A leaf counting how many times it is compared."""
+
+    compared = 0
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        _Counted.compared += 1
+        return isinstance(other, _Counted) and self.value == other.value
+
+    def __repr__(self) -> str:
+        return f"_Counted({self.value})"
+
+
+def _nested(depth: int, last: int) -> list:
+    value = [_Counted(last)]
+    for i in range(depth):
+        value = [_Counted(i), {"next": value}]
+    return value
+
+
+def test_every_value_is_compared_a_bounded_number_of_times() -> None:
+    actual, expected = _nested(200, 1), _nested(200, 2)
+    _Counted.compared = 0
+    found, _ = differences(actual, expected, 10)
+    asserto([difference.render(RenderLimits()) for difference in found]).is_equal_to(
+        ["root[1]['next']" + "[1]['next']" * 199 + "[0]: _Counted(1) != _Counted(2)"]
+    )
+    # 201 leaves, each compared by the chunk of the root and once where it is found.
+    asserto(_Counted.compared).is_lesser_than(2 * 201 + 1)
+
+
+def test_maxdiffs_is_bound_with_the_message() -> None:
+    with pytest.raises(AssertionError) as error:
+        Asserto([1, 2, 3], render_limits=RenderLimits(maxdiffs=1)).is_equal_to([4, 5, 6])
+    asserto(_differences(str(error.value))).is_equal_to(["    root[0]: 1 != 4", "    ... stopped after 1 differences"])
+
+
+def test_values_of_different_kinds_are_not_diffed() -> None:
+    asserto(_failure([1], (1,))).is_equal_to("[1] is not equal to: (1,)")
+    asserto(_failure("a", "b")).is_equal_to("a is not equal to: b")
+
+
+def test_diff_is_computed_lazily(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr("asserto._diff.differences", lambda *args: calls.append(args))
+    with pytest.raises(AssertionError) as error:
+        asserto([1]).is_equal_to([2])
+    asserto(calls).is_empty()
+    asserto(error.value.message).is_instance(FailureMessage)
+
+
+def test_unicode_keys_are_rendered_bounded() -> None:
+    message = _failure({"k" * 5000: 1}, {"k" * 5000: 2})
+    asserto(re.search(r"root\['k+'\.\.\.'k+'\]: 1 != 2", message)).is_not_none()
+
+
+HTML = "".join(f"<p>line {i}</p>\n" for i in range(200_000))
+CHANGED = HTML.replace("<p>line 150000</p>", "<p>line 150000!</p>")
+
+
+def _text_diff(message: str) -> list:
+    return message[message.index("\nfirst difference") + 1 :].splitlines()
+
+
+def test_large_strings_report_a_window_and_unified_diff() -> None:
+    message = _failure(HTML, CHANGED)
+    asserto(len(message)).is_lesser_than(3000)
+    asserto(_text_diff(message)).is_equal_to(
+        [
+            "first difference at index 2738904 (line 150001, column 15):",
+            "    actual[2738864:2738944]: '98</p>\\n<p>line 149999</p>\\n<p>line 150000</p>\\n<p>line 150001</p>\\n"
+            "<p>line 150002</'",
+            "    expected[2738864:2738944]: '98</p>\\n<p>line 149999</p>\\n<p>line 150000!</p>\\n<p>line 150001</p>\\n"
+            "<p>line 150002<'",
+            "--- actual",
+            "+++ expected",
+            "@@ -149998,7 +149998,7 @@",
+            " <p>line 149997</p>",
+            " <p>line 149998</p>",
+            " <p>line 149999</p>",
+            "-<p>line 150000</p>",
+            "+<p>line 150000!</p>",
+            " <p>line 150001</p>",
+            " <p>line 150002</p>",
+            " <p>line 150003</p>",
+        ]
+    )
+
+
+def test_large_bytes_report_a_window() -> None:
+    message = _failure(bytearray(b"x" * 100_000 + b"a"), b"x" * 100_000 + b"b")
+    asserto(_text_diff(message)).is_equal_to(
+        [
+            "first difference at index 100000:",
+            "    actual[99960:100001]: b'" + "x" * 40 + "a'",
+            "    expected[99960:100001]: b'" + "x" * 40 + "b'",
+        ]
+    )
+
+
+def test_visible_text_differences_are_not_repeated() -> None:
+    asserto(_failure("a" * 1_000_000, "b")).is_equal_to("a" * 498 + "..." + "a" * 499 + " is not equal to: b")
+    asserto(_failure("abc", "abd")).is_equal_to("abc is not equal to: abd")
+
+
+def test_starts_with_reports_where_the_prefix_differs() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(HTML).starts_with(CHANGED[:3_000_000])
+    asserto(_text_diff(str(error.value))[2]).starts_with("    prefix[2738864:2738944]: ")
+
+
+def test_ends_with_reports_where_the_suffix_differs() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(HTML).ends_with("x" + HTML[-5000:])
+    message = str(error.value)
+    asserto(message[message.index("\nthe last") + 1 :].splitlines()).is_equal_to(
+        [
+            "the last 5000 characters matched, they differ before:",
+            "    actual[3683850:3683930]: '</p>\\n<p>line 199735</p>\\n<p>line 199736</p>\\n<p>line 199737</p>\\n"
+            "<p>line 199738</p>'",
+            "    suffix[0:41]: 'xp>\\n<p>line 199737</p>\\n<p>line 199738</p>'",
+        ]
+    )
@@ -0,0 +1,57 @@
+import pytest
+
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+from asserto._const import Methods
+from asserto._dispatch import _dispatch_cache
+from asserto._dispatch import clear_dispatch_cache
+from asserto._dispatch import resolve
+from asserto.handlers import BaseHandler
+from asserto.handlers import NumberHandler
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_dispatch_cache()
+    yield
+    clear_dispatch_cache()
+
+
+def test_resolution_is_cached_per_type() -> None:
+    resolve(NumberHandler, Methods.IS_ZERO, 0)
+    resolve(NumberHandler, Methods.IS_ZERO, 1)
+    keys = list(_dispatch_cache)
+    asserto(keys).is_equal_to([(int, NumberHandler, Methods.IS_ZERO)])
+    asserto(_dispatch_cache[(int, NumberHandler, Methods.IS_ZERO)]).is_equal_to(NumberHandler.is_zero)
+
+
+def test_rejected_types_are_cached() -> None:
+    for _ in range(2):
+        with pytest.raises(UnsupportedHandlerTypeError, match="when calling: is_zero"):
+            resolve(NumberHandler, Methods.IS_ZERO, "foo")
+    asserto(_dispatch_cache[(str, NumberHandler, Methods.IS_ZERO)]).is_none()
+
+
+def test_unknown_handler_method() -> None:
+    with pytest.raises(TypeError, match="assertion method: not_a_method was not a callable on the handler"):
+        resolve(BaseHandler, "not_a_method", 1)
+
+
+def test_chain_reuses_a_single_handler() -> None:
+    a = asserto(5).is_positive().is_between(1, 10).is_not_zero()
+    handler = a._handlers[NumberHandler]
+    a.is_greater_than(4)
+    asserto(a._handlers[NumberHandler]).has_same_identity_as(handler)
+
+
+def test_handlers_are_rebuilt_when_actual_changes() -> None:
+    a = asserto(5).is_positive()
+    a.actual = 10
+    asserto(a._handlers).is_none()
+    a.is_greater_than(9)
+    asserto(a._handlers[NumberHandler].actual).is_equal_to(10)
+
+
+def test_description_on_dispatched_failure() -> None:
+    with pytest.raises(AssertionError, match="^custom$"):
+        asserto(1).described_as("custom").is_zero()
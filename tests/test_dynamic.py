@@ -53,3 +53,35 @@ def test_no_attr_raises_attribute_error() -> None:
 def test_single_argument() -> None:
     with pytest.raises(TypeError, match=re.escape("Dynamic assertion takes 1 argument but 2 was given. (1, 2)")):
         asserto(dict(a=1)).a_is(1, 2)
+
+
+def test_nested_lookups() -> None:
+    Address = namedtuple("Address", "city")
+    asserto({"address": {"city": "Dublin"}}).address__city_is("Dublin")
+    asserto(Dynamic(address=Address("Cork"))).address__city_is("Cork")
+    asserto(SimpleNamespace(inner={"x": Dynamic(y=1)})).inner__x__y_is(1)
+
+
+def test_nested_lookup_missing() -> None:
+    with pytest.raises(AssertionError, match=re.escape("{'city': 'Dublin'} missing key: country")):
+        asserto({"address": {"city": "Dublin"}}).address__country_is("Ireland")
+
+
+def test_nested_lookup_not_equal() -> None:
+    with pytest.raises(AssertionError, match="Dublin was not equal to: Cork"):
+        asserto({"address": {"city": "Dublin"}}).address__city_is("Cork")
+
+
+def test_dunder_names_are_not_nested() -> None:
+    asserto({"__private": 1, "_a__": 2}).__private_is(1)._a___is(2)
+
+
+def test_lookups_are_reused() -> None:
+    first, second = asserto(Dynamic(a=1)), asserto(Dynamic(a=2))
+    asserto(first.a_is.__func__).has_same_identity_as(second.a_is.__func__)
+
+
+def test_missing_lookup_in_soft_context() -> None:
+    with pytest.raises(AssertionError, match="{} missing attribute: a"):
+        with asserto(Dynamic()) as soft:
+            soft.a_is(1)
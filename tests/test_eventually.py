@@ -0,0 +1,105 @@
+import asyncio
+import itertools
+import time
+
+import pytest
+
+from asserto import asserto
+from asserto._eventually import Schedule
+
+
+def _counter(start: int = 0):
+    return itertools.count(start).__next__
+
+
+def test_eventually_passes_once_consistent() -> None:
+    a = asserto(_counter()).eventually(timeout=1, interval=0.001).is_greater_than(3).is_equal_to(5)
+    asserto(a.asserto_ref.actual).is_equal_to(5)
+
+
+def test_eventually_chains_dynamic_lookups() -> None:
+    states = iter(({"status": "pending"}, {"status": "ready"}))
+    asserto(lambda: next(states)).eventually(timeout=1, interval=0.001).status_is("ready")
+
+
+def test_eventually_reports_last_failure_and_attempts() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(_counter()).eventually(timeout=0.05, interval=0.001).is_lesser_than(0)
+    asserto(str(error.value)).match(
+        r"^__next__ did not eventually pass within 0.05s, \d+ attempts in 0.0\d+s, last failure: "
+        r"Expected \d+ to be lesser than 0, but it was not\.$"
+    )
+
+
+def test_eventually_respects_timeout() -> None:
+    start = time.monotonic()
+    with pytest.raises(AssertionError):
+        asserto(lambda: 1).eventually(timeout=0.1, interval=0.01, backoff=1.5).is_zero()
+    asserto(time.monotonic() - start).is_between(0.1, 0.5)
+
+
+def test_eventually_in_soft_context() -> None:
+    with pytest.raises(AssertionError, match="1 Soft Assertion Failures"):
+        with asserto(lambda: 1) as soft:
+            soft.eventually(timeout=0.01, interval=0.001).is_zero()
+
+
+def test_eventually_requires_callable() -> None:
+    with pytest.raises(ValueError, match="1 is not callable."):
+        asserto(1).eventually()
+
+
+def test_eventually_unknown_method() -> None:
+    with pytest.raises(AttributeError, match="unknown assertion method: is_nonsense"):
+        asserto(lambda: 1).eventually().is_nonsense()
+
+
+def test_eventually_chains_through_mode_switches() -> None:
+    readings = iter(([1, -1], [1, 2]))
+    a = asserto(lambda: next(readings)).eventually(timeout=1, interval=0.001).each().is_positive()
+    asserto(a.asserto_ref.actual).is_equal_to([1, 2])
+    with pytest.raises(AssertionError, match=r"last failure: Expected every element to be greater than 0 but 1 of 2"):
+        asserto(lambda: [1, -1]).eventually(timeout=0.01, interval=0.001).each().is_positive()
+
+
+@pytest.mark.parametrize("name", ["should_raise", "eventually", "eventually_async", "deferred"])
+def test_eventually_rejects_switches_which_cannot_be_polled(name) -> None:
+    with pytest.raises(AttributeError, match=f"{name} cannot be polled"):
+        getattr(asserto(lambda: 1).eventually(timeout=0.01), name)
+
+
+def test_schedule_backoff_is_capped() -> None:
+    delays = list(itertools.islice(Schedule(interval=0.1, backoff=2, max_interval=0.5), 5))
+    asserto(delays).is_equal_to([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_schedule_jitter() -> None:
+    for delay in itertools.islice(Schedule(interval=1, backoff=1, max_interval=1, jitter=0.1), 100):
+        asserto(delay).is_between(0.9, 1.1, inclusive=True)
+
+
+@pytest.mark.parametrize("kwargs", [dict(interval=-1), dict(backoff=0.5), dict(jitter=2)])
+def test_schedule_invalid(kwargs) -> None:
+    with pytest.raises(ValueError, match="invalid schedule"):
+        Schedule(**kwargs)
+
+
+def test_eventually_async_awaits_coroutines() -> None:
+    counter = _counter()
+
+    async def fetch() -> int:
+        await asyncio.sleep(0)
+        return counter()
+
+    async def main():
+        return await asserto(fetch).eventually_async(timeout=1, interval=0.001).is_greater_than(2)
+
+    asserto(asyncio.run(main()).actual).is_equal_to(3)
+
+
+def test_eventually_async_timeout() -> None:
+    async def main():
+        await asserto(lambda: 1).eventually_async(timeout=0.02, interval=0.001).is_zero()
+
+    with pytest.raises(AssertionError, match=r"did not eventually pass within 0.02s, \d+ attempts"):
+        asyncio.run(main())
@@ -0,0 +1,92 @@
+import os
+import pathlib
+import re
+import subprocess
+import sys
+
+import pytest
+
+import asserto as asserto_package
+from asserto import asserto
+
+# The budget for `import asserto` once `typing` (which asserto cannot avoid) is imported, deliberately
+# generous for slow CI machines; the deferred module checks below catch most regressions precisely.
+IMPORT_BUDGET_US = 60_000
+
+# Modules which must only be imported on first use.
+DEFERRED_MODULES = (
+    "asserto._deferred",
+    "asserto._diff",
+    "asserto._eventually",
+    "asserto._exc_handling",
+    "asserto._elementwise",
+    "asserto._parallel",
+    "asserto._patterns",
+    "asserto._plan",
+    "asserto._softly",
+    "asserto._spec",
+    "asserto._specialized",
+    "asserto.handlers._base",
+    "asserto.handlers._elementwise",
+    "asserto.handlers._iterables",
+    "asserto.handlers._numeric",
+    "asserto.handlers._regex",
+    "asyncio",
+    "concurrent.futures",
+    "dataclasses",
+    "difflib",
+    "inspect",
+    "logging",
+    "numbers",
+    "pprint",
+    "queue",
+    "random",
+    "rich",
+    "string",
+    "threading",
+    "typing_extensions",
+)
+
+
+def _python(code: str, *options: str) -> subprocess.CompletedProcess:
+    root = str(pathlib.Path(asserto_package.__file__).parent.parent)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH"))))}
+    return subprocess.run((sys.executable, *options, "-c", code), capture_output=True, text=True, check=True, env=env)
+
+
+def test_import_time_budget() -> None:
+    timings = []
+    for _ in range(3):
+        stderr = _python("import typing, asserto", "-X", "importtime").stderr
+        timings += [int(t) for t in re.findall(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+asserto$", stderr, re.M)]
+    asserto(min(timings)).is_lesser_than(IMPORT_BUDGET_US)
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_import_defers_modules(module: str) -> None:
+    code = f"import sys; before = set(sys.modules); import asserto; print({module!r} in set(sys.modules) - before)"
+    stdout = _python(code)
+    asserto(stdout.stdout.strip()).is_equal_to("False")
+
+
+def test_import_defers_re() -> None:
+    # `typing` imports `re` itself on some versions of python, it is dropped to check what asserto imports.
+    code = (
+        "import sys, typing\n"
+        "for name in [name for name in sys.modules if name == 're' or name.startswith('re.')]:\n"
+        "    del sys.modules[name]\n"
+        "import asserto\n"
+        "print('re' in sys.modules)"
+    )
+    asserto(_python(code).stdout.strip()).is_equal_to("False")
+
+
+def test_lazy_attributes() -> None:
+    stdout = _python("import asserto; asserto.precompile('x'); print(asserto.pattern_cache_info().currsize)")
+    asserto(stdout.stdout.strip()).is_equal_to("1")
+    asserto(dir(asserto_package)).contains("RenderLimits")
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="module 'asserto' has no attribute 'nonsense'"):
+        asserto_package.nonsense  # noqa
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+import asserto as asserto_package
+from asserto import Profiler
+from asserto import asserto
+from asserto import get_profiler
+
+
+def _raiser() -> None:
+    raise ValueError("broken")
+
+
+def test_profiler_records_dispatched_assertions() -> None:
+    with Profiler() as profiler:
+        asserto(1).is_equal_to(1).is_positive()
+        with pytest.raises(AssertionError):
+            asserto(1).is_equal_to(2)
+    stats = profiler.stats()
+    equal = stats["BaseHandler.is_equal_to"]
+    asserto(equal["count"]).is_equal_to(2)
+    asserto(equal["failures"]).is_equal_to(1)
+    asserto(equal["failure_rate"]).is_equal_to(0.5)
+    asserto(stats["NumberHandler.is_positive"]["count"]).is_equal_to(1)
+
+
+def test_profiler_records_mixins_and_exception_checks() -> None:
+    with Profiler() as profiler:
+        asserto("foo").starts_with("f")
+        asserto(_raiser).should_raise(ValueError).when_called_with()
+    stats = profiler.stats()
+    asserto(stats).contains("AssertsStringsMixin.starts_with").contains("ExceptionChecker.when_called_with")
+
+
+def test_profiler_records_soft_failures() -> None:
+    with Profiler() as profiler:
+        with pytest.raises(AssertionError):
+            with asserto("foo") as soft:
+                soft.starts_with("x")
+                soft.is_equal_to("bar")
+    stats = profiler.stats()
+    asserto(stats["AssertsStringsMixin.starts_with"]["failures"]).is_equal_to(1)
+    asserto(stats["BaseHandler.is_equal_to"]["failures"]).is_equal_to(1)
+
+
+def test_profiler_percentiles_and_json() -> None:
+    profiler = Profiler(sample_size=10)
+    for duration in range(1, 101):
+        profiler.record("Owner", "method", duration, duration > 90)
+    stats = json.loads(profiler.to_json())["Owner.method"]
+    asserto(stats["count"]).is_equal_to(100)
+    asserto(stats["total_ns"]).is_equal_to(5050)
+    asserto(stats["max_ns"]).is_equal_to(100)
+    asserto(stats["failure_rate"]).is_equal_to(0.1)
+    asserto(profiler.methods[("Owner", "method")].samples).has_length(10)
+    asserto(stats["p50_ns"]).is_between(1, 100, inclusive=True)
+
+
+def test_profiler_hook() -> None:
+    measurements = []
+    with Profiler(hook=measurements.append):
+        asserto(0).is_zero()
+    asserto(measurements).has_length(1)
+    asserto(measurements[0][:2]).is_equal_to(("NumberHandler", "is_zero"))
+    asserto(measurements[0].failed).is_false()
+
+
+def test_profiler_is_disabled_by_default_and_on_exit() -> None:
+    asserto(get_profiler()).is_none()
+    with Profiler() as profiler:
+        enabled = get_profiler()
+    asserto(enabled).has_same_identity_as(profiler)
+    asserto(asserto_package.get_profiler()).is_none()
+    asserto(1).is_equal_to(1)
+    asserto(profiler.stats()).is_empty()
+
+
+def test_profiler_reset() -> None:
+    with Profiler() as profiler:
+        asserto(1).is_equal_to(1)
+    profiler.reset()
+    asserto(profiler.stats()).is_empty()
@@ -0,0 +1,76 @@
+import re
+
+import pytest
+
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+
+
+def counting(n: int, consumed: list):
+    for i in range(n):
+        consumed.append(i)
+        yield i
+
+
+def test_is_empty() -> None:
+    asserto([]).is_empty()
+    asserto(iter(())).is_empty()
+    with pytest.raises(AssertionError, match=re.escape("[1] was not empty")):
+        asserto([1]).is_empty()
+
+
+def test_is_not_empty_peeks_a_single_element() -> None:
+    consumed = []
+    asserto(counting(10**9, consumed)).is_not_empty()
+    asserto(consumed).is_equal_to([0])
+    with pytest.raises(AssertionError, match=re.escape("() was empty")):
+        asserto(()).is_not_empty()
+
+
+def test_has_length_streams_iterators() -> None:
+    asserto(x for x in range(5)).has_length(5)
+    consumed = []
+    with pytest.raises(AssertionError, match=r"Length of: <generator object .*> was not equal to: 3"):
+        asserto(counting(10**9, consumed)).has_length(3)
+    asserto(consumed).has_length(4)
+
+
+def test_has_length_validates_expected_for_iterators() -> None:
+    with pytest.raises(ValueError, match="-1 must be an int and greater than 0"):
+        asserto(iter([])).has_length(-1)
+
+
+def test_contains_stops_at_first_hit() -> None:
+    consumed = []
+    asserto(counting(10**9, consumed)).contains(2)
+    asserto(consumed).is_equal_to([0, 1, 2])
+    asserto({"a": 1}).contains("a")
+    asserto("hello").contains("ell")
+    with pytest.raises(AssertionError, match=re.escape("[1, 2] did not contain: 3")):
+        asserto([1, 2]).contains(3)
+
+
+def test_does_not_contain() -> None:
+    asserto(iter([1, 2])).does_not_contain(3)
+    consumed = []
+    with pytest.raises(AssertionError, match=r"<generator object .*> contained: 1"):
+        asserto(counting(10**9, consumed)).does_not_contain(1)
+    asserto(consumed).is_equal_to([0, 1])
+
+
+def test_ends_with_streams_generators() -> None:
+    asserto(x for x in range(100_000)).ends_with(99_999)
+    with pytest.raises(AssertionError, match=r"Expected `<generator object .*>` to end with suffix=1 but it did not\."):
+        asserto(x for x in range(3)).ends_with(1)
+
+
+def test_ends_with_empty_generator() -> None:
+    with pytest.raises(ValueError, match="must not be empty"):
+        asserto(x for x in ()).ends_with(1)
+
+
+@pytest.mark.parametrize("method", ("is_empty", "is_not_empty"))
+def test_non_iterables_are_unsupported(method) -> None:
+    expected = f"`IterableHandler` cannot accept type: <class 'int'> when calling: {method}"
+    with pytest.raises(UnsupportedHandlerTypeError, match=expected):
+        getattr(asserto(1), method)()
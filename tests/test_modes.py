@@ -0,0 +1,142 @@
+import asyncio
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+import pytest
+
+import asserto as asserto_package
+from asserto import Asserto
+from asserto import asserto
+from asserto import get_mode
+from asserto import register_assert
+from asserto import set_mode
+from asserto._modes import NOOP
+
+
+@pytest.fixture
+def mode():
+    original = get_mode()
+    yield set_mode
+    set_mode(original)
+
+
+def _chain(value: int) -> None:
+    asserto(value).is_positive().is_between(1, 10).is_equal_to(value).x_is(1).each()
+
+
+def test_full_mode_is_the_default() -> None:
+    asserto(get_mode()).is_equal_to("full")
+    asserto(asserto(1)).is_instance(Asserto)
+
+
+def test_off_mode_skips_every_chain(mode) -> None:
+    mode("off")
+    asserto(get_mode()).is_equal_to("off")
+    a = asserto(-1)
+    asserto(a).has_same_identity_as(NOOP)
+    set_mode("full")
+    asserto(a.is_positive().is_zero().foo_is(1).each().is_positive()).has_same_identity_as(NOOP)
+
+
+def test_off_mode_supports_every_api(mode) -> None:
+    mode("off")
+
+    async def main():
+        return await asserto(1).eventually_async().is_zero()
+
+    with asserto(1) as soft:
+        soft.is_zero()
+    asserto(asserto(lambda: 1).should_raise(ValueError).when_called_with(1)).is_none()
+    asserto(asyncio.run(main())).has_same_identity_as(NOOP)
+    asserto(asserto(1).deferred().is_zero().x_is(1).submit()).is_false()
+
+
+def test_off_mode_data_attributes_are_not_assertions(mode) -> None:
+    mode("off")
+    a = asserto([1]).described_as("items").rebind(2)
+    asserto((a.actual, a.category, a.description, a.render_limits, a.warn_unused)).is_equal_to(
+        (None, None, None, None, False)
+    )
+
+
+def test_off_mode_rejects_unknown_attributes(mode) -> None:
+    mode("off")
+    a = asserto(1)
+    for name in ("foo", "_actual", "submit"):
+        with pytest.raises(AttributeError, match=f"unknown assertion method: {name}"):
+            getattr(a, name)
+    with pytest.raises(AttributeError, match="unknown assertion method: foo"):
+        a.deferred().foo()
+
+
+def test_off_mode_skips_registered_assertions(mode) -> None:
+    @register_assert
+    def is_off_mode_test(self):
+        raise AssertionError("performed")
+
+    mode("off")
+    asserto(asserto(1).is_off_mode_test()).has_same_identity_as(NOOP)
+
+
+def test_sampled_mode(mode) -> None:
+    mode("sampled", rate=0.5)
+    asserto(get_mode()).is_equal_to("sampled:0.5")
+    performed = sum(asserto(i) is not NOOP for i in range(2000))
+    asserto(performed).is_between(800, 1200)
+
+
+@pytest.mark.parametrize("rate, expected", [(0.0, 0), (1.0, 100)])
+def test_sampled_mode_bounds(mode, rate, expected) -> None:
+    mode(f"sampled:{rate}")
+    asserto(sum(asserto(i) is not NOOP for i in range(100))).is_equal_to(expected)
+
+
+@pytest.mark.parametrize(
+    "args, match",
+    [
+        (("sampled",), "requires a rate between 0 and 1, not: None"),
+        (("sampled:2",), "requires a rate between 0 and 1, not: 2.0"),
+        (("sampled:x",), "invalid sampling rate"),
+        (("sampled:0.1", 0.1), "was given twice"),
+        (("nonsense",), "unknown assertion mode: 'nonsense'"),
+    ],
+)
+def test_invalid_modes(mode, args, match) -> None:
+    with pytest.raises(ValueError, match=match):
+        mode(*args)
+    asserto(get_mode()).is_equal_to("full")
+
+
+def test_mode_from_environment() -> None:
+    env = {**os.environ, "ASSERTO_MODE": "sampled:0.25"}
+    code = "import asserto; print(asserto.get_mode())"
+    process = subprocess.run((sys.executable, "-c", code), capture_output=True, text=True, check=True, env=env)
+    asserto(process.stdout.strip()).is_equal_to("sampled:0.25")
+
+
+def test_off_mode_allocates_nothing(mode) -> None:
+    mode("off")
+    retained = [None] * 1000
+    _chain(1)
+    tracemalloc.start()
+    try:
+        for index in range(len(retained)):
+            retained[index] = asserto(1).is_positive().is_between(1, 10).x_is(1).each()
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Every chain returned the shared instance, no memory is held by the 1000 chains retained.
+    asserto(allocated).is_lesser_than(1000)
+    asserto(all(chain is NOOP for chain in retained)).is_true()
+
+
+def test_off_mode_overhead_is_bounded(mode) -> None:
+    full = min(timeit.repeat(lambda: asserto(1).is_positive().is_equal_to(1), number=2000))
+    mode("off")
+    off = min(timeit.repeat(lambda: _chain(1), number=2000))
+    # A skipped chain (of 5 calls) must cost a fraction of performing 2 assertions.
+    asserto(off).is_lesser_than(full / 2)
+    asserto(asserto_package.get_mode()).is_equal_to("off")
@@ -0,0 +1,78 @@
+import pytest
+
+import asserto as asserto_package
+from asserto import asserto
+from asserto._parallel import _merge
+from asserto._plan import PlanReport
+
+
+def is_even(self):
+    if self.actual % 2:
+        self.error(f"{self.actual} is not even")
+
+
+def explodes(self):
+    raise RuntimeError("boom")
+
+
+def test_parallel_plan_merges_failures_in_input_order() -> None:
+    plan = asserto.plan().is_instance(int).is_lesser_than(900)
+    report = asserto.parallel(range(1000), plan, chunk_size=64, workers=2)
+    asserto(report.checked).is_equal_to(1000)
+    asserto(report.failed).is_equal_to(100)
+    asserto(report.counts).is_equal_to({"is_lesser_than(900)": 100})
+    asserto([index for index, _, _ in report.failures]).is_equal_to(list(range(900, 910)))
+
+
+def test_parallel_assertion_function() -> None:
+    report = asserto_package.parallel(iter(range(100)), is_even, chunk_size=7, workers=2, max_failures=3)
+    asserto(report.failed).is_equal_to(50)
+    asserto(report.counts).is_equal_to({"is_even": 50})
+    asserto([(index, value, str(error)) for index, value, error in report.failures]).is_equal_to(
+        [(1, 1, "1 is not even"), (3, 3, "3 is not even"), (5, 5, "5 is not even")]
+    )
+
+
+def _part(indices) -> PlanReport:
+    part = PlanReport(max_failures=3)
+    for index in indices:
+        part.record(index, index, "check", AssertionError(index))
+    part.checked = 10
+    return part
+
+
+def test_chunks_completing_out_of_order_are_merged_in_input_order() -> None:
+    report = None
+    for offset, indices in ((20, (1, 2, 3)), (10, (5, 9)), (30, (0,)), (0, (8,))):
+        report = _merge(report, _part(indices), offset)
+        asserto(len(report.failures)).is_lesser_than(4)
+    asserto([failure[0] for failure in report.failures]).is_equal_to([8, 15, 19])
+    asserto((report.checked, report.failed, report.counts)).is_equal_to((40, 7, {"check": 7}))
+
+
+def test_parallel_spec() -> None:
+    records = [{"id": i} for i in range(50)]
+    report = asserto.parallel(records, asserto.spec(id=asserto.plan().is_positive()), chunk_size=10, workers=2)
+    asserto(report.counts).is_equal_to({"id": 1})
+    asserto(report.failures[0][:2]).is_equal_to((0, "id"))
+
+
+def test_parallel_passes() -> None:
+    report = asserto.parallel([], is_even, workers=1)
+    asserto(report.ok).is_true()
+    asserto(report.checked).is_equal_to(0)
+
+
+def test_parallel_report_raises() -> None:
+    with pytest.raises(AssertionError, match="^1 of 3 values failed"):
+        asserto.parallel([2, 3, 4], is_even, workers=1).raise_if_failed()
+
+
+def test_parallel_propagates_errors() -> None:
+    with pytest.raises(RuntimeError, match="boom"):
+        asserto.parallel(range(10), explodes, chunk_size=2, workers=2)
+
+
+def test_parallel_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size=0 must be a positive integer."):
+        asserto.parallel([1], is_even, chunk_size=0)
@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+from asserto import asserto
+from asserto import pattern_cache_info
+from asserto import precompile
+from asserto._patterns import PatternCache
+
+
+def test_repeated_patterns_never_recompile() -> None:
+    precompile(r"^value-\d+$")
+    before = pattern_cache_info()
+    for i in range(100_000):
+        asserto(f"value-{i}").fullmatch(r"^value-\d+$")
+    after = pattern_cache_info()
+    asserto(after.misses).is_equal_to(before.misses)
+    asserto(after.hits - before.hits).is_equal_to(100_000)
+
+
+def test_should_raise_uses_the_cache() -> None:
+    def raiser():
+        raise ValueError("cached pattern")
+
+    precompile(r"cached \w+")
+    before = pattern_cache_info()
+    asserto(raiser).should_raise(ValueError, match=r"cached \w+").when_called_with()
+    asserto(pattern_cache_info().misses).is_equal_to(before.misses)
+
+
+def test_lru_eviction() -> None:
+    cache = PatternCache(maxsize=2)
+    cache.precompile("a", "b")
+    cache.compile("a")  # `b` is now the least recently used.
+    cache.compile("c")
+    cache.compile("a")
+    asserto(cache.info()).is_equal_to((2, 3, 2, 2))
+    cache.compile("b")
+    asserto(cache.info().misses).is_equal_to(4)
+
+
+def test_flags_are_part_of_the_key() -> None:
+    cache = PatternCache()
+    asserto(cache.compile("a", re.I).flags & re.I).is_truthy()
+    asserto(cache.compile("a").flags & re.I).is_falsy()
+    asserto(cache.info().misses).is_equal_to(2)
+
+
+def test_compiled_patterns_pass_through() -> None:
+    compiled = re.compile("a")
+    cache = PatternCache()
+    asserto(cache.compile(compiled)).has_same_identity_as(compiled)
+    with pytest.raises(ValueError, match="cannot process flags argument with a compiled pattern"):
+        cache.compile(compiled, re.I)
+
+
+def test_clear_resets_statistics() -> None:
+    cache = PatternCache()
+    cache.precompile("a", "a")
+    cache.clear()
+    asserto(cache.info()).is_equal_to((0, 0, 512, 0))
+
+
+def test_invalid_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize=0 must be at least 1."):
+        PatternCache(maxsize=0)
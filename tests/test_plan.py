@@ -0,0 +1,105 @@
+import collections
+
+import pytest
+
+import asserto as asserto_package
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+from asserto.handlers import BaseHandler
+from asserto.handlers import NumberHandler
+
+
+def test_plan_compiles_dispatched_steps() -> None:
+    plan = asserto.plan().is_instance(int).is_between(0, 10).is_not_zero()
+    steps = [(step.handler, step.method) for step in plan.steps]
+    asserto(steps).is_equal_to(
+        [(BaseHandler, "is_instance"), (NumberHandler, "is_between"), (NumberHandler, "is_not_zero")]
+    )
+
+
+def test_plan_is_available_from_the_package() -> None:
+    asserto(asserto_package.plan().is_zero().check(0).ok).is_true()
+
+
+def test_plan_check_many_aggregates_failures() -> None:
+    plan = asserto.plan().is_instance(int).is_between(0, 10).is_not_zero()
+    report = plan.check_many(iter([1, 0, "x", 5, 11, 0]))
+    asserto(report.checked).is_equal_to(6)
+    # 0 is never between 0 & 10 (exclusively), `is_not_zero` is not reached.
+    asserto(report.failed).is_equal_to(4)
+    asserto(report.counts).is_equal_to({"is_between(0, 10)": 3, "is_instance(<class 'int'>)": 1})
+    asserto([index for index, _, _ in report.failures]).is_equal_to([1, 2, 4, 5])
+
+
+def test_plan_report_max_failures() -> None:
+    report = asserto.plan().is_positive().check_many(range(-100, 0), max_failures=3)
+    asserto(report.failed).is_equal_to(100)
+    asserto(report.failures).has_length(3)
+
+
+def test_plan_report_raises() -> None:
+    report = asserto.plan().is_zero().check_many([0, 1])
+    with pytest.raises(AssertionError) as error:
+        report.raise_if_failed()
+    asserto(str(error.value)).is_equal_to(
+        "1 of 2 values failed\n"
+        "    is_zero(): 1\n"
+        "first 1 (index, value): failure\n"
+        "    (1, 1): Expected 1 to be 0 but it was not."
+    )
+
+
+def test_plan_report_passes() -> None:
+    report = asserto.plan().is_between_inclusive(0, 10).check_many(range(11))
+    asserto(report.ok).is_true()
+    report.raise_if_failed()
+
+
+def test_plan_agrees_with_fluent_api_messages() -> None:
+    with pytest.raises(AssertionError) as fluent:
+        asserto(5).is_greater_than(10)
+    _, _, error = asserto.plan().is_greater_than(10).check(5).failures[0]
+    asserto(str(error)).is_equal_to(str(fluent.value))
+
+
+def test_plan_mixin_and_dynamic_steps() -> None:
+    point = collections.namedtuple("point", "x y")
+    asserto(asserto.plan().starts_with("foo").is_alpha().check_many(["foobar", "foo1"]).failed).is_equal_to(1)
+    asserto(asserto.plan().x_is(1).check_many([point(1, 2), point(2, 2)]).failed).is_equal_to(1)
+
+
+def test_plan_handles_many_types() -> None:
+    report = asserto.plan().is_equal_to(1).check_many([1, 1.0, "1", True])
+    asserto(report.failed).is_equal_to(1)
+
+
+def test_plan_unsupported_type_raises() -> None:
+    with pytest.raises(UnsupportedHandlerTypeError):
+        asserto.plan().is_zero().check("foo")
+
+
+@pytest.mark.parametrize("name", ["each", "described_as", "should_raise", "nonsense"])
+def test_plan_rejects_non_assertions(name: str) -> None:
+    with pytest.raises(AttributeError, match=f"{name} cannot be used in a plan"):
+        getattr(asserto.plan(), name)("x")
+
+
+def _failure(chain) -> str:
+    with pytest.raises(AssertionError) as error:
+        chain()
+    return str(error.value)
+
+
+def test_plan_streams_iterators_as_the_fluent_api_does() -> None:
+    plan = asserto.plan().has_length(3)
+    asserto(plan.check_many([iter([1, 2, 3]), [1, 2, 3], (i for i in range(3))]).ok).is_true()
+    values = iter([1, 2])
+    _, _, error = plan.check(values).failures[0]
+    asserto(str(error)).is_equal_to(_failure(lambda: asserto(values).has_length(3)))
+
+
+@pytest.mark.parametrize("value", [b"abcdef", bytearray(b"abcdef"), memoryview(b"abcdef")])
+def test_plan_compares_bytes_as_the_fluent_api_does(value) -> None:
+    _, _, error = asserto.plan().is_equal_to(b"abcxef").check(value).failures[0]
+    asserto(str(error)).is_equal_to(_failure(lambda: asserto(value).is_equal_to(b"abcxef")))
+    asserto(str(error)).ends_with("first difference at index 3")
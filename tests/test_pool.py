@@ -0,0 +1,133 @@
+import contextlib
+import gc
+import sys
+import threading
+import tracemalloc
+import typing
+
+import pytest
+
+import asserto as asserto_package
+from asserto import Asserto
+from asserto import RenderLimits
+from asserto import asserto
+from asserto._pool import Pool
+
+
+def test_rebind_resets_per_value_state() -> None:
+    a = Asserto(1, render_limits=RenderLimits(maxstring=5)).set_category("c").described_as("d").is_positive()
+    asserto(a.rebind(-1, warn_unused=True)).has_same_identity_as(a)
+    asserto((a.actual, a._triggered, a.warn_unused, a.category, a.description, a.render_limits)).is_equal_to(
+        (-1, False, True, None, None, None)
+    )
+    with pytest.raises(AssertionError, match=r"^Expected -1 to be greater than 0, but it was not.$"):
+        a.is_positive()
+
+
+def test_rebind_keeps_handlers_for_values_of_the_same_type() -> None:
+    a = Asserto(1).is_positive()
+    handlers = a._handlers
+    a.rebind(2).is_equal_to(2)
+    asserto(a._handlers).has_same_identity_as(handlers)
+    with pytest.raises(AssertionError, match="Expected 2 to be 0 but it was not."):
+        a.is_zero()
+    a.rebind("foo").is_equal_to("foo").starts_with("f")
+    asserto(a._handlers).is_not_equal_to(handlers)
+
+
+def test_rebind_discards_soft_limits_and_is_refused_inside_a_soft_context() -> None:
+    a = Asserto(1).set_soft_limits(max_stored=1)
+    with a:
+        with pytest.raises(ValueError, match="cannot be rebound inside of its soft context"):
+            a.rebind(2)
+    asserto(a.rebind(2)._error_handler).is_none()
+
+
+def test_pool_reuses_instances_of_previous_scopes() -> None:
+    pool = asserto_package.pool()
+    with pool:
+        first = asserto(1).is_positive()
+        second = asserto(2).is_positive()
+    asserto(first).does_not_have_same_identity_as(second)
+    instances = set()
+    for value in range(1, 100):
+        with pool:
+            instance = asserto(value).is_positive()
+            instances.add(id(instance))
+            asserto(instance.actual).is_equal_to(value)
+    asserto(instances <= {id(first), id(second)}).is_true()
+    asserto(repr(pool)).is_equal_to("Pool(size=4, pooled=2)")
+    pool.clear()
+    asserto(repr(pool)).is_equal_to("Pool(size=4, pooled=0)")
+
+
+def test_held_instances_are_never_handed_out_again_in_their_scope() -> None:
+    with asserto_package.pool() as pool:
+        held = [asserto(value) for value in range(10)]
+        asserto(len({id(instance) for instance in held})).is_equal_to(10)
+        asserto([instance.actual for instance in held]).is_equal_to(list(range(10)))
+    asserto(repr(pool)).is_equal_to("Pool(size=4, pooled=4)")
+
+
+def test_failures_keep_their_instances() -> None:
+    pool = asserto_package.pool()
+    with pytest.raises(AssertionError) as error:
+        with pool:
+            asserto(1).is_zero()
+    with pool:
+        asserto(2).is_positive()
+    asserto(str(error.value)).is_equal_to("Expected 1 to be 0 but it was not.")
+    asserto(repr(pool)).is_equal_to("Pool(size=4, pooled=1)")
+
+
+def test_instances_left_in_a_soft_context_are_not_reused() -> None:
+    pool = asserto_package.pool()
+    with pool:
+        asserto(1).__enter__()
+    asserto(repr(pool)).is_equal_to("Pool(size=4, pooled=0)")
+
+
+def test_pools_nest_and_are_per_thread() -> None:
+    pools = []
+    with asserto_package.pool() as outer:
+        with asserto_package.pool(size=1) as inner:
+            asserto(inner(1)).is_instance(Asserto)
+            thread = threading.Thread(target=lambda: pools.append(getattr(asserto_package._pool.local, "pool", None)))
+            thread.start()
+            thread.join()
+        asserto(asserto_package._pool.local.pool).has_same_identity_as(outer)
+    asserto(asserto_package._pool.local.pool).is_none()
+    asserto(pools).is_equal_to([None])
+    asserto(repr(inner)).is_equal_to("Pool(size=1, pooled=1)")
+
+
+def _peak_per_chain(pool: typing.Optional[Pool] = None) -> float:
+    scope = pool if pool is not None else contextlib.nullcontext()
+    with scope:
+        asserto(0).is_zero()
+    gc.collect()
+    tracemalloc.start()
+    total = 0
+    try:
+        for value in range(1, 1000):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            with scope:
+                asserto(value).is_positive().is_between(0, 1000).is_equal_to(value)
+            total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return total / 999
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="tracemalloc.reset_peak() requires python 3.9")
+def test_pooled_chains_allocate_a_fraction() -> None:
+    # Only the bound methods of the chained calls (and the calls entering the scope) are allocated, no instances
+    # or handlers.
+    allocating = _peak_per_chain()
+    asserto(_peak_per_chain(Pool())).is_lesser_than(allocating / 2)
+
+
+def test_invalid_pool_size() -> None:
+    with pytest.raises(ValueError):
+        asserto_package.pool(size=0)
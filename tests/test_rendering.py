@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+
+from asserto import RenderLimits
+from asserto import asserto
+from asserto import get_render_limits
+from asserto import set_render_limits
+from asserto._rendering import FailureMessage
+
+
+class CountsRenders:
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def __str__(self) -> str:
+        self.renders += 1
+        return "rendered"
+
+
+@pytest.fixture
+def small_limits():
+    original = get_render_limits()
+    set_render_limits(RenderLimits(maxstring=20, maxitems=3, maxother=20))
+    yield
+    set_render_limits(original)
+
+
+def test_huge_string_is_truncated() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto("a" * 1_000_000).is_equal_to("b")
+    message = str(error.value)
+    asserto(len(message)).is_lesser_than(1100)
+    asserto(message).ends_with("is not equal to: b")
+
+
+def test_huge_list_is_truncated(small_limits) -> None:
+    with pytest.raises(AssertionError, match=r"^Length of: \[0, 1, 2, \.\.\.\] was not equal to: 5$"):
+        asserto(list(range(1_000_000))).has_length(5)
+
+
+def test_nested_depth_is_truncated() -> None:
+    nested = [[[[[[[[1]]]]]]]]
+    with pytest.raises(AssertionError, match=r"^\[\[\[\[\[\[\[\.\.\.\]\]\]\]\]\]\] was not falsy$"):
+        asserto(nested).is_falsy()
+
+
+def test_message_is_rendered_lazily() -> None:
+    value = CountsRenders()
+    with pytest.raises(AssertionError) as error:
+        asserto(value).is_none()
+    asserto(value.renders).is_zero()
+    asserto(str(error.value)).is_equal_to("rendered is not None")
+    asserto(value.renders).is_equal_to(1)
+
+
+def test_soft_failures_are_not_rendered_until_exit() -> None:
+    value = CountsRenders()
+    with pytest.raises(AssertionError, match="rendered is not None"):
+        with asserto(value) as soft:
+            soft.is_none()
+            asserto(value.renders).is_zero()
+
+
+def test_args_are_rendered_strings() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(1).is_equal_to(2)
+    asserto(error.value.args).is_equal_to(("1 is not equal to: 2",))
+    asserto(repr(error.value)).is_equal_to("AssertionError('1 is not equal to: 2')")
+
+
+def test_lazy_errors_pickle_as_rendered_messages() -> None:
+    with pytest.raises(AssertionError) as error:
+        asserto(1).is_equal_to(2)
+    restored = pickle.loads(pickle.dumps(error.value))
+    asserto(restored.args).is_equal_to(("1 is not equal to: 2",))
+
+
+def test_instance_limits_take_precedence(small_limits) -> None:
+    with pytest.raises(AssertionError, match=r"^a{48}\.\.\.a{49} was not False$"):
+        asserto("a" * 500).with_render_limits(RenderLimits(maxstring=100)).is_false()
+
+
+def test_global_limits_apply(small_limits) -> None:
+    with pytest.raises(AssertionError, match=r"^a{8}\.\.\.a{9} was not False$"):
+        asserto("a" * 500).is_false()
+
+
+def test_repr_is_bounded(small_limits) -> None:
+    asserto(repr(asserto("x" * 100))).is_equal_to(f"Asserto(value={'x' * 8}...{'x' * 9}, category=None)")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        (b"\x00" * 50, r"b'\x00\x00\x00\x00\x00\x00\x00\x00'...b'\x00\x00\x00\x00\x00\x00\x00\x00\x00'"),
+        (bytearray(b"ab"), "bytearray(b'ab')"),
+        ("a" * 50, "'aaaaaaaa'...'aaaaaaaaa'"),
+    ),
+)
+def test_bounded_reprs(value, expected) -> None:
+    asserto(RenderLimits(maxstring=20).repr(value)).is_equal_to(expected)
+
+
+def test_category_is_prefixed_lazily() -> None:
+    value = CountsRenders()
+    with pytest.raises(AssertionError, match=r"^\[cat\] rendered is not alphabetic\.$"):
+        asserto("1").set_category("cat").error(FailureMessage("{actual} is not alphabetic.", actual=value))
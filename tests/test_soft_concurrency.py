@@ -0,0 +1,152 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import re
+
+import pytest
+
+from asserto import asserto
+
+CHECKS = 5000
+WORKERS = 8
+
+
+def _failures(error: pytest.ExceptionInfo) -> list:
+    return re.findall(r"1 is not equal to: (\d+)", str(error.value))
+
+
+def test_thread_pool_failures_collect_into_the_context() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1) as soft:
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                list(pool.map(soft.is_equal_to, range(CHECKS)))
+    asserto(str(error.value)).starts_with(f"{CHECKS - 1} Soft Assertion Failures")
+    asserto(sorted(map(int, _failures(error)))).is_equal_to([i for i in range(CHECKS) if i != 1])
+
+
+def test_thread_pool_failures_are_reported_in_order() -> None:
+    # Each worker fails in its own ascending order; the merged report keeps the order they occurred in.
+    def check(chunk: range) -> None:
+        for i in chunk:
+            soft.is_equal_to(i)
+
+    with pytest.raises(AssertionError) as error:
+        with asserto(1) as soft:
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                list(pool.map(check, [range(n, CHECKS, WORKERS) for n in range(WORKERS)]))
+    for n in range(WORKERS):
+        per_worker = [int(i) for i in _failures(error) if int(i) % WORKERS == n]
+        asserto(per_worker).is_equal_to(sorted(per_worker))
+
+
+def test_nested_contexts_in_copied_contexts_merge_into_the_parent() -> None:
+    def check(i: int) -> None:
+        with soft:
+            soft.is_equal_to(i)
+
+    with pytest.raises(AssertionError) as error:
+        with asserto(1) as soft:
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                futures = [pool.submit(contextvars.copy_context().run, check, i) for i in range(CHECKS)]
+                concurrent.futures.wait(futures)
+            for future in futures:
+                asserto(future.exception()).is_none()
+    asserto(str(error.value)).starts_with(f"{CHECKS - 1} Soft Assertion Failures")
+
+
+def test_merged_contexts_respect_max_stored_of_the_parent() -> None:
+    def check(i: int) -> None:
+        with soft:
+            soft.is_equal_to(i)
+
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(max_stored=10) as soft:
+            soft.is_equal_to(0)
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                concurrent.futures.wait([pool.submit(contextvars.copy_context().run, check, i) for i in range(CHECKS)])
+    asserto(_failures(error)).has_length(10)
+    asserto(str(error.value)).starts_with(f"{CHECKS} Soft Assertion Failures").ends_with(
+        f"... {CHECKS - 10} further failures were not stored (max_stored=10)"
+    )
+
+
+def test_asyncio_gather_tasks_merge_into_the_parent() -> None:
+    async def check(soft, i: int) -> None:
+        with soft:
+            soft.is_equal_to(i)
+            await asyncio.sleep(0)
+            soft.is_not_equal_to(1)
+
+    async def main() -> None:
+        with asserto(1) as soft:
+            await asyncio.gather(*(check(soft, i) for i in range(CHECKS)))
+
+    with pytest.raises(AssertionError) as error:
+        asyncio.run(main())
+    asserto(str(error.value)).starts_with(f"{2 * CHECKS - 1} Soft Assertion Failures")
+    asserto(_failures(error)).has_length(CHECKS - 1)
+
+
+def test_asyncio_tasks_without_a_parent_are_isolated() -> None:
+    shared = asserto(1)
+
+    async def check(i: int) -> str:
+        try:
+            with shared:
+                shared.is_equal_to(i)
+                await asyncio.sleep(0)
+        except AssertionError as exc:
+            return str(exc)
+        return ""
+
+    async def main() -> list:
+        return await asyncio.gather(*(check(i) for i in range(100)))
+
+    results = asyncio.run(main())
+    asserto(results[1]).is_empty()
+    for i, result in enumerate(results):
+        if i != 1:
+            asserto(result).is_equal_to(f"1 Soft Assertion Failures\n[AssertionError('1 is not equal to: {i}')]")
+
+
+def test_concurrent_max_stored_is_exact() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(max_stored=10) as soft:
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                list(pool.map(lambda _: soft.is_zero(), range(CHECKS)))
+    asserto(str(error.value)).starts_with(f"{CHECKS} Soft Assertion Failures").ends_with(
+        f"... {CHECKS - 10} further failures were not stored (max_stored=10)"
+    )
+
+
+def test_concurrent_identical_failures_are_grouped() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(group_identical=True) as soft:
+            with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+                list(pool.map(lambda _: soft.is_zero(), range(CHECKS)))
+    asserto(str(error.value)).is_equal_to(
+        f"{CHECKS} Soft Assertion Failures\n[AssertionError('Expected 1 to be 0 but it was not.') (x{CHECKS})]"
+    )
+
+
+def test_concurrent_fail_after_raises_once() -> None:
+    raised = []
+
+    def check(_: int) -> None:
+        try:
+            soft.is_zero()
+        except AssertionError as exc:
+            raised.append(exc)
+
+    with asserto(1).set_soft_limits(fail_after=1000) as soft:
+        with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+            list(pool.map(check, range(1000)))
+    asserto(raised).has_length(1)
+    asserto(str(raised[0])).starts_with("1000 Soft Assertion Failures")
+
+
+def test_failures_outside_of_a_context_raise_in_the_worker() -> None:
+    with concurrent.futures.ThreadPoolExecutor(WORKERS) as pool:
+        future = pool.submit(asserto(1).is_equal_to, 2)
+    with pytest.raises(AssertionError, match="1 is not equal to: 2"):
+        future.result()
@@ -12,3 +12,54 @@ def test_multiple_soft_assertions() -> None:
     assert asserto(str(error.value.args[0])).match(
         ".*2 Soft Assertion Failures.*100 is not equal to: 99.*100 is not equal to: 101.*", re.S
     )
+
+
+def test_max_stored_counts_dropped_failures() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(max_stored=2) as soft:
+            for i in range(10):
+                soft.is_equal_to(i + 2)
+    message = str(error.value)
+    assert asserto(message).starts_with("10 Soft Assertion Failures")
+    assert asserto(message).ends_with("... 8 further failures were not stored (max_stored=2)")
+    assert asserto(message).does_not_contain("not equal to: 4")
+
+
+def test_fail_after_raises_early() -> None:
+    checks = 0
+    with pytest.raises(AssertionError, match="^3 Soft Assertion Failures"):
+        with asserto(1).set_soft_limits(fail_after=3) as soft:
+            for i in range(100):
+                checks += 1
+                soft.is_zero()
+    asserto(checks).is_equal_to(3)
+
+
+def test_identical_failures_are_grouped() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(group_identical=True) as soft:
+            for _ in range(1000):
+                soft.is_zero().is_negative()
+    expected = (
+        "2000 Soft Assertion Failures\n"
+        "[   AssertionError('Expected 1 to be 0 but it was not.') (x1000),\n"
+        "    AssertionError('Expected 1 to be lesser than 0, but it was not.') (x1000)]"
+    )
+    asserto(str(error.value)).is_equal_to(expected)
+
+
+def test_grouping_respects_max_stored() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1).set_soft_limits(max_stored=1, group_identical=True) as soft:
+            for i in range(5):
+                soft.is_zero().is_equal_to(i)
+    asserto(str(error.value)).contains("(x5)").ends_with("... 4 further failures were not stored (max_stored=1)")
+
+
+def test_single_soft_failure_format() -> None:
+    with pytest.raises(AssertionError) as error:
+        with asserto(1) as soft:
+            soft.is_zero()
+    asserto(str(error.value)).is_equal_to(
+        "1 Soft Assertion Failures\n[AssertionError('Expected 1 to be 0 but it was not.')]"
+    )
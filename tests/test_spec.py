@@ -0,0 +1,83 @@
+import collections
+from types import SimpleNamespace
+
+import pytest
+
+import asserto as asserto_package
+from asserto import asserto
+
+Row = collections.namedtuple("Row", "id name")
+
+
+def _spec():
+    return asserto.spec(
+        id=asserto.plan().is_instance(int).is_positive(),
+        name=asserto.plan().match(r"^[a-z]+$"),
+    )
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}],
+        [Row(1, "foo"), Row(2, "bar")],
+        [SimpleNamespace(id=1, name="foo"), SimpleNamespace(id=2, name="bar")],
+    ],
+)
+def test_spec_passes_records_of_any_shape(records) -> None:
+    report = _spec().check_many(records)
+    asserto(report.ok).is_true()
+    asserto(report.checked).is_equal_to(2)
+
+
+def test_spec_is_available_from_the_package() -> None:
+    asserto(asserto_package.spec(x=1).check({"x": 1}).ok).is_true()
+
+
+def test_spec_counts_failures_per_field() -> None:
+    records = iter([{"id": 1, "name": "foo"}, {"id": -1, "name": "Bar"}, {"id": "2", "name": "baz"}])
+    report = _spec().check_many(records)
+    asserto(report.checked).is_equal_to(3)
+    asserto(report.failed).is_equal_to(2)
+    asserto(report.counts).is_equal_to({"id": 2, "name": 1})
+    asserto([(index, field) for index, field, _ in report.failures]).is_equal_to([(1, "id"), (1, "name"), (2, "id")])
+
+
+def test_spec_plain_values_check_equality() -> None:
+    report = asserto.spec(active=True).check_many([{"active": True}, {"active": False}])
+    asserto(report.counts).is_equal_to({"active": 1})
+    asserto(str(report.failures[0][2])).is_equal_to("False is not equal to: True")
+
+
+def test_spec_missing_fields() -> None:
+    report = _spec().check_many([{"id": 1}, SimpleNamespace(name="foo")])
+    asserto(report.counts).is_equal_to({"name": 1, "id": 1})
+    asserto(str(report.failures[0][2])).is_equal_to("{'id': 1} missing key: name")
+    asserto(str(report.failures[1][2])).is_equal_to("namespace(name='foo') missing attribute: id")
+
+
+def test_spec_compiles_an_accessor_per_type() -> None:
+    spec = _spec()
+    spec.check_many([{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}, Row(3, "baz")])
+    asserto(set(spec._accessors)).is_equal_to({dict, Row})
+
+
+def test_spec_single_field() -> None:
+    report = asserto.spec(id=asserto.plan().is_positive()).check_many([Row(1, "a"), Row(-1, "b")])
+    asserto(report.counts).is_equal_to({"id": 1})
+
+
+def test_spec_report_raises() -> None:
+    with pytest.raises(AssertionError) as error:
+        _spec().check({"id": 0, "name": "foo"}).raise_if_failed()
+    asserto(str(error.value)).is_equal_to(
+        "1 of 1 records failed\n"
+        "    id: 1\n"
+        "first 1 (index, field): failure\n"
+        "    (0, id): Expected 0 to be greater than 0, but it was not."
+    )
+
+
+def test_spec_requires_fields() -> None:
+    with pytest.raises(ValueError, match="a spec requires at least one field"):
+        asserto.spec()
@@ -0,0 +1,153 @@
+import collections
+import re
+
+import pytest
+
+from asserto import Asserto
+from asserto import Profiler
+from asserto import UnsupportedHandlerTypeError
+from asserto import asserto
+from asserto._dispatch import ASSERTER_CACHE_SIZE
+from asserto._dispatch import _asserter_cache
+from asserto._dispatch import clear_dispatch_cache
+from asserto._specialized import BytesAsserto
+from asserto._specialized import CollectionAsserto
+from asserto._specialized import NumberAsserto
+from asserto._specialized import StrAsserto
+
+
+@pytest.mark.parametrize(
+    "value, family",
+    [
+        (1, NumberAsserto),
+        (1.5, NumberAsserto),
+        ("foo", StrAsserto),
+        (b"foo", BytesAsserto),
+        (bytearray(b"foo"), BytesAsserto),
+        (memoryview(b"foo"), BytesAsserto),
+        ({"a": 1}, CollectionAsserto),
+        (collections.OrderedDict(), CollectionAsserto),
+        ([1], CollectionAsserto),
+        ((1,), CollectionAsserto),
+        ({1}, CollectionAsserto),
+        (len, Asserto),
+        (True, Asserto),
+        (None, Asserto),
+        (iter([1]), Asserto),
+        (object(), Asserto),
+    ],
+)
+def test_asserters_are_chosen_per_type(value, family) -> None:
+    asserto(type(asserto(value))).has_same_identity_as(family)
+    asserto(type(asserto(value))).has_same_identity_as(family)
+
+
+def test_asserters_are_cached_for_a_bounded_number_of_types() -> None:
+    clear_dispatch_cache()
+    kinds = [type(f"Number{index}", (int,), {}) for index in range(ASSERTER_CACHE_SIZE + 10)]
+    try:
+        for kind in kinds:
+            asserto(kind(1)).is_positive()
+        asserto(_asserter_cache).has_length(ASSERTER_CACHE_SIZE)
+        a = asserto(kinds[-1](1))
+        asserto(a).is_instance(NumberAsserto)
+        with pytest.raises(AssertionError, match=r"^Expected 1 to be 0 but it was not.$"):
+            a.is_positive().is_zero()
+    finally:
+        clear_dispatch_cache()
+
+
+def _outcome(a: Asserto, method: str, args: tuple) -> tuple:
+    try:
+        getattr(a, method)(*args)
+    except Exception as exc:
+        return type(exc), str(exc)
+    return None, None
+
+
+@pytest.mark.parametrize(
+    "value, method, args",
+    [
+        (5, "is_positive", ()),
+        (-5, "is_positive", ()),
+        (0, "is_negative", ()),
+        (5, "is_between", (0, 10)),
+        (5, "is_between", (5, 10)),
+        (5, "is_between", (5, 10, True)),
+        (5, "is_not_between", (0, 10)),
+        (5.0, "is_greater_than", (5,)),
+        (5, "is_lesser_than", (1,)),
+        (0, "is_zero", ()),
+        (0, "is_not_zero", ()),
+        (1, "is_equal_to", (2,)),
+        (1, "is_not_equal_to", (1,)),
+        (1, "is_instance", (str,)),
+        (1, "is_none", ()),
+        (1, "is_true", ()),
+        (0, "is_falsy", ()),
+        (1, "has_same_identity_as", (2,)),
+        (1, "contains", (1,)),
+        ("foo", "match", ("f",)),
+        ("foo", "match", ("o",)),
+        ("foo", "search", ("x",)),
+        ("foo", "fullmatch", ("fo",)),
+        ("foo", "findall", ("o", 1)),
+        ("foo", "has_length", (2,)),
+        ("foo", "has_length", (-1,)),
+        ("foo", "contains", ("x",)),
+        ("foo", "is_empty", ()),
+        ("foo", "is_positive", ()),
+        ("foo", "is_equal_to", ("fo",)),
+        ("foo", "starts_with", ("x",)),
+        (b"foo", "contains", (b"o"[0],)),
+        (b"foo", "match", (b"f",)),
+        (b"foo", "starts_with", (b"x",)),
+        (b"foo", "ends_with", ("o",)),
+        (memoryview(b"foo"), "is_equal_to", (b"fo",)),
+        (bytearray(b"foo"), "has_slice", (0, 1, b"x")),
+        ({"a": 1}, "does_not_contain", ("a",)),
+        ({"a": 1}, "is_not_empty", ()),
+        ({"a": 1}, "a_is", (2,)),
+        ([1, 2], "has_length", (3,)),
+        ([1, 2], "is_equal_to", ([1, 3],)),
+        ((), "is_empty", ()),
+        (len, "is_none", ()),
+        (len, "is_zero", ()),
+    ],
+)
+def test_outcomes_are_identical_to_asserto(value, method, args) -> None:
+    asserto(_outcome(asserto(value), method, args)).is_equal_to(_outcome(Asserto(value), method, args))
+
+
+def test_descriptions_and_soft_contexts_are_honoured() -> None:
+    with pytest.raises(AssertionError, match=r"^must be positive$"):
+        asserto(-1).set_category("numbers").described_as("must be positive").is_positive()
+    with pytest.raises(AssertionError) as error:
+        with asserto(-1) as soft:
+            soft.is_positive().is_zero().is_equal_to(-1)
+    asserto(str(error.value)).contains("greater than 0").contains("to be 0")
+
+
+def test_values_of_another_type_take_the_generic_path() -> None:
+    a = asserto(1)
+    asserto(a).is_instance(NumberAsserto)
+    a.rebind("foo").is_equal_to("foo").has_length(3)
+    with pytest.raises(UnsupportedHandlerTypeError):
+        a.is_positive()
+    asserto(b"foo").rebind("foo").starts_with("f").ends_with("o").is_equal_to("foo")
+
+
+def test_handlers_are_created_once_per_chain() -> None:
+    a = asserto(5).is_positive().is_between(0, 10)
+    asserto(list(a._handlers)).has_length(1)
+
+
+def test_profiled_assertions_are_measured() -> None:
+    with Profiler() as profiler:
+        asserto(5).is_positive().is_equal_to(5)
+    asserto(profiler.stats()).contains("NumberHandler.is_positive").contains("BaseHandler.is_equal_to")
+
+
+def test_specialized_assertions_are_documented() -> None:
+    asserto(StrAsserto.match.__doc__).is_equal_to(Asserto.match.__doc__)
+    asserto(re.search(r"greater than 0", NumberAsserto.is_positive.__doc__)).is_not_none()
@@ -1,8 +1,11 @@
+import itertools
 from collections import namedtuple
 
 from asserto import asserto
+from asserto._util import count_up_to
 from asserto._util import is_iterable
 from asserto._util import is_namedtuple_like
+from asserto._util import last
 from asserto._util import to_iterable
 
 
@@ -43,3 +46,15 @@ def test_is_iterable() -> None:
     asserto(is_iterable("foo")).is_true()
     asserto(is_iterable((1, 2, 3))).is_true()
     asserto(is_iterable(OldSchool())).is_true()
+
+
+def test_last() -> None:
+    asserto(last([1, 2, 3])).is_equal_to(3)
+    asserto(last(x for x in range(3))).is_equal_to(2)
+    asserto(last([], default=5)).is_equal_to(5)
+    asserto(last(iter(()))).is_none()
+
+
+def test_count_up_to() -> None:
+    asserto(count_up_to(range(3), 10)).is_equal_to(3)
+    asserto(count_up_to(itertools.count(), 10)).is_equal_to(11)